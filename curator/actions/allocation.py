@@ -6,7 +6,7 @@ import logging
 from curator.debug import debug, begin_end
 from curator.exceptions import MissingArgument
 from curator.helpers.testers import verify_index_list
-from curator.helpers.waiters import wait_for_it
+from curator.helpers.waiters import PendingTasksPacer, wait_for_it
 from curator.helpers.utils import chunk_index_list, report_failure, show_dry_run, to_csv
 
 logger = logging.getLogger(__name__)
@@ -24,6 +24,7 @@ class Allocation:
         wait_for_completion=False,
         wait_interval=3,
         max_wait=-1,
+        max_pending_tasks=0,
     ):
         """
         :param ilo: An IndexList Object
@@ -35,6 +36,8 @@ class Allocation:
         :param wait_for_completion: Wait for completion before returning.
         :param wait_interval: Seconds to wait between completion checks.
         :param max_wait: Maximum number of seconds to ``wait_for_completion``
+        :param max_pending_tasks: Back off while there are at least this many
+            pending cluster tasks. ``0`` disables pacing.
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
         :type key: str
@@ -43,6 +46,7 @@ class Allocation:
         :type wait_for_completion: bool
         :type wait_interval: int
         :type max_wait: int
+        :type max_pending_tasks: int
 
         .. note::
             See more about `shard allocation filtering
@@ -72,6 +76,9 @@ class Allocation:
         self.wait_interval = wait_interval
         #: Object attribute that gets the value of param ``max_wait``
         self.max_wait = max_wait
+        #: Paces the requests by the pending cluster task queue. See
+        #: :py:class:`~.curator.helpers.waiters.PendingTasksPacer`
+        self.pacer = PendingTasksPacer(self.client, max_pending_tasks)
 
     def do_dry_run(self):
         """Log what the output would be, but take no action."""
@@ -98,6 +105,7 @@ class Allocation:
         try:
             index_lists = chunk_index_list(self.index_list.indices)
             for lst in index_lists:
+                self.pacer.wait()
                 self.client.indices.put_settings(
                     index=to_csv(lst), settings=self.settings
                 )
@@ -6,6 +6,7 @@ from elasticsearch8.exceptions import ElasticsearchWarning
 from curator.debug import begin_end, debug
 from curator.helpers.testers import verify_index_list
 from curator.helpers.utils import chunk_index_list, report_failure, show_dry_run, to_csv
+from curator.helpers.waiters import PendingTasksPacer
 
 logger = logging.getLogger(__name__)
 
@@ -13,15 +14,20 @@ logger = logging.getLogger(__name__)
 class Close:
     """Close Action Class"""
 
-    def __init__(self, ilo, delete_aliases=False, skip_flush=False):
+    def __init__(
+        self, ilo, delete_aliases=False, skip_flush=False, max_pending_tasks=0
+    ):
         """
         :param ilo: An IndexList Object
         :param delete_aliases: Delete any associated aliases before closing indices.
         :param skip_flush: Do not flush indices before closing.
+        :param max_pending_tasks: Back off while there are at least this many
+            pending cluster tasks. ``0`` disables pacing.
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
         :type delete_aliases: bool
         :type skip_flush: bool
+        :type max_pending_tasks: int
         """
         verify_index_list(ilo)
         #: The :py:class:`~.curator.indexlist.IndexList` object passed from
@@ -34,6 +40,9 @@ class Close:
         #: The :py:class:`~.elasticsearch.Elasticsearch` client object derived from
         #: :py:attr:`index_list`
         self.client = ilo.client
+        #: Paces the requests by the pending cluster task queue. See
+        #: :py:class:`~.curator.helpers.waiters.PendingTasksPacer`
+        self.pacer = PendingTasksPacer(self.client, max_pending_tasks)
 
     def do_dry_run(self):
         """Log what the output would be, but take no action."""
@@ -63,6 +72,7 @@ class Close:
                     debug.lv1('Deleting aliases from indices before closing.')
                     debug.lv3('Deleting aliases from:  %s', lst)
                     try:
+                        self.pacer.wait()
                         self.client.indices.delete_alias(index=lst_as_csv, name='*')
                         debug.lv3('Deleted aliases from: %s', lst)
                     # pylint: disable=broad-except
@@ -81,6 +91,7 @@ class Close:
                 # future default behaviour, or
                 # 'wait_for_active_shards=0' to preserve today's behaviour
                 warnings.filterwarnings("ignore", category=ElasticsearchWarning)
+                self.pacer.wait()
                 self.client.indices.close(index=lst_as_csv, ignore_unavailable=True)
         # pylint: disable=broad-except
         except Exception as err:
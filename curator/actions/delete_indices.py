@@ -1,12 +1,14 @@
 """Delete index action class"""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # pylint: disable=import-error
 from curator.debug import begin_end, debug
-from curator.helpers.getters import get_indices
+from curator.helpers.getters import get_existing_indices
 from curator.helpers.testers import verify_index_list
 from curator.helpers.utils import chunk_index_list, report_failure, show_dry_run, to_csv
+from curator.helpers.waiters import PendingTasksPacer
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +16,21 @@ logger = logging.getLogger(__name__)
 class DeleteIndices:
     """Delete Indices Action Class"""
 
-    def __init__(self, ilo, master_timeout=30):
+    def __init__(
+        self, ilo, master_timeout=30, max_concurrent_requests=1, max_pending_tasks=0
+    ):
         """
         :param ilo: An IndexList Object
         :param master_timeout: Number of seconds to wait for master node response
+        :param max_concurrent_requests: Number of chunks of indices to delete, and
+            verify, at the same time
+        :param max_pending_tasks: Back off while there are at least this many
+            pending cluster tasks. ``0`` disables pacing.
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
         :type master_timeout: int
+        :type max_concurrent_requests: int
+        :type max_pending_tasks: int
         """
         verify_index_list(ilo)
         if not isinstance(master_timeout, int):
@@ -37,6 +47,16 @@ class DeleteIndices:
         #: String value of param ``master_timeout`` + ``s``, for seconds.
         self.master_timeout = str(master_timeout) + 's'
         debug.lv5('master_timeout value: %s', self.master_timeout)
+        if not isinstance(max_concurrent_requests, int) or max_concurrent_requests < 1:
+            raise TypeError(
+                f'Incorrect value for "max_concurrent_requests": '
+                f'{max_concurrent_requests}. Should be a positive integer.'
+            )
+        #: The value of param ``max_concurrent_requests``
+        self.max_concurrent_requests = max_concurrent_requests
+        #: Paces the requests by the pending cluster task queue. See
+        #: :py:class:`~.curator.helpers.waiters.PendingTasksPacer`
+        self.pacer = PendingTasksPacer(self.client, max_pending_tasks)
 
     def _verify_result(self, result, count):
         """
@@ -69,22 +89,27 @@ class DeleteIndices:
         :param chunk_list: A list of indices pre-chunked so it won't overload
             the URL size limit.
         :type chunk_list: list
+
+        :returns: The indices in ``chunk_list`` that still exist after 3 attempts
+        :rtype: list
         """
         working_list = chunk_list
         result = ''
         for count in range(1, 4):  # Try 3 times
             for i in working_list:
                 debug.lv1("---deleting index %s", i)
+            self.pacer.wait()
             self.client.indices.delete(
                 index=to_csv(working_list), master_timeout=self.master_timeout
             )
-            result = [i for i in working_list if i in get_indices(self.client)]
+            result = get_existing_indices(self.client, working_list)
             if self._verify_result(result, count):
-                return
+                return []
             working_list = result
         logger.error(
             'Unable to delete the following indices after 3 attempts: %s', result
         )
+        return result
 
     def do_dry_run(self):
         """Log what the output would be, but take no action."""
@@ -102,15 +127,21 @@ class DeleteIndices:
             f'{self.index_list.indices}'
         )
         debug.lv1(msg)
+        failed = []
         try:
             index_lists = chunk_index_list(self.index_list.indices)
-            for lst in index_lists:
-                self.__chunk_loop(lst)
+            workers = min(len(index_lists), self.max_concurrent_requests)
+            if workers == 1:
+                for lst in index_lists:
+                    failed += self.__chunk_loop(lst)
+            else:
+                debug.lv1('Deleting %s chunks, %s at a time', len(index_lists), workers)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for result in pool.map(self.__chunk_loop, index_lists):
+                        failed += result
         # pylint: disable=broad-except
         except Exception as err:
             report_failure(err)
-        logger.info(
-            'Deleted %s indices: %s',
-            len(self.index_list.indices),
-            self.index_list.indices,
-        )
+        failed = set(failed)
+        deleted = [idx for idx in self.index_list.indices if idx not in failed]
+        logger.info('Deleted %s indices: %s', len(deleted), deleted)
@@ -1,32 +1,179 @@
 """Forcemerge action class"""
 
+import json
 import logging
-from time import sleep
+import os
+import warnings
+from collections import Counter
+from time import gmtime, monotonic, sleep, strftime
+from elasticsearch8.exceptions import GeneralAvailabilityWarning, NotFoundError
 
 # pylint: disable=import-error
 from curator.debug import debug, begin_end
-from curator.exceptions import MissingArgument
+from curator.exceptions import ConfigurationError, FailedExecution, MissingArgument
+from curator.helpers.getters import (
+    byte_size,
+    get_forcemerge_tasks,
+    get_index_uuids,
+    get_shard_nodes,
+)
 from curator.helpers.testers import verify_index_list
-from curator.helpers.utils import report_failure, show_dry_run
+from curator.helpers.utils import report_failure, show_dry_run, write_cache_file
 
 logger = logging.getLogger(__name__)
 
 
+class MergeJournal:
+    """
+    Local journal of the forceMerges sent by :py:class:`ForceMerge`, kept as a JSON
+    file at ``path``. Each index is recorded with its UUID and the merge ``goal``
+    when its forceMerge is sent, with the task id if it runs in the background, and
+    again when it completes.
+
+    A later run skips the indices recorded as merged to the same goal, with the same
+    UUID, without fetching their segments again.
+
+    :param path: The path to the journal file
+    :param goal: What the forceMerges do, such as ``max_num_segments=1``
+
+    :type path: str
+    :type goal: str
+    """
+
+    def __init__(self, path, goal):
+        #: Object attribute that gets the value of param ``path``
+        self.path = path
+        #: Object attribute that gets the value of param ``goal``
+        self.goal = goal
+        #: ``{index: {'uuid': uuid, 'goal': goal, 'task': id, 'merged': time}}``
+        self.record = self.load()
+
+    def load(self):
+        """
+        :returns: The journal file contents, or an empty :py:class:`dict` if there
+            is no usable journal
+        :rtype: dict
+        """
+        if not os.path.isfile(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as journal_file:
+                data = json.load(journal_file)
+            if not isinstance(data, dict):
+                raise TypeError('not a JSON object')
+        except (OSError, ValueError, TypeError) as err:
+            logger.warning('Ignoring unreadable merge journal %s: %s', self.path, err)
+            return {}
+        return data
+
+    def save(self):
+        """Write :py:attr:`record` to the journal file"""
+        write_cache_file(self.path, self.record)
+
+    def _matches(self, index, uuid):
+        entry = self.record.get(index, {})
+        return entry.get('uuid') == uuid and entry.get('goal') == self.goal
+
+    def merged(self, uuids):
+        """
+        :param uuids: The current UUID of each index, keyed by index name
+        :type uuids: dict
+
+        :returns: The indices in ``uuids`` recorded as merged to :py:attr:`goal`
+        :rtype: list
+        """
+        return [
+            idx
+            for idx, uuid in uuids.items()
+            if self._matches(idx, uuid) and 'merged' in self.record[idx]
+        ]
+
+    def unfinished(self, uuids):
+        """
+        :param uuids: The current UUID of each index, keyed by index name
+        :type uuids: dict
+
+        :returns: The task id of each index in ``uuids`` with a background
+            forceMerge to :py:attr:`goal` recorded as sent, but not as completed
+        :rtype: dict
+        """
+        return {
+            idx: self.record[idx]['task']
+            for idx, uuid in uuids.items()
+            if self._matches(idx, uuid)
+            and 'merged' not in self.record[idx]
+            and self.record[idx].get('task')
+        }
+
+    def started(self, index, uuid, task_id=None):
+        """
+        Record that a forceMerge of ``index`` was sent, as ``task_id`` if it runs
+        in the background, and save the journal.
+        """
+        self.record[index] = {
+            'uuid': uuid,
+            'goal': self.goal,
+            'started': strftime('%Y-%m-%dT%H:%M:%SZ', gmtime()),
+            'task': task_id,
+        }
+        self.save()
+
+    def finished(self, index, uuid, size=0):
+        """
+        Record that the forceMerge of ``index``, of ``size`` bytes, has completed,
+        and save the journal.
+        """
+        entry = self.record.setdefault(index, {})
+        entry.update({'uuid': uuid, 'goal': self.goal, 'bytes': size})
+        entry['merged'] = strftime('%Y-%m-%dT%H:%M:%SZ', gmtime())
+        self.save()
+
+    def forget(self, index):
+        """Drop ``index`` from the journal, so it is merged again"""
+        self.record.pop(index, None)
+
+
 class ForceMerge:
     """ForceMerge Action Class"""
 
-    def __init__(self, ilo, max_num_segments=None, delay=0):
+    def __init__(
+        self,
+        ilo,
+        max_num_segments=None,
+        delay=0,
+        max_merges_per_node=0,
+        wait_interval=9,
+        only_expunge_deletes=False,
+        merge_journal=None,
+    ):
         """
         :param ilo: An IndexList Object
         :param max_num_segments: Number of segments per shard to forceMerge
         :param delay: Number of seconds to delay between forceMerge operations
+        :param max_merges_per_node: Run forceMerges in the background, with at most
+            this many at a time on any one node. ``0`` merges one index at a time.
+        :param wait_interval: Seconds to wait between checks on background
+            forceMerges
+        :param only_expunge_deletes: Only merge away segments with deleted
+            documents, instead of merging to ``max_num_segments``
+        :param merge_journal: The path to a :py:class:`MergeJournal` file, to skip
+            the indices merged by earlier runs
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
         :type max_num_segments: int
         :type delay: int
+        :type max_merges_per_node: int
+        :type wait_interval: int
+        :type only_expunge_deletes: bool
+        :type merge_journal: str
         """
         verify_index_list(ilo)
-        if not max_num_segments:
+        if only_expunge_deletes:
+            if max_num_segments:
+                raise ConfigurationError(
+                    '"max_num_segments" cannot be used with "only_expunge_deletes"'
+                )
+        elif not max_num_segments:
             raise MissingArgument('Missing value for "max_num_segments"')
         #: The :py:class:`~.curator.indexlist.IndexList` object passed from
         #: param ``ilo``
@@ -38,6 +185,46 @@ class ForceMerge:
         self.max_num_segments = max_num_segments
         #: Object attribute that gets the value of param ``delay``.
         self.delay = delay
+        #: Object attribute that gets the value of param ``max_merges_per_node``.
+        self.max_merges_per_node = max_merges_per_node
+        #: Object attribute that gets the value of param ``wait_interval``.
+        self.wait_interval = wait_interval
+        #: Object attribute that gets the value of param ``only_expunge_deletes``.
+        self.only_expunge_deletes = only_expunge_deletes
+        #: The arguments that say how far to merge, for each forceMerge request
+        self.merge_args = (
+            {'only_expunge_deletes': True}
+            if only_expunge_deletes
+            else {'max_num_segments': max_num_segments}
+        )
+        #: What each forceMerge does, for log messages
+        self.goal = (
+            'expunge deleted documents'
+            if only_expunge_deletes
+            else f'{max_num_segments} segments per shard'
+        )
+        #: The :py:class:`MergeJournal` kept at param ``merge_journal``, if any
+        self.journal = None
+        if merge_journal:
+            goal = (
+                'only_expunge_deletes'
+                if only_expunge_deletes
+                else f'max_num_segments={max_num_segments}'
+            )
+            self.journal = MergeJournal(merge_journal, goal)
+        #: Whether to look up the index sizes. Only :py:attr:`journal` and
+        #: :py:attr:`max_merges_per_node` need them.
+        self.tracked = bool(self.journal or max_merges_per_node)
+        #: The task id of each index already being forceMerged, from
+        #: :py:func:`~.curator.helpers.getters.get_forcemerge_tasks`. Populated by
+        #: :py:meth:`resume`.
+        self.in_flight = {}
+        #: The UUID of each index, for :py:attr:`journal`. Populated by
+        #: :py:meth:`resume`.
+        self.uuids = {}
+        #: The number of indices to merge and merged so far, the bytes merged so
+        #: far, and the start time, for :py:meth:`log_progress`
+        self.progress = {'total': 0, 'indices': 0, 'bytes': 0, 'start': monotonic()}
 
     def do_dry_run(self):
         """Log what the output would be, but take no action."""
@@ -46,8 +233,179 @@ class ForceMerge:
             'forcemerge',
             max_num_segments=self.max_num_segments,
             delay=self.delay,
+            max_merges_per_node=self.max_merges_per_node,
+            only_expunge_deletes=self.only_expunge_deletes,
         )
 
+    @begin_end()
+    def resume(self):
+        """
+        Remove from :py:attr:`index_list` the indices that already have a
+        forceMerge task running, and keep them in :py:attr:`in_flight`, so that no
+        index is merged twice at once.
+
+        If there is a :py:attr:`journal`, also remove the indices it records as
+        merged to the same goal, with the same UUID. Background forceMerges that
+        it records as sent but not completed, and that are no longer running, are
+        looked up by task id. Those which completed are recorded as merged and
+        removed too, and the rest are merged again. The segments of the removed
+        indices are never fetched.
+        """
+        self.in_flight = {
+            idx: task_id
+            for idx, task_id in get_forcemerge_tasks(self.client).items()
+            if idx in self.index_list.indices
+        }
+        for index_name, task_id in self.in_flight.items():
+            logger.info(
+                'Index %s is already being forceMerged by task %s',
+                index_name,
+                task_id,
+            )
+        skip = set(self.in_flight)
+        if self.journal:
+            self.uuids = get_index_uuids(self.client, self.index_list.indices)
+            for index_name, task_id in self.journal.unfinished(self.uuids).items():
+                if index_name in skip:
+                    continue
+                try:
+                    completed, error = self.merge_state(task_id)
+                except NotFoundError:
+                    completed, error = False, None
+                if completed and not error:
+                    self.journal.finished(index_name, self.uuids[index_name])
+                else:
+                    self.journal.forget(index_name)
+            merged = self.journal.merged(self.uuids)
+            debug.lv1('Already merged to %s: %s', self.goal, merged)
+            skip.update(merged)
+        if skip:
+            logger.info('Skipping %s indices already merged or merging', len(skip))
+            self.index_list.indices = [
+                idx for idx in self.index_list.indices if idx not in skip
+            ]
+
+    def merge_started(self, index_name, task_id=None):
+        """Record in :py:attr:`journal`, if any, that ``index_name`` was sent"""
+        if self.journal:
+            self.journal.started(index_name, self.uuids.get(index_name), task_id)
+
+    def merge_finished(self, index_name):
+        """
+        Record in :py:attr:`journal`, if any, that ``index_name`` is merged, and
+        log the progress with :py:meth:`log_progress`
+        """
+        size = self.index_list.index_info.get(index_name, {}).get('size_in_bytes', 0)
+        if self.journal:
+            self.journal.finished(index_name, self.uuids.get(index_name), size)
+        self.log_progress(size)
+
+    def log_progress(self, size):
+        """
+        Count one more index of ``size`` bytes as merged in :py:attr:`progress`,
+        and log the indices merged so far, and per hour. The bytes are only logged
+        if :py:attr:`tracked`, as the index sizes are not fetched otherwise.
+
+        :param size: The size of the index merged, in bytes
+        :type size: int
+        """
+        self.progress['indices'] += 1
+        self.progress['bytes'] += size
+        done = self.progress['indices']
+        msg = f'forceMerged {done} of {self.progress["total"]} indices'
+        if self.tracked:
+            msg += f', {byte_size(self.progress["bytes"])} so far'
+        hours = (monotonic() - self.progress['start']) / 3600
+        if hours > 0:
+            msg += f', {done / hours:.1f} indices'
+            if self.tracked:
+                msg += f' and {byte_size(self.progress["bytes"] / hours)}'
+            msg += ' per hour'
+        logger.info(msg)
+
+    def merge_state(self, task_id):
+        """
+        Calls `client.tasks.` :py:meth:`~.elasticsearch.client.TasksClient.get` for
+        the background forceMerge task ``task_id``.
+
+        :param task_id: The task id returned by the forceMerge request
+
+        :type task_id: str
+
+        :returns: Whether the task has completed, and the error it failed with, if
+            any
+        :rtype: tuple
+        """
+        warnings.filterwarnings("ignore", category=GeneralAvailabilityWarning)
+        task_data = self.client.tasks.get(task_id=task_id)
+        return task_data.get('completed', False), task_data.get('error')
+
+    @begin_end()
+    def merge_by_node(self):
+        """
+        Send a :py:meth:`~.elasticsearch.client.IndicesClient.forcemerge` with
+        ``wait_for_completion=False`` for each index in :py:attr:`index_list`, so
+        that it runs as a background task.
+
+        An index is only sent while every node holding one of its shards has fewer
+        than :py:attr:`max_merges_per_node` merges running, as found with
+        :py:func:`~.curator.helpers.getters.get_shard_nodes`. Indices on busy nodes
+        wait, while indices on other nodes go ahead. The tasks are checked every
+        :py:attr:`wait_interval` seconds, and more indices are sent as they finish.
+        The forceMerges already running, in :py:attr:`in_flight`, count against
+        their nodes too, and are waited for in the same way.
+        """
+        shard_nodes = get_shard_nodes(
+            self.client, self.index_list.indices + list(self.in_flight)
+        )
+        pending = list(self.index_list.indices)
+        running = {task_id: idx for idx, task_id in self.in_flight.items()}
+        merging = Counter()
+        for index_name in running.values():
+            merging.update(shard_nodes[index_name])
+        failed = []
+        while pending or running:
+            for index_name in list(pending):
+                nodes = shard_nodes[index_name]
+                if any(merging[node] >= self.max_merges_per_node for node in nodes):
+                    continue
+                debug.lv1(
+                    'forceMerging index %s to %s on nodes %s',
+                    index_name,
+                    self.goal,
+                    sorted(nodes),
+                )
+                resp = self.client.indices.forcemerge(
+                    index=index_name, wait_for_completion=False, **self.merge_args
+                )
+                running[resp['task']] = index_name
+                self.merge_started(index_name, resp['task'])
+                merging.update(nodes)
+                pending.remove(index_name)
+                if self.delay > 0:
+                    debug.lv1('Pausing for %s seconds before continuing...', self.delay)
+                    sleep(self.delay)
+            debug.lv3('%s merges running, %s waiting', len(running), len(pending))
+            sleep(self.wait_interval)
+            for task_id, index_name in list(running.items()):
+                try:
+                    completed, error = self.merge_state(task_id)
+                except NotFoundError:
+                    # A task that stored no result, and is no longer running
+                    completed, error = True, None
+                if not completed:
+                    continue
+                if error:
+                    logger.error('Failed to forceMerge index %s: %s', index_name, error)
+                    failed.append(index_name)
+                else:
+                    logger.info('Successfully forceMerged index %s', index_name)
+                    self.merge_finished(index_name)
+                del running[task_id]
+                merging.subtract(shard_nodes[index_name])
+        if failed:
+            raise FailedExecution(f'Failed to forceMerge indices: {failed}')
+
     @begin_end()
     def do_action(self):
         """
@@ -55,24 +413,38 @@ class ForceMerge:
         :py:attr:`index_list`
         """
         self.index_list.filter_closed()
-        self.index_list.filter_forceMerged(max_num_segments=self.max_num_segments)
+        try:
+            self.resume()
+        # pylint: disable=broad-except
+        except Exception as err:
+            report_failure(err)
+        if not self.only_expunge_deletes:
+            self.index_list.filter_forceMerged(max_num_segments=self.max_num_segments)
         self.index_list.empty_list_check()
+        if self.tracked:
+            # Index sizes, for the progress log
+            self.index_list.get_index_stats()
         msg = (
             f'forceMerging {len(self.index_list.indices)} '
             f'selected indices: {self.index_list.indices}'
         )
         debug.lv1(msg)
+        self.progress['total'] = len(self.index_list.indices)
+        if self.max_merges_per_node:
+            self.progress['total'] += len(self.in_flight)
+        self.progress['start'] = monotonic()
         try:
+            if self.max_merges_per_node:
+                self.merge_by_node()
+                return
             for index_name in self.index_list.indices:
-                msg = (
-                    f'forceMerging index {index_name} to {self.max_num_segments} '
-                    f'segments per shard. Please wait...'
-                )
-                debug.lv1(msg)
-                self.client.indices.forcemerge(
-                    index=index_name, max_num_segments=self.max_num_segments
+                debug.lv1(
+                    'forceMerging index %s to %s. Please wait...', index_name, self.goal
                 )
+                self.merge_started(index_name)
+                self.client.indices.forcemerge(index=index_name, **self.merge_args)
                 logger.info('Successfully forceMerged index %s', index_name)
+                self.merge_finished(index_name)
                 if self.delay > 0:
                     debug.lv1('Pausing for %s seconds before continuing...', self.delay)
                     sleep(self.delay)
@@ -7,6 +7,7 @@ from curator.debug import debug, begin_end
 from curator.exceptions import ActionError, ConfigurationError, MissingArgument
 from curator.helpers.testers import verify_index_list
 from curator.helpers.utils import chunk_index_list, report_failure, show_dry_run, to_csv
+from curator.helpers.waiters import PendingTasksPacer
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ class IndexSettings:
         index_settings=None,
         ignore_unavailable=False,
         preserve_existing=False,
+        max_pending_tasks=0,
     ):
         """
         :param ilo: An IndexList Object
@@ -30,11 +32,14 @@ class IndexSettings:
         :param preserve_existing: Whether to update existing settings. If set to
             ``True``, existing settings on an index remain unchanged. The default
             is ``False``
+        :param max_pending_tasks: Back off while there are at least this many
+            pending cluster tasks. ``0`` disables pacing.
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
         :type index_settings: dict
         :type ignore_unavailable: bool
         :type preserve_existing: bool
+        :type max_pending_tasks: int
         """
         if index_settings is None:
             index_settings = {}
@@ -53,6 +58,9 @@ class IndexSettings:
         self.ignore_unavailable = ignore_unavailable
         #: Object attribute that gets the value of param ``preserve_existing``.
         self.preserve_existing = preserve_existing
+        #: Paces the requests by the pending cluster task queue. See
+        #: :py:class:`~.curator.helpers.waiters.PendingTasksPacer`
+        self.pacer = PendingTasksPacer(self.client, max_pending_tasks)
 
         self._body_check()
 
@@ -145,6 +153,7 @@ class IndexSettings:
         try:
             index_lists = chunk_index_list(self.index_list.indices)
             for lst in index_lists:
+                self.pacer.wait()
                 response = self.client.indices.put_settings(
                     index=to_csv(lst),
                     body=self.body,
@@ -4,6 +4,7 @@ import logging
 from curator.debug import debug, begin_end
 from curator.helpers.testers import verify_index_list
 from curator.helpers.utils import chunk_index_list, report_failure, show_dry_run, to_csv
+from curator.helpers.waiters import PendingTasksPacer
 
 
 logger = logging.getLogger(__name__)
@@ -12,11 +13,14 @@ logger = logging.getLogger(__name__)
 class Open:
     """Open Action Class"""
 
-    def __init__(self, ilo):
+    def __init__(self, ilo, max_pending_tasks=0):
         """
         :param ilo: An IndexList Object
+        :param max_pending_tasks: Back off while there are at least this many
+            pending cluster tasks. ``0`` disables pacing.
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
+        :type max_pending_tasks: int
         """
         verify_index_list(ilo)
         #: The :py:class:`~.curator.indexlist.IndexList` object passed from
@@ -25,6 +29,9 @@ class Open:
         #: The :py:class:`~.elasticsearch.Elasticsearch` client object derived from
         #: :py:attr:`index_list`
         self.client = ilo.client
+        #: Paces the requests by the pending cluster task queue. See
+        #: :py:class:`~.curator.helpers.waiters.PendingTasksPacer`
+        self.pacer = PendingTasksPacer(self.client, max_pending_tasks)
 
     def do_dry_run(self):
         """Log what the output would be, but take no action."""
@@ -45,6 +52,7 @@ class Open:
         try:
             index_lists = chunk_index_list(self.index_list.indices)
             for lst in index_lists:
+                self.pacer.wait()
                 self.client.indices.open(index=to_csv(lst))
             logger.info('Opened %s indices.', len(self.index_list.indices))
         # pylint: disable=broad-except
@@ -5,7 +5,7 @@ from curator.debug import begin_end, debug
 from curator.exceptions import MissingArgument
 from curator.helpers.testers import verify_index_list
 from curator.helpers.utils import chunk_index_list, report_failure, show_dry_run, to_csv
-from curator.helpers.waiters import wait_for_it
+from curator.helpers.waiters import PendingTasksPacer, wait_for_it
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +14,13 @@ class Replicas:
     """Replica Action Class"""
 
     def __init__(
-        self, ilo, count=None, wait_for_completion=False, wait_interval=9, max_wait=-1
+        self,
+        ilo,
+        count=None,
+        wait_for_completion=False,
+        wait_interval=9,
+        max_wait=-1,
+        max_pending_tasks=0,
     ):
         """
         :param ilo: An IndexList Object
@@ -22,12 +28,15 @@ class Replicas:
         :param wait_for_completion: Wait for completion before returning.
         :param wait_interval: Seconds to wait between completion checks.
         :param max_wait: Maximum number of seconds to ``wait_for_completion``
+        :param max_pending_tasks: Back off while there are at least this many
+            pending cluster tasks. ``0`` disables pacing.
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
         :type count: int
         :type wait_for_completion: bool
         :type wait_interval: int
         :type max_wait: int
+        :type max_pending_tasks: int
         """
         verify_index_list(ilo)
         # It's okay for count to be zero
@@ -50,6 +59,9 @@ class Replicas:
         self.wait_interval = wait_interval
         #: Object attribute that gets the value of param ``max_wait``.
         self.max_wait = max_wait
+        #: Paces the requests by the pending cluster task queue. See
+        #: :py:class:`~.curator.helpers.waiters.PendingTasksPacer`
+        self.pacer = PendingTasksPacer(self.client, max_pending_tasks)
 
     def do_dry_run(self):
         """Log what the output would be, but take no action."""
@@ -76,6 +88,7 @@ class Replicas:
         try:
             index_lists = chunk_index_list(self.index_list.indices)
             for lst in index_lists:
+                self.pacer.wait()
                 self.client.indices.put_settings(
                     index=to_csv(lst), settings={'number_of_replicas': self.count}
                 )
@@ -2,9 +2,24 @@
 
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from elasticsearch8.exceptions import ApiError, NotFoundError, TransportError
 from es_client.helpers.utils import ensure_list
-from curator.helpers.date_ops import parse_datemath, parse_date_pattern
-from curator.helpers.getters import get_indices
+from curator.helpers.date_ops import (
+    absolute_date_range,
+    get_name_epoch,
+    parse_datemath,
+    parse_date_pattern,
+    timestring_unit,
+)
+from curator.helpers.getters import (
+    get_existing_indices,
+    get_max_seq_nos,
+    get_snapshot_index_sizes,
+    get_snapshot_state,
+    get_snapshot_states,
+)
 from curator.helpers.testers import (
     repository_exists,
     snapshot_running,
@@ -12,16 +27,26 @@ from curator.helpers.testers import (
     verify_repository,
     verify_snapshot_list,
 )
-from curator.helpers.utils import report_failure, to_csv, multitarget_match
+from curator.helpers.utils import (
+    batch_by_size,
+    chunk_index_list,
+    partition_by_size,
+    report_failure,
+    to_csv,
+    multitarget_match,
+)
 from curator.helpers.waiters import wait_for_it
+from curator.snapshotlist import MAX_CONCURRENT_REPOSITORIES, SnapshotIndexRecord
 
 # pylint: disable=broad-except
 from curator.exceptions import (
     ActionError,
     CuratorException,
+    FailedExecution,
     FailedRestore,
     FailedSnapshot,
     MissingArgument,
+    NoIndices,
     SnapshotInProgress,
 )
 
@@ -45,6 +70,9 @@ class Snapshot(object):
         wait_interval=9,
         max_wait=-1,
         skip_repo_fs_check=True,
+        partitions=1,
+        skip_unchanged=False,
+        snapshot_cache_dir=None,
     ):
         """
         :param ilo: An IndexList Object
@@ -60,6 +88,14 @@ class Snapshot(object):
             all cluster nodes before proceeding. Useful for shared filesystems
             where intermittent timeouts can affect validation, but won't likely
             affect snapshot success. (Default: ``True``)
+        :param partitions: Split the indices into this many snapshots of about the
+            same primary store size, created at the same time. (Default: ``1``)
+        :param skip_unchanged: Leave out indices that have had no writes since
+            they were last in a successful snapshot in ``repository``, as
+            recorded in a :py:class:`~.curator.snapshotlist.SnapshotIndexRecord`
+            in ``snapshot_cache_dir``. (Default: ``False``)
+        :param snapshot_cache_dir: The directory for the index record. Required
+            with ``skip_unchanged``.
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
         :type repository: str
@@ -71,6 +107,9 @@ class Snapshot(object):
         :type wait_interval: int
         :type max_wait: int
         :type skip_repo_fs_check: bool
+        :type partitions: int
+        :type skip_unchanged: bool
+        :type snapshot_cache_dir: str
         """
         verify_index_list(ilo)
         # Check here and don't bother with the rest of this if there are no
@@ -82,6 +121,11 @@ class Snapshot(object):
             )
         if not name:
             raise MissingArgument('No value for "name" provided.')
+        if skip_unchanged and not snapshot_cache_dir:
+            raise MissingArgument(
+                'A "snapshot_cache_dir" must be provided with "skip_unchanged".'
+            )
+        self.loggit = logging.getLogger('curator.actions.snapshot')
         #: The :py:class:`~.curator.indexlist.IndexList` object passed from param
         #: ``ilo``
         self.index_list = ilo
@@ -101,11 +145,24 @@ class Snapshot(object):
         self.max_wait = max_wait
         #: Object attribute that gets the value of param ``skip_repo_fs_check``.
         self.skip_repo_fs_check = skip_repo_fs_check
-        #: Object attribute that tracks the snapshot state.
+        #: Object attribute that tracks the snapshot state. With more than one
+        #: snapshot, the first state that is not ``SUCCESS``, if any.
         self.state = None
+        #: The state of each snapshot in :py:attr:`snapshots`, by name
+        self.states = {}
+        #: Object attribute that gets the value of param ``partitions``.
+        self.partitions = max(1, partitions)
+        #: The :py:class:`~.curator.snapshotlist.SnapshotIndexRecord` used with
+        #: ``skip_unchanged``, otherwise ``None``
+        self.record = None
+        #: The sequence numbers of the indices to snapshot, with ``skip_unchanged``
+        self.seq_nos = {}
+        indices = ilo.indices
+        if skip_unchanged:
+            indices = self.get_changed(snapshot_cache_dir)
         #: Object attribute that contains the :py:func:`~.curator.helpers.utils.to_csv`
-        #: output of the indices in :py:attr:`index_list`.
-        self.indices = to_csv(ilo.indices)
+        #: output of the indices to snapshot.
+        self.indices = to_csv(indices)
         #: Object attribute that gets the value of param ``ignore_unavailable``.
         self.ignore_unavailable = ignore_unavailable
         #: Object attribute that gets the value of param ``include_global_state``.
@@ -116,83 +173,201 @@ class Snapshot(object):
         #: :py:attr:`ignore_unavailable`, :py:attr:`include_global_state`, and
         #: :py:attr:`partial`
         self.settings = {
-            'indices': ilo.indices,
+            'indices': indices,
             'ignore_unavailable': self.ignore_unavailable,
             'include_global_state': self.include_global_state,
             'partial': self.partial,
         }
+        #: The indices of each snapshot to create, by snapshot name, from
+        #: :py:meth:`get_partitions`
+        self.snapshots = self.get_partitions()
 
-        self.loggit = logging.getLogger('curator.actions.snapshot')
+    def get_changed(self, cache_dir):
+        """
+        Compare the sequence numbers of the indices in :py:attr:`index_list` with
+        the :py:class:`~.curator.snapshotlist.SnapshotIndexRecord` in
+        ``cache_dir``, and set :py:attr:`record` and :py:attr:`seq_nos`.
+
+        :param cache_dir: The directory of the index record
+        :type cache_dir: str
+
+        :returns: The indices that changed since they were last snapshotted, or
+            were never snapshotted
+        :rtype: list
+        """
+        self.record = SnapshotIndexRecord(self.client, self.repository, cache_dir)
+        seq_nos = get_max_seq_nos(self.client, self.index_list.indices)
+        unchanged = set(self.record.get_unchanged(seq_nos))
+        for idx in sorted(unchanged):
+            self.loggit.info(
+                'Skipping index %s, unchanged since snapshot %s',
+                idx,
+                self.record.record[idx]['snapshot'],
+            )
+        changed = [idx for idx in self.index_list.indices if idx not in unchanged]
+        self.seq_nos = {idx: seq_nos[idx] for idx in changed if idx in seq_nos}
+        return changed
+
+    def get_partitions(self):
+        """
+        Split the indices to snapshot into :py:attr:`partitions` groups of about
+        the same primary store size. Each group gets its own snapshot, named
+        :py:attr:`name` followed by ``-1``, ``-2``, and so on. With one partition,
+        there is one snapshot, named :py:attr:`name`.
+
+        :returns: The indices of each snapshot, by snapshot name. Empty if there
+            are no indices to snapshot.
+        :rtype: dict
+        """
+        indices = self.settings['indices']
+        if not indices:
+            return {}
+        if self.partitions == 1:
+            return {self.name: indices}
+        self.index_list.get_index_stats()
+        sizes = {
+            idx: self.index_list.index_info[idx].get('primary_size_in_bytes', 0)
+            for idx in indices
+        }
+        groups = partition_by_size(sizes, self.partitions)
+        return {
+            f'{self.name}-{num}': group for num, group in enumerate(groups, start=1)
+        }
+
+    def _snapshot_settings(self, snapshot):
+        """
+        :returns: :py:attr:`settings` for ``snapshot``, with only its indices.
+            With more than one snapshot, only the first includes the global state.
+        :rtype: dict
+        """
+        first = next(iter(self.snapshots))
+        return {
+            **self.settings,
+            'indices': self.snapshots[snapshot],
+            'include_global_state': self.include_global_state and snapshot == first,
+        }
 
     def get_state(self):
-        """Get the state of the snapshot and set :py:attr:`state`"""
-        try:
-            self.state = self.client.snapshot.get(
-                repository=self.repository, snapshot=self.name
-            )['snapshots'][0]['state']
-            return self.state
-        except IndexError as exc:
-            raise CuratorException(
-                f'Snapshot "{self.name}" not found in repository "{self.repository}"'
-            ) from exc
+        """
+        Get the state of each snapshot in :py:attr:`snapshots` and set
+        :py:attr:`states` and :py:attr:`state`, using
+        :py:func:`~.curator.helpers.getters.get_snapshot_state`, or
+        :py:func:`~.curator.helpers.getters.get_snapshot_states` for more than one
+        snapshot
+        """
+        names = list(self.snapshots)
+        if len(names) == 1:
+            self.states = {
+                names[0]: get_snapshot_state(
+                    self.client, repository=self.repository, snapshot=names[0]
+                )
+            }
+        else:
+            self.states = get_snapshot_states(
+                self.client, repository=self.repository, snapshots=names
+            )
+        for name in names:
+            if self.states.get(name) is None:
+                raise CuratorException(
+                    f'Snapshot "{name}" not found in repository "{self.repository}"'
+                )
+        self.state = next(
+            (self.states[name] for name in names if self.states[name] != 'SUCCESS'),
+            'SUCCESS',
+        )
+        return self.state
 
     def report_state(self):
         """
-        Log the :py:attr:`state` of the snapshot and raise :py:exc:`FailedSnapshot` if
-        :py:attr:`state` is not ``SUCCESS``
+        Log the :py:attr:`states` of the snapshots and raise
+        :py:exc:`FailedSnapshot` if any is not ``SUCCESS``
         """
         self.get_state()
-        if self.state == 'SUCCESS':
-            self.loggit.info('Snapshot %s successfully completed.', self.name)
-        else:
-            msg = f'Snapshot {self.name} completed with state: {self.state}'
+        failed = []
+        for name, state in self.states.items():
+            if state == 'SUCCESS':
+                self.loggit.info('Snapshot %s successfully completed.', name)
+            else:
+                failed.append(f'Snapshot {name} completed with state: {state}')
+        self.record_snapshots()
+        if failed:
+            msg = ' '.join(failed)
             self.loggit.error(msg)
             raise FailedSnapshot(msg)
 
+    def record_snapshots(self):
+        """
+        With ``skip_unchanged``, save each snapshot in :py:attr:`states` with state
+        ``SUCCESS`` to :py:attr:`record`, as the last snapshot of its indices.
+        """
+        if self.record is None:
+            return
+        for name, indices in self.snapshots.items():
+            if self.states.get(name) == 'SUCCESS':
+                self.record.update(
+                    name,
+                    {idx: self.seq_nos[idx] for idx in indices if idx in self.seq_nos},
+                )
+        self.record.save()
+
     def do_dry_run(self):
         """Log what the output would be, but take no action."""
         self.loggit.info('DRY-RUN MODE.  No changes will be made.')
-        msg = (
-            f'DRY-RUN: snapshot: {self.name} in repository {self.repository} '
-            f'with arguments: {self.settings}'
-        )
-        self.loggit.info(msg)
+        if not self.snapshots:
+            self.loggit.info('DRY-RUN: No indices changed. No snapshot to take.')
+        for snapshot in self.snapshots:
+            msg = (
+                f'DRY-RUN: snapshot: {snapshot} in repository {self.repository} '
+                f'with arguments: {self._snapshot_settings(snapshot)}'
+            )
+            self.loggit.info(msg)
 
     def do_action(self):
         """
         :py:meth:`elasticsearch.client.SnapshotClient.create` a snapshot of
-        :py:attr:`indices`, with passed parameters.
+        :py:attr:`indices`, with passed parameters. With more than one partition,
+        create all of the snapshots in :py:attr:`snapshots` before waiting, so
+        that they run concurrently, and wait for all of them together.
         """
+        if not self.snapshots:
+            self.loggit.info(
+                'No indices changed since their last snapshot. No snapshot taken.'
+            )
+            return
         if not self.skip_repo_fs_check:
             verify_repository(self.client, self.repository)
         if snapshot_running(self.client):
             raise SnapshotInProgress('Snapshot already in progress.')
         try:
-            self.loggit.info(
-                'Creating snapshot "%s" from indices: %s',
-                self.name,
-                self.index_list.indices,
-            )
-            # Always set wait_for_completion to False. Let 'wait_for_it' do its
-            # thing if wait_for_completion is set to True. Report the task_id
-            # either way.
-            self.client.snapshot.create(
-                repository=self.repository,
-                snapshot=self.name,
-                ignore_unavailable=self.ignore_unavailable,
-                include_global_state=self.include_global_state,
-                indices=self.indices,
-                partial=self.partial,
-                wait_for_completion=False,
-            )
+            for snapshot in self.snapshots:
+                settings = self._snapshot_settings(snapshot)
+                self.loggit.info(
+                    'Creating snapshot "%s" from indices: %s',
+                    snapshot,
+                    settings['indices'],
+                )
+                # Always set wait_for_completion to False. Let 'wait_for_it' do its
+                # thing if wait_for_completion is set to True. Report the task_id
+                # either way.
+                self.client.snapshot.create(
+                    repository=self.repository,
+                    snapshot=snapshot,
+                    ignore_unavailable=self.ignore_unavailable,
+                    include_global_state=settings['include_global_state'],
+                    indices=to_csv(settings['indices']),
+                    partial=self.partial,
+                    wait_for_completion=False,
+                )
             if self.wait_for_completion:
+                names = list(self.snapshots)
                 wait_for_it(
                     self.client,
                     'snapshot',
-                    snapshot=self.name,
+                    snapshot=names[0] if len(names) == 1 else names,
                     repository=self.repository,
                     wait_interval=self.wait_interval,
                     max_wait=self.max_wait,
+                    progress=True,
                 )
                 self.report_state()
             else:
@@ -201,6 +376,11 @@ class Snapshot(object):
                     f'Remember to check for successful completion manually.'
                 )
                 self.loggit.warning(msg)
+                if self.record is not None:
+                    self.loggit.warning(
+                        'The index record is only updated when waiting for '
+                        'completion, so these indices will be snapshotted again.'
+                    )
         except Exception as err:
             report_failure(err)
 
@@ -208,7 +388,7 @@ class Snapshot(object):
 class DeleteSnapshots:
     """Delete Snapshots Action Class"""
 
-    def __init__(self, slo, retry_interval=120, retry_count=3):
+    def __init__(self, slo, retry_interval=120, retry_count=3, batch_size=25):
         """
         :param slo: A SnapshotList object
         :type slo: :py:class:`~.curator.snapshotlist.SnapshotList`
@@ -216,6 +396,9 @@ class DeleteSnapshots:
         :type retry_interval: int
         :param retry_count: Number of attempts to make. (Default: ``3``)
         :type retry_count: int
+        :param batch_size: Maximum number of snapshots to delete per request.
+            (Default: ``25``)
+        :type batch_size: int
         """
         verify_snapshot_list(slo)
         #: The :py:class:`~.curator.snapshotlist.SnapshotList` object passed from param
@@ -228,28 +411,189 @@ class DeleteSnapshots:
         self.retry_interval = retry_interval
         #: Object attribute that gets the value of param ``retry_count``.
         self.retry_count = retry_count
+        #: Object attribute that gets the value of param ``batch_size``.
+        self.batch_size = max(1, batch_size)
         #: Object attribute that gets its value from :py:attr:`snapshot_list`.
+        #: ``None`` if :py:attr:`snapshot_list` has more than one repository.
         self.repository = slo.repository
+        #: The outcome of :py:meth:`do_action` for each snapshot: ``None`` if it was
+        #: deleted, or else the error that prevented it.
+        self.results = {}
         self.loggit = logging.getLogger('curator.actions.delete_snapshots')
 
-    def do_dry_run(self):
-        """Log what the output would be, but take no action."""
-        self.loggit.info('DRY-RUN MODE.  No changes will be made.')
-        mykwargs = {
-            'repository': self.repository,
-            'retry_interval': self.retry_interval,
-            'retry_count': self.retry_count,
-        }
+    def _get_repositories(self):
+        """
+        Group the snapshots in :py:attr:`snapshot_list` by repository.
+
+        :returns: The names of the snapshots to delete, per repository, as a
+            :py:class:`dict` of ``{repository: {name: snapshot}}``, where
+            ``snapshot`` is the entry in :py:attr:`snapshot_list`
+        :rtype: dict
+        """
+        repositories = {}
         for snap in self.snapshot_list.snapshots:
+            info = self.snapshot_list.snapshot_info[snap]
+            repositories.setdefault(info.repository, {})[info.snapshot] = snap
+        return repositories
+
+    def _get_batches(self, names):
+        """
+        Split ``names`` into batches of at most :py:attr:`batch_size` snapshots,
+        which are also small enough for the comma-separated names to fit in a
+        request URL.
+
+        :param names: The names of snapshots in one repository
+        :type names: list
+
+        :returns: A list of lists of snapshot names
+        :rtype: list
+        """
+        batches = []
+        for chunk in chunk_index_list(list(names)):
+            for idx in range(0, len(chunk), self.batch_size):
+                batches.append(chunk[idx : idx + self.batch_size])
+        return batches
+
+    def _delete_batch(self, repository, batch):
+        """
+        :py:meth:`~.elasticsearch.client.SnapshotClient.delete` all snapshots in
+        ``batch`` with one request. Retry transient errors, as found with
+        :py:meth:`_transient`, up to :py:attr:`retry_count` times, pausing
+        :py:attr:`retry_interval` seconds between retries. Other errors are not
+        retried. A single snapshot which is not found is already deleted.
+
+        :param repository: The repository of the snapshots in ``batch``
+        :param batch: A list of snapshot names
+
+        :type repository: str
+        :type batch: list
+
+        :returns: ``None`` on success, or else the error from the last attempt
+        """
+        error = None
+        for attempt in range(1, self.retry_count + 2):
+            try:
+                self.client.snapshot.delete(
+                    repository=repository, snapshot=to_csv(batch)
+                )
+                return None
+            except NotFoundError as err:
+                if len(batch) == 1:
+                    self.loggit.info(
+                        'Snapshot %s is already deleted from repository %s',
+                        batch[0],
+                        repository,
+                    )
+                    return None
+                # The rest of the batch is deleted one at a time
+                self.loggit.warning(
+                    'Unable to delete %s from repository %s: %s',
+                    to_csv(batch),
+                    repository,
+                    err,
+                )
+                return err
+            except (ApiError, TransportError) as err:
+                error = err
+                self.loggit.warning(
+                    'Attempt %s of %s to delete %s from repository %s failed: %s',
+                    attempt,
+                    self.retry_count + 1,
+                    to_csv(batch),
+                    repository,
+                    err,
+                )
+                if not self._transient(err):
+                    break
+                if attempt <= self.retry_count:
+                    time.sleep(self.retry_interval)
+        return error
+
+    @staticmethod
+    def _transient(err):
+        """
+        :param err: An error raised by
+            :py:meth:`~.elasticsearch.client.SnapshotClient.delete`
+
+        :type err: :py:exc:`~.elasticsearch.TransportError` or
+            :py:exc:`~.elasticsearch.ApiError`
+
+        :returns: ``True`` if ``err`` may go away on a retry: a connection error,
+            a snapshot operation in progress, ``429 Too Many Requests``, or any
+            ``5xx`` status. Otherwise ``False``.
+        :rtype: bool
+        """
+        if not isinstance(err, ApiError):
+            return True
+        if err.error in (
+            'concurrent_snapshot_execution_exception',
+            'snapshot_in_progress_exception',
+        ):
+            return True
+        return err.meta.status == 429 or err.meta.status >= 500
+
+    def _delete_from_repository(self, repository, snapshots):
+        """
+        Delete ``snapshots`` from ``repository`` in batches. If a batch still fails
+        after its retries, delete its snapshots one at a time, so that only the
+        snapshots that cannot be deleted are reported as failed.
+
+        :param repository: The repository to delete snapshots from
+        :param snapshots: The snapshots to delete, as returned per repository by
+            :py:meth:`_get_repositories`
+
+        :type repository: str
+        :type snapshots: dict
+
+        :returns: The outcome for each snapshot, as for :py:attr:`results`
+        :rtype: dict
+        """
+        results = {}
+        for batch in self._get_batches(snapshots):
             self.loggit.info(
-                'DRY-RUN: delete_snapshot: %s with arguments: %s', snap, mykwargs
+                'Deleting snapshots %s from repository %s...', to_csv(batch), repository
             )
+            error = self._delete_batch(repository, batch)
+            if error is not None and len(batch) > 1:
+                self.loggit.warning(
+                    'Unable to delete snapshots as a batch. Deleting them one '
+                    'at a time.'
+                )
+                for name in batch:
+                    results[snapshots[name]] = self._delete_batch(repository, [name])
+            else:
+                for name in batch:
+                    results[snapshots[name]] = error
+        return results
+
+    def do_dry_run(self):
+        """Log what the output would be, but take no action."""
+        self.loggit.info('DRY-RUN MODE.  No changes will be made.')
+        for repository, snapshots in self._get_repositories().items():
+            mykwargs = {
+                'repository': repository,
+                'retry_interval': self.retry_interval,
+                'retry_count': self.retry_count,
+            }
+            for batch in self._get_batches(snapshots):
+                for snap in batch:
+                    self.loggit.info(
+                        'DRY-RUN: delete_snapshot: %s with arguments: %s',
+                        snap,
+                        mykwargs,
+                    )
 
     def do_action(self):
         """
         :py:meth:`~.elasticsearch.client.SnapshotClient.delete` snapshots in
-        :py:attr:`snapshot_list`. Retry up to :py:attr:`retry_count` times, pausing
-        :py:attr:`retry_interval` seconds between retries.
+        :py:attr:`snapshot_list`, up to :py:attr:`batch_size` per request. Retry
+        each batch up to :py:attr:`retry_count` times, pausing
+        :py:attr:`retry_interval` seconds between retries. If a batch still fails,
+        delete its snapshots one at a time, so that only the snapshots that cannot
+        be deleted are reported in :py:attr:`results` as failed.
+
+        Snapshots in different repositories are deleted concurrently, one thread
+        per repository.
         """
         self.snapshot_list.empty_list_check()
         msg = (
@@ -257,13 +601,37 @@ class DeleteSnapshots:
             f'selected snapshots: {self.snapshot_list.snapshots}'
         )
         self.loggit.info(msg)
+        repositories = self._get_repositories()
         try:
-            for snap in self.snapshot_list.snapshots:
-                self.loggit.info('Deleting snapshot %s...', snap)
-                self.client.snapshot.delete(repository=self.repository, snapshot=snap)
+            if len(repositories) == 1:
+                for repository, snapshots in repositories.items():
+                    self.results.update(
+                        self._delete_from_repository(repository, snapshots)
+                    )
+            else:
+                workers = min(len(repositories), MAX_CONCURRENT_REPOSITORIES)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for result in pool.map(
+                        self._delete_from_repository,
+                        repositories.keys(),
+                        repositories.values(),
+                    ):
+                        self.results.update(result)
         # pylint: disable=broad-except
         except Exception as err:
             report_failure(err)
+        failed = {snap: err for snap, err in self.results.items() if err is not None}
+        self.loggit.info(
+            'Deleted %s snapshots. Failed to delete %s snapshots.',
+            len(self.results) - len(failed),
+            len(failed),
+        )
+        for snap, err in failed.items():
+            self.loggit.error('Unable to delete snapshot %s: %s', snap, err)
+        if failed:
+            raise FailedExecution(
+                f'Unable to delete {len(failed)} snapshot(s): {to_csv(list(failed))}'
+            )
 
 
 class Restore(object):
@@ -289,6 +657,11 @@ class Restore(object):
         wait_interval=9,
         max_wait=-1,
         skip_repo_fs_check=True,
+        max_wave_indices=0,
+        max_wave_gb=0,
+        timestring=None,
+        date_from=None,
+        date_to=None,
     ):
         """
         :param slo: A SnapshotList object
@@ -313,6 +686,17 @@ class Restore(object):
             all cluster nodes before proceeding. Useful for shared filesystems
             where intermittent timeouts can affect validation, but won't likely
             affect snapshot success. (Default: ``True``)
+        :param max_wave_indices: Restore at most this many indices at a time. Each
+            wave starts after the previous one has finished recovering. (Default:
+            ``0``, no limit)
+        :param max_wave_gb: Restore at most this many gigabytes of snapshotted data
+            at a time. (Default: ``0``, no limit)
+        :param timestring: An ``strftime`` pattern matching the dates in the names
+            of the indices in the snapshot, e.g. ``%Y.%m.%d.%H``
+        :param date_from: Only restore indices dated from this time on, in
+            ``timestring`` format
+        :param date_to: Only restore indices dated up to the end of this time, in
+            ``timestring`` format
 
         :type slo: :py:class:`~.curator.snapshotlist.SnapshotList`
         :type name: str
@@ -328,11 +712,20 @@ class Restore(object):
         :type wait_interval: int
         :type max_wait: int
         :type skip_repo_fs_check: bool
+        :type max_wave_indices: int
+        :type max_wave_gb: float
+        :type timestring: str
+        :type date_from: str
+        :type date_to: str
         """
         if extra_settings is None:
             extra_settings = {}
         self.loggit = logging.getLogger('curator.actions.snapshot')
         verify_snapshot_list(slo)
+        if slo.repository is None:
+            raise ActionError(
+                f'Cannot restore from more than one repository: {slo.repositories}'
+            )
         # Get the most recent snapshot.
         most_recent = slo.most_recent()
         self.loggit.debug('"most_recent" snapshot: %s', most_recent)
@@ -360,7 +753,9 @@ class Restore(object):
         if indices:
             self.indices = ensure_list(indices)
         else:
-            self.indices = slo.snapshot_info[self.name]['indices']
+            self.indices = slo.get_snapshot_indices(self.name)
+        if timestring or date_from or date_to:
+            self.indices = self._get_window_indices(timestring, date_from, date_to)
         self.loggit.debug('self.indices: %s', self.indices)
         #: Object attribute that gets the value of param ``wait_for_completion``.
         self.wfc = wait_for_completion
@@ -381,6 +776,10 @@ class Restore(object):
         self.py_rename_replacement = self.rename_replacement.replace('$', '\\')
         #: Object attribute that gets the value of param ``max_wait``.
         self.skip_repo_fs_check = skip_repo_fs_check
+        #: Object attribute that gets the value of param ``max_wave_indices``.
+        self.max_wave_indices = max_wave_indices
+        #: Object attribute that gets the value of param ``max_wave_gb``, in bytes.
+        self.max_wave_bytes = int(max_wave_gb * 2**30)
 
         #: Object attribute that gets populated from other params/attributes.
         #: Deprecated, but not removed. Lazy way to keep from updating
@@ -422,33 +821,128 @@ class Restore(object):
         self.loggit.debug('BODY: %s', self.body)
         self._get_expected_output()
 
+    def _get_window_indices(self, timestring, date_from, date_to):
+        """
+        :param timestring: An ``strftime`` pattern for the dates in index names
+        :param date_from: The start of the time window, in ``timestring`` format
+        :param date_to: The end of the time window, in ``timestring`` format
+
+        :type timestring: str
+        :type date_from: str
+        :type date_to: str
+
+        :returns: The indices in :py:attr:`indices` with a date in their name,
+            parsed with :py:func:`~.curator.helpers.date_ops.get_name_epoch`, that
+            falls within the window from the start of ``date_from`` to the end of
+            ``date_to``, as found by
+            :py:func:`~.curator.helpers.date_ops.absolute_date_range`
+        :rtype: list
+        """
+        if not timestring or not date_from or not date_to:
+            raise MissingArgument(
+                '"timestring", "date_from" and "date_to" must all be provided to '
+                'restore a time window'
+            )
+        start, end = absolute_date_range(
+            timestring_unit(timestring),
+            date_from,
+            date_to,
+            date_from_format=timestring,
+            date_to_format=timestring,
+        )
+        snapshot_indices = self.snapshot_list.get_snapshot_indices(self.name)
+        if self.indices == snapshot_indices:
+            candidates = snapshot_indices
+        else:
+            candidates = multitarget_match(to_csv(self.indices), snapshot_indices)
+        indices = []
+        for index in candidates:
+            epoch = get_name_epoch(timestring, index)
+            if epoch is not None and start <= epoch <= end:
+                indices.append(index)
+        if not indices:
+            raise NoIndices(
+                f'No indices in snapshot {self.name} are dated from {date_from} to '
+                f'{date_to}'
+            )
+        self.loggit.info(
+            'Restoring %d of %d indices, dated from %s to %s',
+            len(indices),
+            len(candidates),
+            date_from,
+            date_to,
+        )
+        return indices
+
     def _get_expected_output(self):
-        if self.indices == self.snapshot_list.snapshot_info[self.name]['indices']:
+        snapshot_indices = self.snapshot_list.get_snapshot_indices(self.name)
+        if self.indices == snapshot_indices:
             indices = self.indices
         else:
             indices = multitarget_match(
-                to_csv(self.indices),  # type: ignore
-                self.snapshot_list.snapshot_info[self.name]['indices'],
+                to_csv(self.indices), snapshot_indices  # type: ignore
             )
+        #: The names in the snapshot of the indices to be restored
+        self.restore_indices = indices
         if not self.rename_pattern and not self.rename_replacement:
             self.expected_output = indices
             self.loggit.debug('Expected output: %s', indices)
             return  # Don't stick around if we're not replacing anything
         self.expected_output = []
         for index in indices:
-            self.expected_output.append(
-                re.sub(self.rename_pattern, self.py_rename_replacement, index)  # type: ignore
-            )
+            self.expected_output.append(self._rename(index))
             msg = f'index: {index} replacement: {self.expected_output[-1]}'
             self.loggit.debug(msg)
 
+    def _rename(self, index):
+        """
+        :param index: The name of an index in the snapshot
+        :type index: str
+
+        :returns: The name ``index`` is restored as
+        :rtype: str
+        """
+        if not self.rename_pattern and not self.rename_replacement:
+            return index
+        return re.sub(self.rename_pattern, self.py_rename_replacement, index)  # type: ignore
+
+    def get_waves(self):
+        """
+        Split :py:attr:`restore_indices` into waves of at most
+        :py:attr:`max_wave_indices` indices and :py:attr:`max_wave_bytes` of
+        snapshotted data, using :py:func:`~.curator.helpers.utils.batch_by_size`.
+        The size of each index is read from the snapshot only if
+        :py:attr:`max_wave_bytes` is set.
+
+        :returns: The indices to restore in each wave, or only :py:attr:`indices`
+            if there are no wave limits
+        :rtype: list
+        """
+        if not self.max_wave_indices and not self.max_wave_bytes:
+            return [self.indices]
+        if self.max_wave_bytes:
+            sizes = get_snapshot_index_sizes(
+                self.client, repository=self.repository, snapshot=self.name
+            )
+        else:
+            sizes = {}
+        waves = batch_by_size(
+            {idx: sizes.get(idx, 0) for idx in self.restore_indices},
+            max_count=self.max_wave_indices,
+            max_size=self.max_wave_bytes,
+        )
+        self.loggit.info(
+            'Restoring %d indices in %d waves', len(self.restore_indices), len(waves)
+        )
+        return waves
+
     def report_state(self):
         """
         Log the state of the restore. This should only be done if
         ``wait_for_completion`` is ``True``, and only after completing the restore.
         """
-        all_indices = get_indices(self.client)
-        self.loggit.debug('All indices: %s', all_indices)
+        all_indices = set(get_existing_indices(self.client, self.expected_output))
+        self.loggit.debug('Restored indices found: %s', all_indices)
         self.loggit.debug('Expected output: %s', self.expected_output)
         found_count = 0
         missing = []
@@ -485,6 +979,9 @@ class Restore(object):
             else:
                 rmsg = ''
             self.loggit.info('DRY-RUN: restore: Index %s %s', index, rmsg)
+        if self.max_wave_indices or self.max_wave_bytes:
+            for num, wave in enumerate(self.get_waves(), start=1):
+                self.loggit.info('DRY-RUN: restore: Wave %d: %s', num, wave)
 
     def do_action(self):
         """
@@ -496,31 +993,48 @@ class Restore(object):
         if snapshot_running(self.client):
             raise SnapshotInProgress('Cannot restore while a snapshot is in progress.')
         try:
-            self.loggit.info(
-                'Restoring indices "%s" from snapshot: %s', self.indices, self.name
-            )
-            # Always set wait_for_completion to False. Let 'wait_for_it' do its
-            # thing if wait_for_completion is set to True. Report the task_id
-            # either way.
-            self.client.snapshot.restore(
-                repository=self.repository,
-                snapshot=self.name,
-                ignore_index_settings=None,
-                ignore_unavailable=self.ignore_unavailable,
-                include_aliases=self.include_aliases,
-                include_global_state=self.include_global_state,
-                index_settings=self.index_settings,
-                indices=self.indices,
-                partial=self.partial,
-                rename_pattern=self.rename_pattern,
-                rename_replacement=self.rename_replacement,
-                wait_for_completion=False,
-            )
+            waves = self.get_waves()
+            for num, wave in enumerate(waves, start=1):
+                self.loggit.info(
+                    'Restoring indices "%s" from snapshot: %s', wave, self.name
+                )
+                # Always set wait_for_completion to False. Let 'wait_for_it' do its
+                # thing if wait_for_completion is set to True. Report the task_id
+                # either way.
+                self.client.snapshot.restore(
+                    repository=self.repository,
+                    snapshot=self.name,
+                    ignore_index_settings=None,
+                    ignore_unavailable=self.ignore_unavailable,
+                    include_aliases=self.include_aliases,
+                    # The cluster state only needs to be restored once
+                    include_global_state=self.include_global_state and num == 1,
+                    index_settings=self.index_settings,
+                    indices=wave,
+                    partial=self.partial,
+                    rename_pattern=self.rename_pattern,
+                    rename_replacement=self.rename_replacement,
+                    wait_for_completion=False,
+                )
+                if num < len(waves):
+                    # The next wave only starts once this one has recovered,
+                    # whether or not wait_for_completion is set
+                    wait_for_it(
+                        self.client,
+                        'restore',
+                        index_list=[self._rename(idx) for idx in wave],
+                        wait_interval=self.wait_interval,
+                        max_wait=self.max_wait,
+                    )
             if self.wfc:
+                # Earlier waves have already recovered
+                last = self.expected_output
+                if len(waves) > 1:
+                    last = [self._rename(idx) for idx in waves[-1]]
                 wait_for_it(
                     self.client,
                     'restore',
-                    index_list=self.expected_output,
+                    index_list=last,
                     wait_interval=self.wait_interval,
                     max_wait=self.max_wait,
                 )
@@ -168,8 +168,15 @@ def process_action(client, action_def, dry_run=False):
     else:
         if action_def.action in ['delete_snapshots', 'restore']:
             mykwargs.pop('repository')  # We don't need to send this value to the action
+            cache_dir = mykwargs.pop('snapshot_cache_dir', None)
+            # Restore gets the index names it needs on demand, so leave them out
+            # of the (possibly very large) snapshot list
             action_def.instantiate(
-                'list_obj', client, repository=action_def.options['repository']
+                'list_obj',
+                client,
+                repository=action_def.options['repository'],
+                index_names=False,
+                cache_dir=cache_dir,
             )
         else:
             action_def.instantiate(
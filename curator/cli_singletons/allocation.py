@@ -32,6 +32,13 @@ from curator.cli_singletons.utils import validate_filter_json
     help='Seconds to wait between completion checks.',
     show_default=True,
 )
+@click.option(
+    '--max_pending_tasks',
+    type=int,
+    default=0,
+    show_default=True,
+    help='Back off while this many cluster tasks are pending (0 disables)',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -83,6 +90,7 @@ def allocation(
     wait_for_completion,
     max_wait,
     wait_interval,
+    max_pending_tasks,
     ignore_empty_list,
     allow_ilm_indices,
     include_datastreams,
@@ -102,6 +110,7 @@ def allocation(
         'wait_for_completion': wait_for_completion,
         'max_wait': max_wait,
         'wait_interval': wait_interval,
+        'max_pending_tasks': max_pending_tasks,
         'allow_ilm_indices': allow_ilm_indices,
         'include_datastreams': include_datastreams,
         'include_hidden': include_hidden,
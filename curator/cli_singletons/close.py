@@ -17,6 +17,13 @@ from curator.cli_singletons.utils import validate_filter_json
 @click.option(
     '--skip_flush', is_flag=True, help='Skip flush phase for indices to be closed'
 )
+@click.option(
+    '--max_pending_tasks',
+    type=int,
+    default=0,
+    show_default=True,
+    help='Back off while this many cluster tasks are pending (0 disables)',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -64,6 +71,7 @@ def close(
     search_pattern,
     delete_aliases,
     skip_flush,
+    max_pending_tasks,
     ignore_empty_list,
     allow_ilm_indices,
     include_datastreams,
@@ -79,6 +87,7 @@ def close(
         'search_pattern': search_pattern,
         'skip_flush': skip_flush,
         'delete_aliases': delete_aliases,
+        'max_pending_tasks': max_pending_tasks,
         'allow_ilm_indices': allow_ilm_indices,
         'include_datastreams': include_datastreams,
         'include_hidden': include_hidden,
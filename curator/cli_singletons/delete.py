@@ -14,6 +14,20 @@ from curator.cli_singletons.utils import validate_filter_json
     default='*',
     help='Elasticsearch Index Search Pattern',
 )
+@click.option(
+    '--max_concurrent_requests',
+    type=int,
+    default=1,
+    show_default=True,
+    help='Number of chunks of indices to delete at the same time',
+)
+@click.option(
+    '--max_pending_tasks',
+    type=int,
+    default=0,
+    show_default=True,
+    help='Back off while this many cluster tasks are pending (0 disables)',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -59,6 +73,8 @@ from curator.cli_singletons.utils import validate_filter_json
 def delete_indices(
     ctx,
     search_pattern,
+    max_concurrent_requests,
+    max_pending_tasks,
     ignore_empty_list,
     allow_ilm_indices,
     include_datastreams,
@@ -77,6 +93,8 @@ def delete_indices(
         ctx.obj['configdict'],
         {
             'search_pattern': search_pattern,
+            'max_concurrent_requests': max_concurrent_requests,
+            'max_pending_tasks': max_pending_tasks,
             'allow_ilm_indices': allow_ilm_indices,
             'include_datastreams': include_datastreams,
             'include_hidden': include_hidden,
@@ -94,6 +112,15 @@ def delete_indices(
 @click.option('--repository', type=str, required=True, help='Snapshot repository name')
 @click.option('--retry_count', type=int, help='Number of times to retry (max 3)')
 @click.option('--retry_interval', type=int, help='Time in seconds between retries')
+@click.option(
+    '--batch_size', type=int, help='Maximum number of snapshots to delete per request'
+)
+@click.option(
+    '--snapshot_cache_dir',
+    type=str,
+    default=None,
+    help='Directory of the local snapshot catalog cache',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -141,6 +168,8 @@ def delete_snapshots(
     repository,
     retry_count,
     retry_interval,
+    batch_size,
+    snapshot_cache_dir,
     ignore_empty_list,
     allow_ilm_indices,
     # include_datastreams,
@@ -155,6 +184,8 @@ def delete_snapshots(
     manual_options = {
         'retry_count': retry_count,
         'retry_interval': retry_interval,
+        'batch_size': batch_size,
+        'snapshot_cache_dir': snapshot_cache_dir,
         'allow_ilm_indices': allow_ilm_indices,
         # 'include_datastreams': include_datastreams,
         # 'include_hidden': include_hidden,
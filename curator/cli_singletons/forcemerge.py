@@ -13,14 +13,37 @@ from curator.cli_singletons.utils import validate_filter_json
 @click.option(
     '--max_num_segments',
     type=int,
-    required=True,
     help='Maximum number of segments per shard (minimum of 1)',
 )
+@click.option(
+    '--only_expunge_deletes',
+    is_flag=True,
+    help='Only merge away deleted documents. Do not use with --max_num_segments',
+)
 @click.option(
     '--delay',
     type=float,
     help='Time in seconds to delay between operations. Default 0. Maximum 3600',
 )
+@click.option(
+    '--max_merges_per_node',
+    type=int,
+    default=0,
+    show_default=True,
+    help='Merge in the background, at most this many at a time per node',
+)
+@click.option(
+    '--wait_interval',
+    type=int,
+    default=9,
+    show_default=True,
+    help='Seconds to wait between checks on background merges',
+)
+@click.option(
+    '--merge_journal',
+    type=str,
+    help='Path to a journal file, to skip indices merged by earlier runs',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -67,7 +90,11 @@ def forcemerge(
     ctx,
     search_pattern,
     max_num_segments,
+    only_expunge_deletes,
     delay,
+    max_merges_per_node,
+    wait_interval,
+    merge_journal,
     ignore_empty_list,
     allow_ilm_indices,
     include_datastreams,
@@ -82,7 +109,11 @@ def forcemerge(
     manual_options = {
         'search_pattern': search_pattern,
         'max_num_segments': max_num_segments,
+        'only_expunge_deletes': only_expunge_deletes,
         'delay': delay,
+        'max_merges_per_node': max_merges_per_node,
+        'wait_interval': wait_interval,
+        'merge_journal': merge_journal,
         'allow_ilm_indices': allow_ilm_indices,
         'include_datastreams': include_datastreams,
         'include_hidden': include_hidden,
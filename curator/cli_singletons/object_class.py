@@ -102,6 +102,10 @@ class CLIAction:
         else:
             self.options = option_dict
 
+        # The snapshot list, not the action, uses the snapshot cache for these
+        self.cache_dir = None
+        if action in ['delete_snapshots', 'restore']:
+            self.cache_dir = self.options.pop('snapshot_cache_dir', None)
         self.search_pattern = self.options.pop('search_pattern', '*')
         self.include_datastreams = self.options.pop('include_datastreams', True)
         self.include_hidden = self.options.pop('include_hidden', False)
@@ -224,7 +228,12 @@ class CLIAction:
     def get_list_object(self) -> t.Union[IndexList, SnapshotList]:
         """Get either a SnapshotList or IndexList object"""
         if self.action in snapshot_actions() or self.action == 'show_snapshots':
-            return SnapshotList(self.client, repository=self.repository)
+            return SnapshotList(
+                self.client,
+                repository=self.repository,
+                index_names=False,
+                cache_dir=self.cache_dir,
+            )
         return IndexList(
             self.client,
             search_pattern=self.search_pattern,
@@ -9,6 +9,13 @@ from curator.cli_singletons.utils import validate_filter_json
 @click.option(
     '--search_pattern', type=str, default='*', help='Elasticsearch Index Search Pattern'
 )
+@click.option(
+    '--max_pending_tasks',
+    type=int,
+    default=0,
+    show_default=True,
+    help='Back off while this many cluster tasks are pending (0 disables)',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -54,6 +61,7 @@ from curator.cli_singletons.utils import validate_filter_json
 def open_indices(
     ctx,
     search_pattern,
+    max_pending_tasks,
     ignore_empty_list,
     allow_ilm_indices,
     include_datastreams,
@@ -72,6 +80,7 @@ def open_indices(
         ctx.obj['configdict'],
         {
             'search_pattern': search_pattern,
+            'max_pending_tasks': max_pending_tasks,
             'allow_ilm_indices': allow_ilm_indices,
             'include_datastreams': include_datastreams,
             'include_hidden': include_hidden,
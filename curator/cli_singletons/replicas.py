@@ -16,6 +16,13 @@ from curator.cli_singletons.utils import validate_filter_json
     help='Wait for replication to complete',
     show_default=True,
 )
+@click.option(
+    '--max_pending_tasks',
+    type=int,
+    default=0,
+    show_default=True,
+    help='Back off while this many cluster tasks are pending (0 disables)',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -63,6 +70,7 @@ def replicas(
     search_pattern,
     count,
     wait_for_completion,
+    max_pending_tasks,
     ignore_empty_list,
     allow_ilm_indices,
     include_datastreams,
@@ -78,6 +86,7 @@ def replicas(
         'search_pattern': search_pattern,
         'count': count,
         'wait_for_completion': wait_for_completion,
+        'max_pending_tasks': max_pending_tasks,
         'allow_ilm_indices': allow_ilm_indices,
         'include_datastreams': include_datastreams,
         'include_hidden': include_hidden,
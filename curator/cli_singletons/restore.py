@@ -78,6 +78,44 @@ from curator.cli_singletons.utils import json_to_dict, validate_filter_json
     show_default=True,
     help='Skip repository filesystem access validation.',
 )
+@click.option(
+    '--max_wave_indices',
+    default=0,
+    type=int,
+    show_default=True,
+    help='Restore at most this many indices at a time (0 is no limit)',
+)
+@click.option(
+    '--max_wave_gb',
+    default=0,
+    type=float,
+    show_default=True,
+    help='Restore at most this many GB of snapshot data at a time (0 is no limit)',
+)
+@click.option(
+    '--timestring',
+    type=str,
+    default=None,
+    help='strftime pattern of the dates in the index names, e.g. %Y.%m.%d.%H',
+)
+@click.option(
+    '--date_from',
+    type=str,
+    default=None,
+    help='Only restore indices dated from this time on, in timestring format',
+)
+@click.option(
+    '--date_to',
+    type=str,
+    default=None,
+    help='Only restore indices dated up to the end of this time, in timestring format',
+)
+@click.option(
+    '--snapshot_cache_dir',
+    type=str,
+    default=None,
+    help='Directory of the local snapshot catalog cache',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -118,6 +156,12 @@ def restore(
     wait_interval,
     max_wait,
     skip_repo_fs_check,
+    max_wave_indices,
+    max_wave_gb,
+    timestring,
+    date_from,
+    date_to,
+    snapshot_cache_dir,
     ignore_empty_list,
     allow_ilm_indices,
     include_hidden,
@@ -141,6 +185,12 @@ def restore(
         'wait_for_completion': wait_for_completion,
         'max_wait': max_wait,
         'wait_interval': wait_interval,
+        'max_wave_indices': max_wave_indices,
+        'max_wave_gb': max_wave_gb,
+        'timestring': timestring,
+        'date_from': date_from,
+        'date_to': date_to,
+        'snapshot_cache_dir': snapshot_cache_dir,
         'allow_ilm_indices': allow_ilm_indices,
         'include_hidden': include_hidden,
     }
@@ -60,6 +60,25 @@ from curator.cli_singletons.utils import validate_filter_json
     show_default=True,
     help='Skip repository filesystem access validation.',
 )
+@click.option(
+    '--partitions',
+    default=1,
+    type=int,
+    show_default=True,
+    help='Split the indices into this many concurrent snapshots of similar size',
+)
+@click.option(
+    '--skip_unchanged',
+    is_flag=True,
+    show_default=True,
+    help='Leave out indices unchanged since their last snapshot.',
+)
+@click.option(
+    '--snapshot_cache_dir',
+    type=str,
+    default=None,
+    help='Directory of the record of the last snapshot of each index',
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -114,6 +133,9 @@ def snapshot(
     wait_for_completion,
     wait_interval,
     max_wait,
+    partitions,
+    skip_unchanged,
+    snapshot_cache_dir,
     ignore_empty_list,
     allow_ilm_indices,
     include_datastreams,
@@ -136,6 +158,9 @@ def snapshot(
         'wait_for_completion': wait_for_completion,
         'max_wait': max_wait,
         'wait_interval': wait_interval,
+        'partitions': partitions,
+        'skip_unchanged': skip_unchanged,
+        'snapshot_cache_dir': snapshot_cache_dir,
         'allow_ilm_indices': allow_ilm_indices,
         'include_datastreams': include_datastreams,
         'include_hidden': include_hidden,
@@ -73,6 +73,15 @@ def date_to_format(**kwargs):
     return {Optional('date_to_format'): Any(str)}
 
 
+def deleted_ratio(**kwargs):
+    """
+    This setting is only used with the ``deleted_docs`` filtertype and is required
+
+    :returns: {Required('deleted_ratio'): All(Coerce(float), Range(min=0, max=1))}
+    """
+    return {Required('deleted_ratio'): All(Coerce(float), Range(min=0, max=1))}
+
+
 def direction(**kwargs):
     """
     This setting is only used with the ``age`` filtertype.
@@ -172,6 +181,8 @@ def number_of_shards(**kwargs):
 
 def pattern(**kwargs):
     """
+    This setting is only used with the ``count`` and ``space`` filtertypes.
+
     :returns: {Optional('pattern'): Any(str)}
     """
     return {Optional('pattern'): Any(str)}
@@ -258,13 +269,14 @@ def source(**kwargs):
     :ivar valuelist: If ``kwargs['action']`` is in
         :py:func:`curator.defaults.settings.snapshot_actions`, then it is
         ``Any('name', 'creation_date')``, otherwise
-        ``Any('name', 'creation_date', 'field_stats')``
+        ``Any('name', 'creation_date', 'field_stats', 'settings')``
     :returns: {Required('source'): valuelist} if ``kwargs['required']``, else
         {Optional('source'): valuelist}
     """
     if 'action' in kwargs and kwargs['action'] in settings.snapshot_actions():
         valuelist = Any('name', 'creation_date')
-    valuelist = Any('name', 'creation_date', 'field_stats')
+    else:
+        valuelist = Any('name', 'creation_date', 'field_stats', 'settings')
     if 'required' in kwargs and kwargs['required']:
         return {Required('source'): valuelist}
     return {Optional('source'): valuelist}
@@ -311,8 +323,8 @@ def timestring(**kwargs):
 
 def threshold_behavior(**kwargs):
     """
-    This setting is only used with the space and size filtertype and defaults to
-    'greater_than'.
+    This setting is only used with the space, size and deleted_docs filtertypes and
+    defaults to 'greater_than'.
 
     :returns: {Optional('threshold_behavior', default='greater_than'):
         Any('greater_than', 'less_than')}
@@ -131,6 +131,18 @@ def count(action, config):
     return retval
 
 
+def deleted_docs(action, config):
+    """
+    :returns: Filter elements acceptable for
+        :py:meth:`~.curator.IndexList.filter_deleted_docs`
+    """
+    return [
+        filter_elements.deleted_ratio(),
+        filter_elements.threshold_behavior(),
+        filter_elements.exclude(),
+    ]
+
+
 def empty(action, config):
     """
     :returns: Filter elements acceptable for :py:meth:`~.curator.IndexList.filter_empty`
@@ -254,6 +266,7 @@ def space(action, config):
     """
     retval = [
         filter_elements.disk_space(),
+        filter_elements.pattern(),
         filter_elements.reverse(),
         filter_elements.use_age(),
         filter_elements.exclude(),
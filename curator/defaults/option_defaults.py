@@ -31,6 +31,17 @@ def allow_ilm_indices():
     }
 
 
+def batch_size():
+    """
+    :returns:
+        {Optional('batch_size', default=25):
+            All(Coerce(int), Range(min=1, max=1000))}
+    """
+    return {
+        Optional('batch_size', default=25): All(Coerce(int), Range(min=1, max=1000))  # type: ignore
+    }
+
+
 def conditions():
     """
     :returns:
@@ -107,6 +118,24 @@ def copy_aliases():
     }
 
 
+def date_from():
+    """
+    Only for the :py:class:`~.curator.actions.Restore` action
+
+    :returns: {Optional('date_from', default=None): Any(None, Coerce(str))}
+    """
+    return {Optional('date_from', default=None): Any(None, Coerce(str))}  # type: ignore
+
+
+def date_to():
+    """
+    Only for the :py:class:`~.curator.actions.Restore` action
+
+    :returns: {Optional('date_to', default=None): Any(None, Coerce(str))}
+    """
+    return {Optional('date_to', default=None): Any(None, Coerce(str))}  # type: ignore
+
+
 def delete_after():
     """
     :returns:
@@ -285,13 +314,50 @@ def key():
     return {Required('key'): Any(str)}
 
 
+def max_concurrent_requests():
+    """
+    Only for the :py:class:`~.curator.actions.DeleteIndices` action
+
+    :returns:
+        {Optional('max_concurrent_requests', default=1):
+            All(Coerce(int), Range(min=1, max=16))}
+    """
+    return {
+        Optional('max_concurrent_requests', default=1): All(Coerce(int), Range(min=1, max=16))  # type: ignore
+    }
+
+
+def max_merges_per_node():
+    """
+    Only for the :py:class:`~.curator.actions.ForceMerge` action
+
+    :returns:
+        {Optional('max_merges_per_node', default=0):
+            All(Coerce(int), Range(min=0, max=16))}
+    """
+    return {
+        Optional('max_merges_per_node', default=0): All(Coerce(int), Range(min=0, max=16))  # type: ignore
+    }
+
+
 def max_num_segments():
     """
+    Required by :py:class:`~.curator.actions.ForceMerge` unless
+    ``only_expunge_deletes`` is set
+
     :returns:
-        {Required('max_num_segments'):
+        {Optional('max_num_segments'):
             All(Coerce(int), Range(min=1, max=32768))}
     """
-    return {Required('max_num_segments'): All(Coerce(int), Range(min=1, max=32768))}
+    return {Optional('max_num_segments'): All(Coerce(int), Range(min=1, max=32768))}
+
+
+def max_pending_tasks():
+    """
+    :returns:
+        {Optional('max_pending_tasks', default=0): All(Coerce(int), Range(min=0))}
+    """
+    return {Optional('max_pending_tasks', default=0): All(Coerce(int), Range(min=0))}  # type: ignore
 
 
 # pylint: disable=unused-argument
@@ -308,6 +374,37 @@ def max_wait(action):
     return {Optional('max_wait', default=defval): Any(-1, Coerce(int), None)}  # type: ignore
 
 
+def max_wave_gb():
+    """
+    Only for the :py:class:`~.curator.actions.Restore` action
+
+    :returns: {Optional('max_wave_gb', default=0): All(Coerce(float), Range(min=0.0))}
+    """
+    return {
+        Optional('max_wave_gb', default=0): All(Coerce(float), Range(min=0.0))  # type: ignore
+    }
+
+
+def max_wave_indices():
+    """
+    Only for the :py:class:`~.curator.actions.Restore` action
+
+    :returns: {Optional('max_wave_indices', default=0): All(Coerce(int), Range(min=0))}
+    """
+    return {
+        Optional('max_wave_indices', default=0): All(Coerce(int), Range(min=0))  # type: ignore
+    }
+
+
+def merge_journal():
+    """
+    Only for the :py:class:`~.curator.actions.ForceMerge` action
+
+    :returns: {Optional('merge_journal', default=None): Any(None, str)}
+    """
+    return {Optional('merge_journal', default=None): Any(None, str)}  # type: ignore
+
+
 def migration_prefix():
     """
     :returns: {Optional('migration_prefix', default=''): Any(None, str)}
@@ -383,6 +480,21 @@ def number_of_shards():
     }
 
 
+def only_expunge_deletes():
+    """
+    Only for the :py:class:`~.curator.actions.ForceMerge` action
+
+    :returns:
+        {Optional('only_expunge_deletes', default=False):
+            Any(bool, All(Any(str), Boolean()))}
+    """
+    return {
+        Optional('only_expunge_deletes', default=False): Any(  # type: ignore
+            bool, All(Any(str), Boolean())  # type: ignore
+        )
+    }
+
+
 def partial():
     """
     :returns:
@@ -391,6 +503,16 @@ def partial():
     return {Optional('partial', default=False): Any(bool, All(Any(str), Boolean()))}  # type: ignore
 
 
+def partitions():
+    """
+    :returns:
+        {Optional('partitions', default=1): All(Coerce(int), Range(min=1, max=100))}
+    """
+    return {
+        Optional('partitions', default=1): All(Coerce(int), Range(min=1, max=100))  # type: ignore
+    }
+
+
 def post_allocation():
     """
     :returns: A :py:class:`voluptuous.schema_builder.Schema` object.
@@ -630,6 +752,19 @@ def skip_repo_fs_check():
     }
 
 
+def skip_unchanged():
+    """
+    :returns:
+        {Optional('skip_unchanged', default=False):
+            Any(bool, All(Any(str), Boolean()))}
+    """
+    return {
+        Optional('skip_unchanged', default=False): Any(  # type: ignore
+            bool, All(Any(str), Boolean())  # type: ignore
+        )
+    }
+
+
 def slices():
     """
     :returns:
@@ -643,6 +778,22 @@ def slices():
     }
 
 
+def snapshot_cache_dir():
+    """
+    :returns: {Optional('snapshot_cache_dir', default=None): Any(None, str)}
+    """
+    return {Optional('snapshot_cache_dir', default=None): Any(None, str)}  # type: ignore
+
+
+def timestring():
+    """
+    Only for the :py:class:`~.curator.actions.Restore` action
+
+    :returns: {Optional('timestring', default=None): Any(None, str)}
+    """
+    return {Optional('timestring', default=None): Any(None, str)}  # type: ignore
+
+
 def timeout(action):
     """
     :returns: {Optional('timeout', default=defval): Any(Coerce(int), None)}
@@ -739,14 +890,14 @@ def wait_interval(action):
             Any(All(Coerce(int), Range(min=minval, max=maxval)), None)}
             where ``minval`` = ``1``, ``maxval`` = ``30``, and ``defval`` is ``3``,
             unless the action is one of
-            ``['restore', 'snapshot', 'reindex', 'shrink']``, and then ``defval``
-            is ``9``.
+            ``['forcemerge', 'restore', 'snapshot', 'reindex', 'shrink']``, and then
+            ``defval`` is ``9``.
     """
     minval = 1
     maxval = 30
     # if action in ['allocation', 'cluster_routing', 'replicas']:
     defval = 3
-    if action in ['restore', 'snapshot', 'reindex', 'shrink']:
+    if action in ['forcemerge', 'restore', 'snapshot', 'reindex', 'shrink']:
         defval = 9
     return {
         Optional('wait_interval', default=defval): Any(  # type: ignore
@@ -156,9 +156,9 @@ def all_actions():
 def index_filtertypes():
     """
     :returns: The list of supported index filter types:
-        ['alias', 'allocated', 'age', 'closed', 'count', 'empty', 'forcemerged',
-        'ilm', 'kibana', 'none', 'opened', 'pattern', 'period', 'space',
-        'shards', 'size']
+        ['alias', 'allocated', 'age', 'closed', 'count', 'deleted_docs', 'empty',
+        'forcemerged', 'ilm', 'kibana', 'none', 'opened', 'pattern', 'period',
+        'space', 'shards', 'size']
     """
 
     return [
@@ -167,6 +167,7 @@ def index_filtertypes():
         'age',
         'closed',
         'count',
+        'deleted_docs',
         'empty',
         'forcemerged',
         'ilm',
@@ -235,6 +236,7 @@ def structural_filter_elements():
         Optional('date_from_format'): Any(None, str),
         Optional('date_to'): Any(None, str),
         Optional('date_to_format'): Any(None, str),
+        Optional('deleted_ratio'): Any(Coerce(float)),
         Optional('direction'): Any(str),
         Optional('disk_space'): float,
         Optional('epoch'): Any(Coerce(int), None),
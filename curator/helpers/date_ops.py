@@ -5,6 +5,7 @@ import random
 import re
 import string
 import time
+from functools import lru_cache
 from datetime import timedelta, datetime, timezone
 from elasticsearch8.exceptions import NotFoundError
 from curator.debug import debug, begin_end
@@ -13,6 +14,10 @@ from curator.defaults.settings import date_regex
 
 logger = logging.getLogger(__name__)
 
+#: The maximum number of ``(timestring, name)`` results kept by
+#: :py:func:`get_name_epoch`. The least recently used are evicted first.
+NAME_EPOCH_CACHE_SIZE = 65536
+
 
 class TimestringSearch:
     """
@@ -332,6 +337,34 @@ def epoch2iso(epoch: int) -> str:
     return f'{parts[0]}+{parts[1]}'  # Fallback publishes the +TZ, whatever that was
 
 
+def iso2epoch(value: str) -> int:
+    """
+    Return the epoch timestamp in seconds for ISO8601 ``value``, as found in index
+    settings like ``index.time_series.start_time``. Values without a timezone are
+    treated as UTC.
+
+    :param value: An ISO8601 timestamp, e.g. ``2024-01-01T00:00:00.000Z``
+    :type value: str
+
+    :returns: An epoch timestamp in seconds
+    :rtype: int
+    """
+    value = str(value)
+    if value.isdigit():
+        # Some settings, e.g. index.lifecycle.origination_date, are epoch millis
+        return fix_epoch(value)
+    # datetime.fromisoformat() only understands the trailing Z in Python 3.11+
+    if value.endswith('Z'):
+        value = f'{value[:-1]}+00:00'
+    try:
+        mydate = datetime.fromisoformat(value)
+    except ValueError as err:
+        raise ValueError(f'Bad ISO8601 value: {value}. {err}') from err
+    if mydate.tzinfo is None:
+        mydate = mydate.replace(tzinfo=timezone.utc)
+    return int(mydate.timestamp())
+
+
 def fix_epoch(epoch):
     """
     Fix value of ``epoch`` to be the count since the epoch in seconds only, which
@@ -479,6 +512,36 @@ def get_datetime(index_timestamp, timestring):
     return mydate
 
 
+@lru_cache(maxsize=32)
+def _timestring_search(timestring):
+    """
+    :returns: A cached :py:class:`TimestringSearch` object for ``timestring``
+    """
+    return TimestringSearch(timestring)
+
+
+@lru_cache(maxsize=NAME_EPOCH_CACHE_SIZE)
+def get_name_epoch(timestring, name):
+    """
+    Return the epoch timestamp found in ``name`` by matching ``timestring``.
+
+    Results are memoized for the life of the process, keyed by ``timestring`` and
+    ``name``, so that index and snapshot names are only parsed once, no matter how
+    many filters or actions use them. A name without a match is memoized as
+    ``None``. At most :py:data:`NAME_EPOCH_CACHE_SIZE` results are kept.
+
+    :param timestring: An ``strftime`` pattern
+    :param name: An index or snapshot name
+
+    :type timestring: :py:func:`~.time.strftime`
+    :type name: str
+
+    :returns: The epoch timestamp extracted from ``name``, or ``None``
+    :rtype: int or None
+    """
+    return _timestring_search(timestring).get_epoch(name)
+
+
 @begin_end()
 def get_point_of_reference(unit, count, epoch=None):
     """
@@ -689,3 +752,33 @@ def parse_datemath(client, value):
         ) from exc
 
     return f'{prefix}{get_datemath(client, datemath)}{suffix}'
+
+
+@begin_end()
+def timestring_unit(timestring):
+    """
+    :param timestring: An ``strftime`` pattern
+    :type timestring: :py:func:`~.time.strftime`
+
+    :returns: The smallest unit of time in ``timestring``, as used by
+        :py:func:`absolute_date_range`, e.g. ``hours`` for ``%Y.%m.%d.%H``
+    :rtype: str
+    """
+    units = [
+        ('S', 'seconds'),
+        ('M', 'minutes'),
+        ('H', 'hours'),
+        ('d', 'days'),
+        ('j', 'days'),
+        ('W', 'weeks'),
+        ('V', 'weeks'),
+        ('U', 'weeks'),
+        ('m', 'months'),
+        ('Y', 'years'),
+        ('G', 'years'),
+        ('y', 'years'),
+    ]
+    for char, unit in units:
+        if f'%{char}' in timestring:
+            return unit
+    raise ConfigurationError(f'No date elements found in timestring "{timestring}"')
@@ -1,6 +1,7 @@
 """Utility functions that get things"""
 
 import logging
+import re
 from elasticsearch8 import exceptions as es8exc
 from curator.debug import debug, begin_end
 from curator.defaults.settings import EXCLUDE_ALWAYS, EXCLUDE_SYSTEM
@@ -10,6 +11,7 @@ from curator.exceptions import (
     FailedExecution,
     MissingArgument,
 )
+from curator.helpers.utils import chunk_index_list, to_csv
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +108,96 @@ def get_data_tiers(client):
     return retval
 
 
+@begin_end()
+def get_existing_indices(client, indices):
+    """
+    Uses :py:func:`get_index_uuids` to find which of the named ``indices`` exist.
+    This avoids listing every index in the cluster to check a few names.
+
+    :param client: A client connection object
+    :param indices: The index names to look for
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type indices: list
+
+    :returns: The names in ``indices`` that exist, in the same order
+    :rtype: list
+    """
+    found = get_index_uuids(client, indices)
+    existing = [idx for idx in indices if idx in found]
+    debug.lv3('Existing indices: %s', existing)
+    return existing
+
+
+@begin_end()
+def get_forcemerge_tasks(client):
+    """
+    Calls `client.tasks.` :py:meth:`~.elasticsearch.client.TasksClient.list` for
+    the running forceMerge tasks, and reads the index names from each task
+    description, such as ``Force-merge indices [index-1], maxSegments[1], ...``
+
+    :param client: A client connection object
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+
+    :returns: The task id of the running forceMerge of each index, keyed by index
+        name
+    :rtype: dict
+    """
+    try:
+        resp = client.tasks.list(
+            actions='indices:admin/forcemerge', detailed=True, group_by='none'
+        )
+    except Exception as err:
+        raise FailedExecution(f'Failed to list forceMerge tasks. Error: {err}') from err
+    retval = {}
+    for task in resp.get('tasks', []):
+        match = re.match(
+            r'Force-merge indices \[([^\]]*)\]', task.get('description', '')
+        )
+        if not match:
+            continue
+        for index in match.group(1).split(', '):
+            retval[index] = f'{task["node"]}:{task["id"]}'
+    debug.lv3('Running forceMerge tasks: %s', retval)
+    return retval
+
+
+@begin_end()
+def get_index_uuids(client, indices):
+    """
+    Calls :py:meth:`~.elasticsearch.client.IndicesClient.get_settings` for only the
+    named ``indices``, in chunks, with ``ignore_unavailable=True`` and a
+    ``filter_path`` for only the index UUID.
+
+    :param client: A client connection object
+    :param indices: The index names to look up
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type indices: list
+
+    :returns: The UUID of each index in ``indices`` that exists, keyed by index name
+    :rtype: dict
+    """
+    retval = {}
+    if not indices:
+        return retval
+    for chunk in chunk_index_list(indices):
+        try:
+            resp = client.indices.get_settings(
+                index=to_csv(chunk),
+                ignore_unavailable=True,
+                filter_path='*.settings.index.uuid',
+            )
+        except Exception as err:
+            raise FailedExecution(
+                f'Failed to check for indices {chunk}. Error: {err}'
+            ) from err
+        for index, data in (resp or {}).items():
+            retval[index] = data['settings']['index']['uuid']
+    return retval
+
+
 @begin_end()
 def get_indices(
     client,
@@ -177,6 +269,49 @@ def get_indices(
     return indices
 
 
+@begin_end()
+def get_max_seq_nos(client, indices):
+    """
+    Get the UUID of each index in ``indices`` and the highest ``max_seq_no`` of
+    each of its shards. An index with the same UUID and sequence numbers as
+    before has had no writes since.
+    Calls :py:meth:`~.elasticsearch.client.IndicesClient.stats` at shard level,
+    with a ``filter_path`` for only these values, once per chunk of ``indices``
+
+    :param client: A client connection object
+    :param indices: The index names
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type indices: list
+
+    :returns: ``{index: {'uuid': uuid, 'shards': {shard: max_seq_no}}}`` for each
+        index with stats. Closed indices have none.
+    :rtype: dict
+    """
+    result = {}
+    for chunk in chunk_index_list(indices):
+        try:
+            resp = client.indices.stats(
+                index=to_csv(chunk),
+                level='shards',
+                metric='docs',
+                filter_path='indices.*.uuid,indices.*.shards.*.seq_no.max_seq_no',
+            )
+        except (es8exc.TransportError, es8exc.NotFoundError) as err:
+            raise FailedExecution(
+                f'Unable to get the sequence numbers of indices. Error: {err}'
+            ) from err
+        for index, data in resp.get('indices', {}).items():
+            shards = {}
+            for shard, copies in data.get('shards', {}).items():
+                # Replicas can lag behind, so take the highest of all copies
+                shards[shard] = max(
+                    copy.get('seq_no', {}).get('max_seq_no', -1) for copy in copies
+                )
+            result[index] = {'uuid': data.get('uuid'), 'shards': shards}
+    return result
+
+
 @begin_end()
 def get_repository(client, repository=''):
     """
@@ -234,30 +369,295 @@ def get_snapshot(client, repository=None, snapshot=''):
 
 
 @begin_end()
-def get_snapshot_data(client, repository=None):
+def get_repository_uuid(client, repository=None):
+    """
+    Get the UUID of ``repository`` from the cluster state metadata.
+    Calls :py:meth:`~.elasticsearch.client.ClusterClient.state`
+
+    :param client: A client connection object
+    :param repository: The Elasticsearch snapshot repository to use
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type repository: str
+
+    :returns: The UUID of ``repository``, or ``None`` if it is not known
+    :rtype: str
+    """
+    if not repository:
+        raise MissingArgument('No value for "repository" provided')
+    try:
+        resp = client.cluster.state(
+            metric='metadata',
+            filter_path=f'metadata.repositories.{escape_dots(repository)}.uuid',
+        )
+        uuid = resp['metadata']['repositories'][repository]['uuid']
+    except (KeyError, TypeError, es8exc.TransportError, es8exc.NotFoundError) as err:
+        logger.warning('Unable to get the UUID of repository %s: %s', repository, err)
+        return None
+    # A repository that has never been written to has no UUID yet
+    return None if uuid == '_na_' else uuid
+
+
+@begin_end()
+def get_shard_nodes(client, indices):
+    """
+    Calls `client.cat.` :py:meth:`~.elasticsearch.client.CatClient.shards` for only
+    the named ``indices``, in chunks, to find which nodes hold their shards.
+    Unassigned shards are skipped, and a relocating shard counts only against the
+    node it is relocating from.
+
+    :param client: A client connection object
+    :param indices: The index names to look up
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type indices: list
+
+    :returns: The names of the nodes that hold a shard of each index, keyed by
+        index name
+    :rtype: dict
+    """
+    retval = {idx: set() for idx in indices}
+    if not indices:
+        return retval
+    for chunk in chunk_index_list(indices):
+        try:
+            resp = client.cat.shards(index=to_csv(chunk), format='json', h='index,node')
+        except Exception as err:
+            raise FailedExecution(
+                f'Failed to get shard allocation for indices {chunk}. Error: {err}'
+            ) from err
+        for shard in resp:
+            if shard['index'] in retval and shard.get('node'):
+                # A relocating shard shows as "source -> ip id target"
+                retval[shard['index']].add(shard['node'].split(' -> ')[0])
+    debug.lv5('Shard nodes: %s', retval)
+    return retval
+
+
+@begin_end()
+def get_snapshot_data(client, repository=None, index_names=True, page_size=1000):
     """
     Get all snapshots from repository and return a list.
-    Calls :py:meth:`~.elasticsearch.client.SnapshotClient.get`
+    Calls :py:meth:`~.elasticsearch.client.SnapshotClient.get` once per page
+    of ``page_size`` snapshots, via :py:func:`iter_snapshot_data`
 
     :param client: A client connection object
     :param repository: The Elasticsearch snapshot repository to use
+    :param index_names: Whether to include the names of the indices in each
+        snapshot
+    :param page_size: The number of snapshots to get per request
 
     :type client: :py:class:`~.elasticsearch.Elasticsearch`
     :type repository: str
+    :type index_names: bool
+    :type page_size: int
 
     :returns: The list of all snapshots from ``repository``
     :rtype: list
     """
+    snapshots = []
+    for page in iter_snapshot_data(
+        client, repository=repository, index_names=index_names, page_size=page_size
+    ):
+        snapshots.extend(page)
+    return snapshots
+
+
+@begin_end()
+def get_snapshot_names(client, repository=None):
+    """
+    Get the names of all snapshots in ``repository``, and nothing else.
+    Calls :py:meth:`~.elasticsearch.client.SnapshotClient.get` with
+    ``verbose=False``, which only reads the repository's top-level metadata.
+
+    :param client: A client connection object
+    :param repository: The Elasticsearch snapshot repository to use
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type repository: str
+
+    :returns: The names of all snapshots in ``repository``
+    :rtype: list
+    """
     if not repository:
         raise MissingArgument('No value for "repository" provided')
     try:
-        return client.snapshot.get(repository=repository, snapshot="*")['snapshots']
+        resp = client.snapshot.get(
+            repository=repository,
+            snapshot='*',
+            verbose=False,
+            index_names=False,
+            filter_path='snapshots.snapshot',
+        )
     except (es8exc.TransportError, es8exc.NotFoundError) as err:
         msg = (
-            f'Unable to get snapshot information from repository: '
+            f'Unable to get snapshot names from repository: '
             f'{repository}. Error: {err}'
         )
         raise FailedExecution(msg) from err
+    return [snap['snapshot'] for snap in resp.get('snapshots', [])]
+
+
+@begin_end()
+def get_snapshot_index_sizes(client, repository=None, snapshot=''):
+    """
+    Get the size of each index in ``snapshot``.
+    Calls :py:meth:`~.elasticsearch.client.SnapshotClient.get` with
+    ``index_details=True`` and a ``filter_path`` for only the size of each index.
+
+    :param client: A client connection object
+    :param repository: The Elasticsearch snapshot repository to use
+    :param snapshot: The snapshot name
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type repository: str
+    :type snapshot: str
+
+    :returns: The size in bytes of each index in ``snapshot``, by name
+    :rtype: dict
+    """
+    if not repository:
+        raise MissingArgument('No value for "repository" provided')
+    try:
+        resp = client.snapshot.get(
+            repository=repository,
+            snapshot=snapshot,
+            index_details=True,
+            filter_path='snapshots.index_details.*.size_in_bytes',
+        )
+    except (es8exc.TransportError, es8exc.NotFoundError) as err:
+        msg = (
+            f'Unable to get the index details of snapshot {snapshot} from '
+            f'repository: {repository}.  Error: {err}'
+        )
+        raise FailedExecution(msg) from err
+    snapshots = resp.get('snapshots', [])
+    details = snapshots[0].get('index_details', {}) if snapshots else {}
+    return {idx: data['size_in_bytes'] for idx, data in details.items()}
+
+
+@begin_end()
+def get_snapshot_progress(client, repository=None, snapshot=''):
+    """
+    Get the shard and byte counts of a running snapshot.
+    Calls :py:meth:`~.elasticsearch.client.SnapshotClient.status` with a
+    ``filter_path`` that leaves out the per-index and per-shard details.
+
+    :param client: A client connection object
+    :param repository: The Elasticsearch snapshot repository to use
+    :param snapshot: The snapshot name
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type repository: str
+    :type snapshot: str
+
+    :returns: ``shards_done``, ``shards_total``, ``bytes_done``, ``bytes_total``
+        and ``time_in_millis``, or an empty :py:class:`dict` if the snapshot
+        status is not available
+    :rtype: dict
+    """
+    if not repository:
+        raise MissingArgument('No value for "repository" provided')
+    try:
+        resp = client.snapshot.status(
+            repository=repository,
+            snapshot=snapshot,
+            filter_path='snapshots.shards_stats,snapshots.stats',
+        )
+        shards = resp['snapshots'][0]['shards_stats']
+        stats = resp['snapshots'][0]['stats']
+        return {
+            'shards_done': shards['done'],
+            'shards_total': shards['total'],
+            # Only the incremental part of the snapshot has to be copied
+            'bytes_done': stats['processed']['size_in_bytes'],
+            'bytes_total': stats['incremental']['size_in_bytes'],
+            'time_in_millis': stats['time_in_millis'],
+        }
+    except (
+        IndexError,
+        KeyError,
+        TypeError,
+        es8exc.TransportError,
+        es8exc.NotFoundError,
+    ) as err:
+        debug.lv3('Unable to get the status of snapshot %s: %s', snapshot, err)
+        return {}
+
+
+@begin_end()
+def get_snapshot_state(client, repository=None, snapshot=''):
+    """
+    Get only the state of ``snapshot``.
+    Calls :py:meth:`~.elasticsearch.client.SnapshotClient.get` with
+    ``index_names=False`` and ``filter_path='snapshots.state'``, so that polling a
+    snapshot of many indices does not transfer the names of all of them.
+
+    :param client: A client connection object
+    :param repository: The Elasticsearch snapshot repository to use
+    :param snapshot: The snapshot name
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type repository: str
+    :type snapshot: str
+
+    :returns: The state of ``snapshot``, or ``None`` if it was not found
+    :rtype: str
+    """
+    if not repository:
+        raise MissingArgument('No value for "repository" provided')
+    try:
+        resp = client.snapshot.get(
+            repository=repository,
+            snapshot=snapshot,
+            index_names=False,
+            filter_path='snapshots.state',
+        )
+    except (es8exc.TransportError, es8exc.NotFoundError) as err:
+        msg = (
+            f'Unable to get the state of snapshot {snapshot} from repository: '
+            f'{repository}.  Error: {err}'
+        )
+        raise FailedExecution(msg) from err
+    snapshots = resp.get('snapshots', [])
+    return snapshots[0]['state'] if snapshots else None
+
+
+@begin_end()
+def get_snapshot_states(client, repository=None, snapshots=None):
+    """
+    Get only the states of ``snapshots``, with one request.
+    Calls :py:meth:`~.elasticsearch.client.SnapshotClient.get` with
+    ``index_names=False`` and a ``filter_path`` for only the name and state of
+    each snapshot.
+
+    :param client: A client connection object
+    :param repository: The Elasticsearch snapshot repository to use
+    :param snapshots: The snapshot names
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type repository: str
+    :type snapshots: list
+
+    :returns: The state of each snapshot found, by name
+    :rtype: dict
+    """
+    if not repository:
+        raise MissingArgument('No value for "repository" provided')
+    try:
+        resp = client.snapshot.get(
+            repository=repository,
+            snapshot=','.join(snapshots),
+            index_names=False,
+            filter_path='snapshots.snapshot,snapshots.state',
+        )
+    except (es8exc.TransportError, es8exc.NotFoundError) as err:
+        msg = (
+            f'Unable to get the state of snapshots {snapshots} from repository: '
+            f'{repository}.  Error: {err}'
+        )
+        raise FailedExecution(msg) from err
+    return {snap['snapshot']: snap['state'] for snap in resp.get('snapshots', [])}
 
 
 @begin_end()
@@ -364,6 +764,64 @@ def index_size(client, idx, value='total'):
     ]['size_in_bytes']
 
 
+def iter_snapshot_data(
+    client, repository=None, index_names=True, page_size=1000, from_sort_value=None
+):
+    """
+    Get all snapshots from repository, one page at a time, sorted by start time.
+    Calls :py:meth:`~.elasticsearch.client.SnapshotClient.get` with ``size``,
+    ``sort``, and ``after`` to page through the repository, so no single response
+    has to hold every snapshot.
+
+    :param client: A client connection object
+    :param repository: The Elasticsearch snapshot repository to use
+    :param index_names: Whether to include the names of the indices in each
+        snapshot. Leaving them out makes each response much smaller.
+    :param page_size: The number of snapshots to get per request
+    :param from_sort_value: If set, only get snapshots with a start time in epoch
+        milliseconds of at least this value
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type repository: str
+    :type index_names: bool
+    :type page_size: int
+    :type from_sort_value: int
+
+    :returns: A generator of lists of snapshots from ``repository``
+    :rtype: generator
+    """
+    if not repository:
+        raise MissingArgument('No value for "repository" provided')
+    kwargs = {
+        'repository': repository,
+        'snapshot': '*',
+        'size': page_size,
+        'sort': 'start_time',
+    }
+    if not index_names:
+        kwargs['index_names'] = False
+    if from_sort_value is not None:
+        kwargs['from_sort_value'] = str(from_sort_value)
+    while True:
+        try:
+            response = client.snapshot.get(**kwargs)
+        except (es8exc.TransportError, es8exc.NotFoundError) as err:
+            msg = (
+                f'Unable to get snapshot information from repository: '
+                f'{repository}. Error: {err}'
+            )
+            raise FailedExecution(msg) from err
+        debug.lv5('Got %s snapshots', len(response['snapshots']))
+        yield response['snapshots']
+        # The next value is only present if there are more snapshots to get
+        if not response.get('next'):
+            break
+        # The after cursor already starts past from_sort_value, and Elasticsearch
+        # rejects a request with both
+        kwargs.pop('from_sort_value', None)
+        kwargs['after'] = response['next']
+
+
 @begin_end()
 def meta_getter(client, idx, get=None):
     """Meta Getter
@@ -172,7 +172,10 @@ def rollable_alias(client, alias):
 @begin_end()
 def snapshot_running(client):
     """
-    Calls :py:meth:`~.elasticsearch.client.SnapshotClient.get_repository`
+    Calls :py:meth:`~.elasticsearch.client.ClusterClient.state` for only the
+    ``customs`` metric, with a ``filter_path`` that keeps just the names of the
+    snapshots in progress, rather than the status of every shard of every
+    running snapshot.
 
     Return ``True`` if a snapshot is in progress, and ``False`` if not
 
@@ -184,7 +187,10 @@ def snapshot_running(client):
     """
     status = ''
     try:
-        status = client.snapshot.status()['snapshots']
+        resp = client.cluster.state(
+            metric='customs', filter_path='snapshots.snapshots.snapshot'
+        )
+        status = resp.get('snapshots', {}).get('snapshots', [])
     # pylint: disable=broad-except
     except Exception as exc:
         report_failure(exc)
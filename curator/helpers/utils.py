@@ -3,8 +3,12 @@
 The kind that don't fit in testers, getters, date_ops, or converters
 """
 
+import heapq
+import json
+import os
 import re
 import logging
+from functools import lru_cache
 from es_client.helpers.utils import ensure_list
 from curator.debug import debug, begin_end
 from curator.exceptions import FailedExecution
@@ -40,6 +44,63 @@ def chunk_index_list(indices):
     return chunks
 
 
+def batch_by_size(sizes, max_count=0, max_size=0):
+    """
+    Split the keys of ``sizes``, in sorted order, into consecutive batches of at
+    most ``max_count`` keys, and a total size of at most ``max_size``. A key that
+    is larger than ``max_size`` on its own is placed in a batch by itself. A limit
+    of ``0`` is no limit.
+
+    :param sizes: The size of each item, e.g. index name and size in bytes
+    :param max_count: The maximum number of keys in a batch
+    :param max_size: The maximum total size of a batch
+
+    :type sizes: dict
+    :type max_count: int
+    :type max_size: int
+
+    :returns: The non-empty batches, each a list of keys of ``sizes``
+    :rtype: list
+    """
+    batches = []
+    batch = []
+    total = 0
+    for key in sorted(sizes):
+        full = max_count and len(batch) >= max_count
+        if batch and (full or (max_size and total + sizes[key] > max_size)):
+            batches.append(batch)
+            batch = []
+            total = 0
+        batch.append(key)
+        total += sizes[key]
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def partition_by_size(sizes, count):
+    """
+    Split the keys of ``sizes`` into at most ``count`` groups with totals as even
+    as possible. The largest are placed first, each in the group with the
+    smallest total so far.
+
+    :param sizes: The size of each item, e.g. index name and primary store size
+    :param count: The number of groups
+
+    :type sizes: dict
+    :type count: int
+
+    :returns: The non-empty groups, each a sorted list of keys of ``sizes``
+    :rtype: list
+    """
+    heap = [(0, num, []) for num in range(max(1, count))]
+    for key in sorted(sizes, key=lambda k: (-sizes[k], k)):
+        total, num, group = heapq.heappop(heap)
+        group.append(key)
+        heapq.heappush(heap, (total + sizes[key], num, group))
+    return [sorted(group) for _, _, group in sorted(heap, key=lambda x: x[1]) if group]
+
+
 def report_failure(exception):
     """
     Raise a :py:exc:`~.curator.exceptions.FailedExecution` exception and include
@@ -107,6 +168,28 @@ def to_csv(indices):
     return None
 
 
+def write_cache_file(path, data):
+    """
+    Write ``data`` to the cache file ``path`` as JSON, creating its directory if
+    needed. Errors are logged, not raised, as the cache is only an optimization.
+
+    :param path: The path to the cache file
+    :param data: The data to write
+
+    :type path: str
+    :type data: dict
+    """
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # Write to a temporary file and rename, so no reader sees a partial file
+        tmpfile = f'{path}.tmp'
+        with open(tmpfile, 'w', encoding='utf-8') as cache_file:
+            json.dump(data, cache_file)
+        os.replace(tmpfile, path)
+    except OSError as err:
+        logger.warning('Unable to write cache file %s: %s', path, err)
+
+
 @begin_end()
 def multitarget_fix(pattern: str) -> str:
     """
@@ -157,11 +240,91 @@ def regex_loop(matchstr: str, indices: list) -> list:
     :returns: The list of matching indices
     :rtype: list
     """
-    retval = []
-    for idx in indices:
-        if re.match(matchstr, idx):
-            retval.append(idx)
-    return retval
+    regex = re.compile(matchstr)
+    return [idx for idx in indices if regex.match(idx)]
+
+
+def _compile_targets(elements: list) -> tuple:
+    """
+    Compile the Python regex patterns in ``elements`` for
+    :py:func:`compile_multitarget`. Elements with no regex syntax other than an
+    escaped ``.`` are plain index names, and are kept in a set, indexed by length,
+    so they are matched by lookup. The rest become one anchored alternation.
+
+    :param elements: Python regex patterns, converted from multi-target syntax
+    :type elements: list
+
+    :returns: A tuple of a :py:class:`frozenset` of plain names, a
+        :py:class:`tuple` of their distinct lengths, and a compiled
+        :py:class:`re.Pattern` (or :py:class:`None`) for the rest
+    :rtype: tuple
+    """
+    names = set()
+    patterns = []
+    for element in elements:
+        # Without the escaped dots, a plain name has no regex syntax at all
+        if not set(element.replace('\\.', '')) & set('\\.^$*+?{}[]()|'):
+            names.add(element.replace('\\.', '.'))
+        else:
+            patterns.append(element)
+    regex = None
+    if patterns:
+        regex = re.compile('|'.join(f'(?:{x})' for x in patterns))
+    return frozenset(names), tuple(sorted({len(x) for x in names})), regex
+
+
+def _target_match(idx: str, targets: tuple) -> bool:
+    """
+    :param idx: An index name
+    :param targets: The output of :py:func:`_compile_targets`
+    :type idx: str
+    :type targets: tuple
+
+    :returns: Whether ``idx`` starts with one of the plain names or matches the
+        compiled pattern in ``targets``, the same as :py:func:`re.match` does
+    :rtype: bool
+    """
+    names, lengths, regex = targets
+    for length in lengths:
+        if length > len(idx):
+            break
+        if idx[:length] in names:
+            return True
+    return regex is not None and regex.match(idx) is not None
+
+
+@lru_cache(maxsize=64)
+def compile_multitarget(pattern: str) -> tuple:
+    """
+    Convert Elasticsearch multi-target syntax ``pattern`` into compiled include
+    and exclude matchers, for :py:func:`multitarget_match`. Each element is
+    matched from the start of the index name, as with :py:func:`re.match`.
+
+    The result is cached, so repeated calls with the same ``pattern`` do not
+    rebuild or recompile anything.
+
+    :param pattern: The Elasticsearch multi-target syntax pattern
+    :type pattern: str
+
+    :returns: A tuple of the include and exclude matchers, each the output of
+        :py:func:`_compile_targets`
+    :rtype: tuple
+    """
+    includes = []
+    excludes = []
+    elements = multitarget_fix(pattern).split(',')
+    debug.lv5('Individual elements of pattern: %s', elements)
+    for element in elements:
+        # Any index prepended with a . is probably a hidden index, but
+        # we need to escape the . for regex to treat it as a literal.
+        # Replace Elasticsearch wildcard * with .* for Python regex
+        matchstr = element.replace('.', '\\.').replace('*', '.*')
+        # Exclude elements are prefixed with '-', which is not part of the regex
+        if element.startswith('-'):
+            excludes.append(matchstr[1:])
+        else:
+            includes.append(matchstr)
+    return _compile_targets(includes), _compile_targets(excludes)
 
 
 @begin_end()
@@ -171,6 +334,9 @@ def multitarget_match(pattern: str, index_list: list) -> list:
     patterns. Match against ``index_list`` and return the list of matches while
     excluding any negative matches.
 
+    The pattern is compiled once by :py:func:`compile_multitarget`, so each index
+    is tested once against the includes, and once against the excludes.
+
     :param pattern: The Elasticsearch multi-target syntax pattern
     :param index_list: The list of indices to match against
     :type pattern: str
@@ -181,35 +347,16 @@ def multitarget_match(pattern: str, index_list: list) -> list:
     """
     retval = []
     excluded = []
-    includes = []
-    excludes = []
     logger.debug('Multi-target syntax pattern: %s', pattern)
-    elements = multitarget_fix(pattern).split(',')
-    logger.debug('Individual elements of pattern: %s', elements)
-    for element in elements:
-        # Exclude elements are prefixed with '-'
-        exclude = element.startswith('-')
-        # Any index prepended with a . is probably a hidden index, but
-        # we need to escape the . for regex to treat it as a literal
-        matchstr = element.replace('.', '\\.')
-        # Replace Elasticsearch wildcard * with .* for Python regex
-        matchstr = matchstr.replace('*', '.*')
-        # logger.debug('matchstr: %s', matchstr)
-        # If it is not an exclude, add the output of regex_loop to `includes`
-        if not exclude:
-            includes += regex_loop(matchstr, index_list)
-        # If it is an exclude pattern, add the output of regex_loop to `excludes`
-        # Remove the `-` from the matchstr ([1:]) before sending.
-        if exclude:
-            excludes += regex_loop(matchstr[1:], index_list)
-    # Create a unique list of indices to loop through
-    for idx in list(set(includes)):
-        # If idx is not in the unique list of excludes, add it to retval
-        if idx not in list(set(excludes)):
-            retval.append(idx)
-        else:
-            # Otherwise, add it to the excludes
+    includes, excludes = compile_multitarget(pattern)
+    # A set removes any duplicates in index_list
+    for idx in set(index_list):
+        if not _target_match(idx, includes):
+            continue
+        if _target_match(idx, excludes):
             excluded.append(idx)
+        else:
+            retval.append(idx)
     # Sort the lists alphabetically
     retval.sort()
     excluded.sort()
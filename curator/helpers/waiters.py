@@ -4,8 +4,9 @@
 """
 
 import logging
+import threading
 import warnings
-from time import localtime, sleep, strftime
+from time import localtime, monotonic, sleep, strftime
 from datetime import datetime
 from elasticsearch8.exceptions import GeneralAvailabilityWarning
 from curator.debug import debug, begin_end
@@ -16,10 +17,123 @@ from curator.exceptions import (
     FailedReindex,
     MissingArgument,
 )
+from curator.helpers.getters import (
+    byte_size,
+    get_snapshot_progress,
+    get_snapshot_state,
+    get_snapshot_states,
+)
 from curator.helpers.utils import chunk_index_list
 
 logger = logging.getLogger(__name__)
 
+#: The shortest time, in seconds, that :py:class:`PendingTasksPacer` backs off for
+PACING_MIN_DELAY = 1
+#: The longest time, in seconds, that :py:class:`PendingTasksPacer` backs off for
+PACING_MAX_DELAY = 60
+#: The longest time, in seconds, that :py:class:`PendingTasksPacer` waits for the
+#: pending task queue to drain before it lets a request through anyway
+PACING_MAX_WAIT = 600
+
+
+class PendingTasksPacer:
+    """
+    Paces requests that create cluster state update tasks, such as deleting,
+    closing or opening indices, or changing their settings, so that the queue of
+    pending tasks on the master node does not keep growing.
+
+    Before each request, :py:meth:`wait` samples the number of pending tasks and
+    the age of the oldest one. While there are :py:attr:`max_pending_tasks` or
+    more, it backs off, doubling the delay each time, up to
+    :py:data:`PACING_MAX_DELAY`. Once the queue is short enough, the delay is
+    halved for each request, so the pace picks up again as the queue drains.
+
+    :param client: A client connection object
+    :param max_pending_tasks: Back off while there are at least this many pending
+        cluster tasks. ``0`` disables pacing.
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type max_pending_tasks: int
+    """
+
+    def __init__(self, client, max_pending_tasks=0):
+        #: Object attribute that gets the value of param ``client``
+        self.client = client
+        #: Object attribute that gets the value of param ``max_pending_tasks``
+        self.max_pending_tasks = max_pending_tasks
+        #: The current delay between requests, in seconds
+        self.delay = 0
+        # Requests sent from several threads share the delay
+        self.lock = threading.Lock()
+
+    def pending_tasks(self):
+        """
+        Calls `client.cluster.` :py:meth:`~.elasticsearch.client.ClusterClient.health`
+        with a ``filter_path`` for only the pending task count and age, which is
+        much cheaper than listing the pending tasks.
+
+        :returns: The number of pending cluster tasks, and how long the oldest has
+            been waiting, in milliseconds
+        :rtype: tuple
+        """
+        resp = self.client.cluster.health(
+            filter_path='number_of_pending_tasks,task_max_waiting_in_queue_millis'
+        )
+        return (
+            resp.get('number_of_pending_tasks', 0),
+            resp.get('task_max_waiting_in_queue_millis', 0),
+        )
+
+    def wait(self):
+        """
+        Wait until the pending task queue is shorter than
+        :py:attr:`max_pending_tasks`, then for the current :py:attr:`delay`, if
+        any. Gives up waiting for the queue after :py:data:`PACING_MAX_WAIT`
+        seconds, or if the queue cannot be sampled.
+        """
+        if not self.max_pending_tasks:
+            return
+        with self.lock:
+            waited = 0
+            while True:
+                try:
+                    count, oldest = self.pending_tasks()
+                # pylint: disable=broad-except
+                except Exception as err:
+                    logger.warning('Unable to check pending cluster tasks: %s', err)
+                    break
+                if count < self.max_pending_tasks:
+                    # Speed up again as the queue drains
+                    self.delay = (
+                        self.delay / 2 if self.delay >= 2 * PACING_MIN_DELAY else 0
+                    )
+                    break
+                if waited >= PACING_MAX_WAIT:
+                    logger.warning(
+                        'Still %s pending cluster tasks after %s seconds. '
+                        'Continuing anyway.',
+                        count,
+                        waited,
+                    )
+                    break
+                # Wait at least as long as the oldest task has been waiting
+                self.delay = min(
+                    PACING_MAX_DELAY,
+                    max(2 * self.delay, PACING_MIN_DELAY, oldest / 1000),
+                )
+                logger.info(
+                    '%s pending cluster tasks, the oldest waiting for %s ms. '
+                    'Waiting %.1f seconds.',
+                    count,
+                    oldest,
+                    self.delay,
+                )
+                sleep(self.delay)
+                waited += self.delay
+            if self.delay:
+                debug.lv3('Pacing cluster state updates by %.1f seconds', self.delay)
+                sleep(self.delay)
+
 
 @begin_end()
 def health_check(client, **kwargs):
@@ -94,65 +208,132 @@ def relocate_check(client, index):
     return finished_state
 
 
-@begin_end()
-def restore_check(client, index_list):
+#: The only parts of the recovery API response that :py:func:`restore_check` reads
+RECOVERY_FILTER = '*.shards.stage,*.shards.index.size.recovered_in_bytes'
+
+
+def _recovery(client, indices, **kwargs):
     """
-    This function calls `client.indices.`
-    :py:meth:`~.elasticsearch.client.IndicesClient.recovery`
-    with the list of indices to check for complete recovery.  It will return ``True``
-    if recovery of those indices is complete, and ``False`` otherwise.  It is
-    designed to fail fast: if a single shard is encountered that is still recovering
-    (not in ``DONE`` stage), it will immediately return ``False``, rather than
-    complete iterating over the rest of the response.
+    Call `client.indices.` :py:meth:`~.elasticsearch.client.IndicesClient.recovery`
+    for ``indices``, in chunks, with :py:data:`RECOVERY_FILTER`.
 
     :param client: A client connection object
-    :param index_list: The list of indices to verify having been restored.
-    :param kwargs: Any additional keyword arguments to pass to the function
+    :param indices: The indices to get the recovery information of
+    :param kwargs: Any additional keyword arguments to pass to the API call
 
     :type client: :py:class:`~.elasticsearch.Elasticsearch`
-    :type index_list: list
+    :type indices: list
 
-    :rtype: bool
+    :returns: The merged responses, by index name
+    :rtype: dict
     """
     response = {}
-
-    for chunk in chunk_index_list(index_list):
+    if not indices:
+        return response
+    for chunk in chunk_index_list(indices):
         try:
-            chunk_response = client.indices.recovery(index=chunk, human=True)
+            response.update(
+                client.indices.recovery(
+                    index=chunk, filter_path=RECOVERY_FILTER, **kwargs
+                )
+            )
         except Exception as err:
             msg = (
                 f'Unable to obtain recovery information for specified indices. '
                 f'Error: {err}'
             )
             raise CuratorException(msg) from err
-        if chunk_response == {}:
-            debug.lv3('_recovery returned an empty response. Trying again.')
-            return False
-        response.update(chunk_response)
-    debug.lv2('Provided indices: %s', index_list)
-    debug.lv2('Found indices: %s', list(response.keys()))
-    # pylint: disable=consider-using-dict-items
-    for index in response:
-        for shard in range(0, len(response[index]['shards'])):
-            stage = response[index]['shards'][shard]['stage']
-            if stage != 'DONE':
-                debug.lv2('Index "%s" is still in stage "%s"', index, stage)
-                return False
-
-    # If we've gotten here, all of the indices have recovered
-    return True
+    return response
+
+
+def log_restore_progress(state, total):
+    """
+    Log how many of ``total`` indices have recovered, how many bytes have been
+    recovered, and the rate since the previous call with the same ``state``.
+
+    :param state: The state kept by :py:func:`restore_check` between polls
+    :param total: The number of indices being restored
+
+    :type state: dict
+    :type total: int
+    """
+    recovered = state['done_bytes'] + state['active_bytes']
+    now = monotonic()
+    msg = (
+        f'Restore: {len(state["done"])} of {total} indices recovered, '
+        f'{byte_size(recovered)} so far'
+    )
+    if 'last' in state:
+        last_time, last_bytes = state['last']
+        if now > last_time:
+            rate = max(0, recovered - last_bytes) / (now - last_time)
+            msg += f', {byte_size(rate)}/s'
+    state['last'] = (now, recovered)
+    logger.info(msg)
 
 
 @begin_end()
-def snapshot_check(client, snapshot=None, repository=None):
+def restore_check(client, index_list, state=None):
     """
-    This function calls `client.snapshot.`
-    :py:meth:`~.elasticsearch.client.SnapshotClient.get` and tests to see whether
-    the snapshot is complete, and if so, with what status.  It will log errors
-    according to the result. If the snapshot is still ``IN_PROGRESS``, it will
-    return ``False``. ``SUCCESS`` will be an ``INFO`` level message, ``PARTIAL``
-    nets a ``WARNING`` message, ``FAILED`` is an ``ERROR``, message, and all
-    others will be a ``WARNING`` level message.
+    This function calls `client.indices.`
+    :py:meth:`~.elasticsearch.client.IndicesClient.recovery`
+    with the list of indices to check for complete recovery.  It will return ``True``
+    if recovery of those indices is complete, and ``False`` otherwise.
+
+    Only the shard stages and recovered bytes are requested. The indices that are
+    still recovering are found with ``active_only=True``. Any others are checked
+    once more without it, to tell completed recoveries from ones that have not
+    started yet. Indices with every shard in stage ``DONE`` are added to
+    ``state['done']``, and are not requested again on later calls with the same
+    ``state``, which :py:func:`wait_for_it` keeps for the whole wait. The indices
+    and bytes recovered so far, and the rate since the last call, are logged with
+    :py:func:`log_restore_progress`.
+
+    :param client: A client connection object
+    :param index_list: The list of indices to verify having been restored.
+    :param state: The indices known to be done, and the byte counts for the
+        progress log, kept between calls
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type index_list: list
+    :type state: dict
+
+    :rtype: bool
+    """
+    if state is None:
+        state = {}
+    done = state.setdefault('done', set())
+    state.setdefault('done_bytes', 0)
+    pending = [idx for idx in index_list if idx not in done]
+    debug.lv2('Indices still to recover: %s', pending)
+    active = _recovery(client, pending, active_only=True)
+    # An index without active recoveries is either done, or not started yet
+    response = _recovery(client, [idx for idx in pending if idx not in active])
+    response.update(active)
+    debug.lv2('Found indices: %s', list(response.keys()))
+    state['active_bytes'] = 0
+    for index, data in response.items():
+        shards = data.get('shards', [])
+        recovered = sum(
+            shard.get('index', {}).get('size', {}).get('recovered_in_bytes', 0)
+            for shard in shards
+        )
+        stages = {shard['stage'] for shard in shards}
+        if index in pending and stages == {'DONE'}:
+            done.add(index)
+            state['done_bytes'] += recovered
+        else:
+            debug.lv2('Index "%s" is still in stages %s', index, stages)
+            state['active_bytes'] += recovered
+    log_restore_progress(state, len(index_list))
+    # If all of the indices are done, they have all recovered
+    return all(idx in done for idx in index_list)
+
+
+def log_snapshot_progress(client, snapshot=None, repository=None):
+    """
+    Log how many shards and bytes of a running snapshot are done, and an estimate
+    of the time left, based on the rate so far.
 
     :param client: A client connection object
     :param snapshot: The snapshot name
@@ -162,33 +343,96 @@ def snapshot_check(client, snapshot=None, repository=None):
     :type snapshot: str
     :type repository: str
 
+    :returns: The values from
+        :py:func:`~.curator.helpers.getters.get_snapshot_progress`
+    :rtype: dict
+    """
+    prog = get_snapshot_progress(client, repository=repository, snapshot=snapshot)
+    if not prog:
+        return prog
+    msg = (
+        f'Snapshot {snapshot}: {prog["shards_done"]} of {prog["shards_total"]} '
+        f'shards done, {byte_size(prog["bytes_done"])} of '
+        f'{byte_size(prog["bytes_total"])} copied'
+    )
+    if 0 < prog['bytes_done'] < prog['bytes_total']:
+        remaining = prog['bytes_total'] - prog['bytes_done']
+        eta = prog['time_in_millis'] / 1000 * remaining / prog['bytes_done']
+        msg += f', about {int(eta)} seconds left'
+    logger.info(msg)
+    return prog
+
+
+@begin_end()
+def snapshot_check(client, snapshot=None, repository=None, progress=False):
+    """
+    This function calls
+    :py:func:`~.curator.helpers.getters.get_snapshot_state`, which only gets the
+    snapshot state, and tests to see whether the snapshot is complete, and if so,
+    with what status.  It will log errors according to the result. If the
+    snapshot is still ``IN_PROGRESS``, it will return ``False``. ``SUCCESS`` will
+    be an ``INFO`` level message, ``PARTIAL`` nets a ``WARNING`` message,
+    ``FAILED`` is an ``ERROR``, message, and all others will be a ``WARNING``
+    level message.
+
+    If ``progress`` is ``True`` and the snapshot is still ``IN_PROGRESS``, the
+    shards and bytes done so far, and an estimate of the time left, are logged
+    from :py:func:`~.curator.helpers.getters.get_snapshot_progress`.
+
+    :param client: A client connection object
+    :param snapshot: The snapshot name, or a list of names to check with a single
+        request, all of which must be complete to return ``True``
+    :param repository: The repository name
+    :param progress: Whether to log the progress of a running snapshot
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type snapshot: str or list
+    :type repository: str
+    :type progress: bool
+
     :rtype: bool
     """
     debug.lv3('SNAPSHOT: %s', snapshot)
     debug.lv3('REPOSITORY: %s', repository)
+    names = snapshot if isinstance(snapshot, list) else [snapshot]
     try:
-        result = client.snapshot.get(repository=repository, snapshot=snapshot)
-        debug.lv3('RESULT: %s', result)
+        if len(names) == 1:
+            states = {
+                names[0]: get_snapshot_state(
+                    client, repository=repository, snapshot=names[0]
+                )
+            }
+        else:
+            states = get_snapshot_states(client, repository=repository, snapshots=names)
     except Exception as err:
         raise CuratorException(
             f'Unable to obtain information for snapshot "{snapshot}" in repository '
             f'"{repository}". Error: {err}'
         ) from err
-    state = result['snapshots'][0]['state']
-    debug.lv3('Snapshot state = %s', state)
-    retval = True
-    if state == 'IN_PROGRESS':
-        debug.lv1('Snapshot %s still in progress.', snapshot)
-        retval = False
-    elif state == 'SUCCESS':
-        logger.info('Snapshot %s successfully completed.', snapshot)
-    elif state == 'PARTIAL':
-        logger.warning('Snapshot %s completed with state PARTIAL.', snapshot)
-    elif state == 'FAILED':
-        logger.error('Snapshot %s completed with state FAILED.', snapshot)
-    else:
-        logger.warning('Snapshot %s completed with state: %s', snapshot, state)
-    return retval
+    for name in names:
+        if states.get(name) is None:
+            raise CuratorException(
+                f'Snapshot "{name}" not found in repository "{repository}"'
+            )
+    debug.lv3('Snapshot state = %s', states)
+    running = [name for name in names if states[name] == 'IN_PROGRESS']
+    if running:
+        for name in running:
+            debug.lv1('Snapshot %s still in progress.', name)
+            if progress:
+                log_snapshot_progress(client, snapshot=name, repository=repository)
+        return False
+    for name in names:
+        state = states[name]
+        if state == 'SUCCESS':
+            logger.info('Snapshot %s successfully completed.', name)
+        elif state == 'PARTIAL':
+            logger.warning('Snapshot %s completed with state PARTIAL.', name)
+        elif state == 'FAILED':
+            logger.error('Snapshot %s completed with state FAILED.', name)
+        else:
+            logger.warning('Snapshot %s completed with state: %s', name, state)
+    return True
 
 
 @begin_end()
@@ -295,7 +539,7 @@ def wait_for_it(
         },
         'restore': {
             'function': restore_check,
-            'args': {'index_list': index_list},
+            'args': {'index_list': index_list, 'state': {}},
         },
         'reindex': {'function': task_check, 'args': {'task_id': task_id}},
         'shrink': {'function': health_check, 'args': {'status': 'green'}},
@@ -2,7 +2,7 @@
 
 # pylint: disable=R0904,R0913,R0917
 import re
-import itertools
+import heapq
 import logging
 from elasticsearch8.exceptions import NotFoundError, TransportError
 from es_client.helpers.schemacheck import SchemaCheck
@@ -20,9 +20,10 @@ from curator.helpers.date_ops import (
     date_range,
     fix_epoch,
     get_date_regex,
+    get_name_epoch,
     get_point_of_reference,
     get_unit_count_from_name,
-    TimestringSearch,
+    iso2epoch,
 )
 from curator.helpers.getters import byte_size, get_indices
 from curator.helpers.testers import verify_client_object
@@ -135,6 +136,7 @@ class IndexList:
             'allocated': self.filter_allocated,
             'closed': self.filter_closed,
             'count': self.filter_by_count,
+            'deleted_docs': self.filter_deleted_docs,
             'empty': self.filter_empty,
             'forcemerged': self.filter_forceMerged,
             'ilm': self.filter_ilm,
@@ -149,6 +151,13 @@ class IndexList:
         }
         return methods[ftype]
 
+    def __is_pattern_filter(self, fil):
+        """Validate ``fil`` and return ``True`` if it is a ``pattern`` filter"""
+        SchemaCheck(
+            fil, filterstructure(), 'filter', 'IndexList.iterate_filters'
+        ).result()
+        return fil['filtertype'] == 'pattern'
+
     def __remove_missing(self, err):
         """
         Remove missing index found in ``err`` from self.indices and return that name
@@ -164,6 +173,7 @@ class IndexList:
         return {
             'age': {'creation_date': 0, 'name': 0},
             'docs': 0,
+            'docs_deleted': 0,
             'number_of_replicas': 0,
             'number_of_shards': 0,
             'primary_size_in_bytes': 0,
@@ -375,6 +385,34 @@ class IndexList:
                 sii['number_of_shards'] = wli['settings']['index']['number_of_shards']
                 if 'routing' in wli['settings']['index']:
                     sii['routing'] = wli['settings']['index']['routing']
+                self._get_settings_dates(sii['age'], wli['settings']['index'])
+
+    def _get_settings_dates(self, data, settings_index):
+        """
+        Populate ``data`` (the ``age`` dictionary in ``index_info`` for one index)
+        with the dates found in the ``index`` settings of that index, if present:
+
+            origination_date (from ``index.lifecycle.origination_date``)
+            start_time (from ``index.time_series.start_time``)
+            end_time (from ``index.time_series.end_time``)
+
+        :param data: The ``age`` dictionary for one index in ``index_info``
+        :type data: dict
+        :param settings_index: The ``index`` settings from the get_settings API
+        :type settings_index: dict
+        """
+        sources = {
+            'origination_date': ('lifecycle', 'origination_date'),
+            'start_time': ('time_series', 'start_time'),
+            'end_time': ('time_series', 'end_time'),
+        }
+        for key, (group, setting) in sources.items():
+            try:
+                data[key] = iso2epoch(settings_index[group][setting])
+            except KeyError:
+                continue
+            except ValueError as exc:
+                logger.warning('Unable to read index.%s.%s: %s', group, setting, exc)
 
     @begin_end()
     def get_index_state(self):
@@ -411,10 +449,11 @@ class IndexList:
     def get_index_stats(self):
         """
         Populate ``index_info`` with index ``size_in_bytes``,
-        ``primary_size_in_bytes`` and doc count information for each index.
+        ``primary_size_in_bytes`` and doc count and deleted doc count information
+        for each index.
         """
         self.empty_list_check()
-        fields = ['size_in_bytes', 'docs', 'primary_size_in_bytes']
+        fields = ['size_in_bytes', 'docs', 'docs_deleted', 'primary_size_in_bytes']
         # This ensures that the index state is populated
         self.get_index_state()
         # Don't populate working_list until after the get_index state as it
@@ -440,14 +479,17 @@ class IndexList:
                     try:
                         size = wli['total']['store']['size_in_bytes']
                         docs = wli['total']['docs']['count']
+                        deleted = wli['total']['docs'].get('deleted', 0)
                         primary_size = wli['primaries']['store']['size_in_bytes']
                         msg = (
-                            f'Index: {index}  Size: {byte_size(size)}  Docs: {docs} '
+                            f'Index: {index}  Size: {byte_size(size)}  Docs: {docs}  '
+                            f'Deleted: {deleted}  '
                             f'PrimarySize: {byte_size(primary_size)}'
                         )
                         debug.lv3(msg)
                         sii['size_in_bytes'] = size
                         sii['docs'] = docs
+                        sii['docs_deleted'] = deleted
                         sii['primary_size_in_bytes'] = primary_size
                     except KeyError:
                         msg = f'Index stats missing for "{index}" -- might be closed'
@@ -496,9 +538,8 @@ class IndexList:
         """
         # Check for empty list before proceeding here to prevent non-iterable condition
         self.empty_list_check()
-        tstr = TimestringSearch(timestring)
         for index in self.working_list():
-            epoch = tstr.get_epoch(index)
+            epoch = get_name_epoch(timestring, index)
             if isinstance(epoch, int):
                 self.index_info[index]['age']['name'] = epoch
             else:
@@ -562,14 +603,14 @@ class IndexList:
         Set instance variable ``age_keyfield`` for use later, if needed.
 
         :param source: Source of index age. Can be: ``name``, ``creation_date``,
-            or ``field_stats``
+            ``field_stats``, or ``settings``
         :param timestring: An :py:func:`time.strftime` string to match the datestamp
             in an index name. Only used for index filtering by ``name``.
         :param field: A timestamp field name.  Only used for ``field_stats`` based
             calculations.
         :param stats_result: Either ``min_value`` or ``max_value``.  Only used
-            in conjunction with ``source=field_stats`` to choose whether to reference
-            the min or max result value.
+            in conjunction with ``source=field_stats`` or ``source=settings`` to
+            choose whether to reference the min or max result value.
         """
         self.age_keyfield = source
         if source == 'name':
@@ -590,21 +631,78 @@ class IndexList:
                 raise ValueError(f'Invalid value for "stats_result": {stats_result}')
             self.age_keyfield = stats_result
             self._get_field_stats_dates(field=field)
+        elif source == 'settings':
+            if stats_result not in ['min_value', 'max_value']:
+                raise ValueError(f'Invalid value for "stats_result": {stats_result}')
+            self._get_settings_ages(stats_result)
         else:
             raise ValueError(
                 f'Invalid source: {source}. Must be one of "name", "creation_date", '
-                f'"field_stats".'
+                f'"field_stats", "settings".'
             )
 
+    def _get_settings_ages(self, stats_result):
+        """
+        Set the ``settings`` age of each index from the dates already collected by
+        :py:meth:`get_index_settings`, so no extra API calls are made.
+
+        With ``min_value``, this is ``index.time_series.start_time`` for time
+        series backing indices, or else ``index.lifecycle.origination_date``. With
+        ``max_value``, it is ``index.time_series.end_time``, or else
+        ``index.lifecycle.origination_date``. Indices with none of these settings
+        get no ``settings`` age, and are removed by the filters that use it.
+
+        :param stats_result: Either ``min_value`` or ``max_value``
+        :type stats_result: str
+        """
+        bound = 'start_time' if stats_result == 'min_value' else 'end_time'
+        for index in self.working_list():
+            data = self.index_info[index]['age']
+            for key in (bound, 'origination_date'):
+                if key in data:
+                    data['settings'] = data[key]
+                    break
+            else:
+                debug.lv3('No date settings found for index %s', index)
+
+    def _get_group_regex(self, pattern):
+        """
+        Compile ``pattern`` and ensure that it has one and only one capture group.
+
+        :param pattern: A regular expression with a single capture group
+
+        :returns: The compiled regular expression
+        :rtype: :py:class:`re.Pattern`
+        """
+        try:
+            regex = re.compile(pattern)
+            if regex.groups < 1:
+                raise ConfigurationError(
+                    f'No regular expression group found in {pattern}'
+                )
+            if regex.groups > 1:
+                raise ConfigurationError(
+                    f'More than 1 regular expression group found in {pattern}'
+                )
+        except Exception as exc:
+            raise ActionError(
+                f'Unable to process pattern: "{pattern}". Error: {exc}'
+            ) from exc
+        return regex
+
     @begin_end()
-    def _sort_by_age(self, index_list, reverse=True):
+    def _get_ages(self, index_list):
         """
-        Take a list of indices and sort them by date.
+        Map each index in ``index_list`` to its age, as previously calculated by
+        :py:meth:`_calculate_ages`. Indices without an age are removed from the
+        actionable list.
 
-        By default, the youngest are first with ``reverse=True``, but the oldest
-        can be first by setting ``reverse=False``
+        :param index_list: A list of indices
+        :type index_list: list
+
+        :returns: A dictionary of index names to ages in epoch seconds
+        :rtype: dict
         """
-        # Do the age-based sorting here.
         # Build an temporary dictionary with just index and age as the key and
         # value, respectively
         temp = {}
@@ -624,6 +722,16 @@ class IndexList:
                     f'metadata'
                 )
                 self.__excludify(True, True, index, msg)
+        return temp
+
+    def _sort_by_age(self, index_list, reverse=True):
+        """
+        Take a list of indices and sort them by date.
+
+        By default, the youngest are first with ``reverse=True``, but the oldest
+        can be first by setting ``reverse=False``
+        """
+        temp = self._get_ages(index_list)
         # Sort alphabetically prior to age sort to keep sorting consistent
         temp_tuple = sorted(temp.items(), key=lambda k: k[0], reverse=reverse)
         # If reverse is True, this will sort so the youngest indices are first.
@@ -633,20 +741,18 @@ class IndexList:
         sorted_tuple = sorted(temp_tuple, key=lambda k: k[1], reverse=reverse)
         return [x[0] for x in sorted_tuple]
 
-    @begin_end()
-    def filter_by_regex(self, kind=None, value=None, exclude=False):
+    def _compile_regex_filter(self, kind, value):
         """
-        Match indices by regular expression (pattern).
+        Validate ``kind`` and ``value`` and return the compiled regular expression
+        for a ``pattern`` filter.
 
         :param kind: Can be one of: ``suffix``, ``prefix``, ``regex``, or
-            ``timestring``. This option defines what ``kind`` of filter you will
-            be building.
-        :param value: Depends on ``kind``. It is the :py:func:`time.strftime` string if
-            ``kind`` is ``timestring``. It's used to build the regular expression
-            for other kinds.
-        :param exclude: If ``exclude=True``, this filter will remove matching
-            indices from ``indices``. If ``exclude=False``, then only matching
-            indices will be kept in ``indices``. Default is ``False``
+            ``timestring``.
+        :param value: The :py:func:`time.strftime` string if ``kind`` is
+            ``timestring``, otherwise the value used to build the regular expression.
+
+        :returns: A compiled regular expression
+        :rtype: :py:class:`re.Pattern`
         """
         if kind not in ['regex', 'prefix', 'suffix', 'timestring']:
             raise ValueError(f'{kind}: Invalid value for kind')
@@ -661,15 +767,88 @@ class IndexList:
             regex = settings.regex_map()[kind].format(get_date_regex(value))
         else:
             regex = settings.regex_map()[kind].format(value)
+        return re.compile(regex)
+
+    @begin_end()
+    def filter_by_regex(self, kind=None, value=None, exclude=False):
+        """
+        Match indices by regular expression (pattern).
+
+        :param kind: Can be one of: ``suffix``, ``prefix``, ``regex``, or
+            ``timestring``. This option defines what ``kind`` of filter you will
+            be building.
+        :param value: Depends on ``kind``. It is the :py:func:`time.strftime` string if
+            ``kind`` is ``timestring``. It's used to build the regular expression
+            for other kinds.
+        :param exclude: If ``exclude=True``, this filter will remove matching
+            indices from ``indices``. If ``exclude=False``, then only matching
+            indices will be kept in ``indices``. Default is ``False``
+        """
+        pattern = self._compile_regex_filter(kind, value)
         self.empty_list_check()
-        pattern = re.compile(regex)
-        for index in self.working_list():
+        keep = []
+        for index in self.indices:
             debug.lv3('Filter by regex: Index: %s', index)
-            match = pattern.search(index)
-            if match:
-                self.__excludify(True, exclude, index)
+            if bool(pattern.search(index)) == bool(exclude):
+                debug.lv3('Index %s is not actionable, removing from list.', index)
             else:
-                self.__excludify(False, exclude, index)
+                debug.lv3('Index %s is actionable and remains in the list.', index)
+                keep.append(index)
+        # Rebuild the list once, rather than removing each index in turn
+        self.indices[:] = keep
+
+    @begin_end()
+    def filter_by_regex_chain(self, patterns):
+        """
+        Apply several ``pattern`` filters in a single pass over ``indices``.
+
+        The result is identical to calling :py:meth:`filter_by_regex` once for each
+        entry of ``patterns`` in order, but each index name is tested against the
+        pre-compiled expressions only until one of them rejects it, and all
+        rejected indices are removed from ``indices`` in one batch.
+
+        :param patterns: A list of dictionaries, each with the ``kind``, ``value``,
+            and (optional) ``exclude`` keys accepted by :py:meth:`filter_by_regex`
+        :type patterns: list
+        """
+        # Compile (and validate) everything up front
+        compiled = []
+        for pat in patterns:
+            unknown = sorted(set(pat) - {'kind', 'value', 'exclude'})
+            if unknown:
+                raise ConfigurationError(
+                    f'Unexpected keys {unknown} in pattern filter: {pat}'
+                )
+            compiled.append(
+                (
+                    self._compile_regex_filter(pat.get('kind'), pat.get('value')),
+                    bool(pat.get('exclude', False)),
+                )
+            )
+        self.empty_list_check()
+        keep = []
+        # The position of the last filter that removed at least one index. A
+        # sequential run raises NoIndices when a filter is handed an empty list, so
+        # that behavior is preserved here.
+        last_rejecting = -1
+        for index in self.indices:
+            debug.lv3('Filter by regex chain: Index: %s', index)
+            for pos, (pattern, exclude) in enumerate(compiled):
+                if bool(pattern.search(index)) == exclude:
+                    debug.lv3(
+                        'Removed from actionable list: %s (pattern #%s: %s)',
+                        index,
+                        pos,
+                        pattern.pattern,
+                    )
+                    last_rejecting = max(last_rejecting, pos)
+                    break
+            else:
+                debug.lv3('Remains in actionable list: %s', index)
+                keep.append(index)
+        self.indices[:] = keep
+        if not keep and last_rejecting < len(compiled) - 1:
+            self.empty_list_check()
 
     @begin_end()
     def filter_by_age(
@@ -689,7 +868,7 @@ class IndexList:
         Match indices by relative age calculations.
 
         :param source: Source of index age. Can be one of ``name``, ``creation_date``,
-            or ``field_stats``
+            ``field_stats``, or ``settings``
         :param direction: Time to filter, either ``older`` or ``younger``
         :param timestring: An :py:func:`time.strftime` string to match the datestamp
             in an index name. Only used for index filtering by ``name``.
@@ -702,8 +881,8 @@ class IndexList:
         :param field: A timestamp field name.  Only used for ``field_stats`` based
             calculations.
         :param stats_result: Either ``min_value`` or ``max_value``.  Only used
-            in conjunction with ``source=field_stats`` to choose whether to reference
-            the minimum or maximum result value.
+            in conjunction with ``source=field_stats`` or ``source=settings`` to
+            choose whether to reference the minimum or maximum result value.
         :param epoch: An epoch timestamp used in conjunction with ``unit`` and
             ``unit_count`` to establish a point of reference for calculations.
             If not provided, the current time will be used.
@@ -822,6 +1001,7 @@ class IndexList:
         stats_result='min_value',
         exclude=False,
         threshold_behavior='greater_than',
+        pattern=None,
     ):
         """
         Remove indices from the actionable list based on space consumed, sorted
@@ -845,6 +1025,12 @@ class IndexList:
         if it the index tests to be larger than ``disk_space``. When set to
         ``less_than``, it includes if the index is smaller than ``disk_space``
 
+        ``pattern`` allows one ``space`` filter to enforce a separate budget of
+        ``disk_space`` gigabytes for each group of indices identified by the single
+        capture group of the regular expression, in the same way as the ``pattern``
+        option of :py:meth:`filter_by_count`. Indices not matching ``pattern`` are
+        removed from the actionable list.
+
         :param disk_space: Filter indices over *n* gigabytes
         :param threshold_behavior: Size to filter, either ``greater_than`` or
             ``less_than``. Defaults to ``greater_than`` to preserve backwards
@@ -853,17 +1039,21 @@ class IndexList:
             ``use_age`` is ``True``
         :param use_age: Sort indices by age.  ``source`` is required in this case.
         :param source: Source of index age. Can be one of ``name``, ``creation_date``,
-            or ``field_stats``. Default: ``creation_date``
+            ``field_stats``, or ``settings``. Default: ``creation_date``
         :param timestring: An :py:func:`time.strftime` string to match the datestamp
             in an index name. Only used if ``source=name`` is selected.
         :param field: A timestamp field name.  Only used if ``source=field_stats``
             is selected.
         :param stats_result: Either ``min_value`` or ``max_value``.  Only used if
-            ``source=field_stats`` is selected. It determines whether to reference
-            the minimum or maximum value of `field` in each index.
+            ``source=field_stats`` or ``source=settings`` is selected. It determines
+            whether to reference the minimum or maximum value of `field` in each
+            index.
         :param exclude: If ``exclude=True``, this filter will remove matching
             indices from ``indices``. If ``exclude=False``, then only matching
             indices will be kept in ``indices``. Default is ``False``
+        :param pattern: A regular expression with one and only one capture group.
+            Indices are grouped by the captured value, and each group has its own
+            ``disk_space`` budget.
         """
         # Ensure that disk_space is a float
         if not disk_space:
@@ -872,11 +1062,11 @@ class IndexList:
             raise ValueError(
                 f'Invalid value for "threshold_behavior": {threshold_behavior}'
             )
+        regex = self._get_group_regex(pattern) if pattern else None
         # This filter requires both index stats and index settings
         self.get_index_stats()
         self.get_index_settings()
         disk_space = float(disk_space)
-        disk_usage = 0.0
         disk_limit = disk_space * 2**30
         msg = (
             'Cannot get disk usage info from closed indices. Omitting any '
@@ -897,11 +1087,25 @@ class IndexList:
         else:
             # Default to sorting by index name
             sorted_indices = sorted(self.working_list(), reverse=reverse)
+        # Running totals, keyed by group. Without a pattern, there is only one group.
+        usage = {}
         for index in sorted_indices:
-            disk_usage += self.index_info[index]['size_in_bytes']
+            group = None
+            if regex:
+                match = regex.match(index)
+                if match is None:
+                    msg = f'{index} does not match regular expression {pattern}.'
+                    self.__excludify(True, True, index, msg)
+                    continue
+                group = match.group(1)
+            usage[group] = (
+                usage.get(group, 0.0) + self.index_info[index]['size_in_bytes']
+            )
+            disk_usage = usage[group]
+            grp = '' if group is None else f' for group "{group}"'
             msg = (
-                f'{index}, summed disk usage is {byte_size(disk_usage)} and disk limit '
-                f'is {byte_size(disk_limit)}.'
+                f'{index}, summed disk usage{grp} is {byte_size(disk_usage)} and disk '
+                f'limit is {byte_size(disk_limit)}.'
             )
             if threshold_behavior == 'greater_than':
                 self.__excludify((disk_usage > disk_limit), exclude, index, msg)
@@ -997,6 +1201,52 @@ class IndexList:
             debug.lv3('Index %s doc count: %s', index, self.index_info[index]['docs'])
             self.__excludify(condition, exclude, index)
 
+    @begin_end()
+    def filter_deleted_docs(
+        self, deleted_ratio=None, threshold_behavior='greater_than', exclude=False
+    ):
+        """
+        Remove indices from the actionable list based on the ratio of deleted
+        documents, ``docs.deleted / (docs.count + docs.deleted)``, from the index
+        stats. Indices that are closed are automatically excluded from
+        consideration, as closed indices report no document counts.
+
+        ``threshold_behavior``, when set to ``greater_than`` (default), includes
+        the index if its ratio is larger than ``deleted_ratio``. When set to
+        ``less_than``, it includes the index if its ratio is smaller than
+        ``deleted_ratio``
+
+        :param deleted_ratio: Cutoff ratio of deleted documents, from ``0`` to ``1``
+        :param threshold_behavior: Ratio to filter, either ``greater_than`` or
+            ``less_than``. Defaults to ``greater_than``
+        :param exclude: If ``exclude=True``, this filter will remove matching indices
+            from ``indices``. If ``exclude=False``, then only matching indices
+            will be kept in ``indices``. Default is ``False``
+        """
+        if deleted_ratio is None:
+            raise MissingArgument('No value for "deleted_ratio" provided')
+        if threshold_behavior not in ['greater_than', 'less_than']:
+            raise ValueError(
+                f'Invalid value for "threshold_behavior": {threshold_behavior}'
+            )
+        # This filter requires index state (open/close) and index stats
+        self.get_index_state()
+        self.get_index_stats()
+        self.filter_closed()
+        self.empty_list_check()
+        for index in self.working_list():
+            docs = self.index_info[index]['docs']
+            deleted = self.index_info[index]['docs_deleted']
+            ratio = deleted / (docs + deleted) if docs + deleted else 0
+            msg = (
+                f'{index} has {deleted} deleted of {docs + deleted} documents, a '
+                f'ratio of {ratio:.3f}.'
+            )
+            if threshold_behavior == 'greater_than':
+                self.__excludify((ratio > deleted_ratio), exclude, index, msg)
+            else:
+                self.__excludify((ratio < deleted_ratio), exclude, index, msg)
+
     @begin_end()
     def filter_opened(self, exclude=True):
         """
@@ -1147,93 +1397,83 @@ class IndexList:
             ``index-888888`` through ``index-999999``, it will process both groups
             of indices, and include or exclude the ``count`` of each.
         :param source: Source of index age. Can be one of ``name``,
-            ``creation_date``, or ``field_stats``. Default: ``creation_date``
+            ``creation_date``, ``field_stats``, or ``settings``. Default:
+            ``creation_date``
         :param timestring: An :py:func:`time.strftime` string to match the datestamp
             in an index name. Only used if ``source=name``.
         :param field: A timestamp field name.  Only used if ``source=field_stats``.
         :param stats_result: Either ``min_value`` or ``max_value``.  Only used if
-            ``source=field_stats``. It determines whether to reference the minimum
-            or maximum value of ``field`` in each index.
+            ``source=field_stats`` or ``source=settings``. It determines whether to
+            reference the minimum or maximum value of ``field`` in each index.
         :param exclude: If ``exclude=True``, this filter will remove matching indices
             from ``indices``. If ``exclude=False``, then only matching indices
             will be kept in ``indices``. Default is ``True``
         """
         if not count:
             raise MissingArgument('No value for "count" provided')
+        regex = self._get_group_regex(pattern) if pattern else None
         # This filter requires index state (open/close) and index settings
         self.get_index_state()
         self.get_index_settings()
-        # Create a copy-by-value working list
-        working_list = self.working_list()
-        if pattern:
-            try:
-                regex = re.compile(pattern)
-                if regex.groups < 1:
-                    raise ConfigurationError(
-                        f'No regular expression group found in {pattern}'
-                    )
-                if regex.groups > 1:
-                    raise ConfigurationError(
-                        f'More than 1 regular expression group found in {pattern}'
-                    )
-                # Prune indices not matching the regular expression the object
-                # (And filtered_indices) We do not want to act on them by accident.
-                prune_these = list(
-                    filter(lambda x: regex.match(x) is None, working_list)
-                )
-                filtered_indices = working_list
-                for index in prune_these:
-                    msg = '{index} does not match regular expression {pattern}.'
-                    condition = True
-                    exclude = True
-                    self.__excludify(condition, exclude, index, msg)
-                    # also remove it from filtered_indices
-                    filtered_indices.remove(index)
-                # Presort these filtered_indices using the lambda
-                presorted = sorted(
-                    filtered_indices, key=lambda x: regex.match(x).group(1)
+        ages = None
+        if use_age:
+            if source != 'name':
+                logger.warning(
+                    'Cannot get age information from closed indices unless '
+                    'source="name".  Omitting any closed indices.'
                 )
-            except Exception as exc:
-                raise ActionError(
-                    f'Unable to process pattern: "{pattern}". Error: {exc}'
-                ) from exc
-            # Initialize groups here
-            groups = []
-            # We have to pull keys k this way, but we don't need to keep them
-            # We only need g for groups
-            for _, g in itertools.groupby(
-                presorted, key=lambda x: regex.match(x).group(1)
-            ):
-                groups.append(list(g))
-        else:
-            # Since pattern will create a list of lists, and we iterate over that,
-            # we need to put our single list inside a list
-            groups = [working_list]
-        for group in groups:
-            if use_age:
-                if source != 'name':
-                    logger.warning(
-                        'Cannot get age information from closed indices unless '
-                        'source="name".  Omitting any closed indices.'
+                self.filter_closed()
+            self._calculate_ages(
+                source=source,
+                timestring=timestring,
+                field=field,
+                stats_result=stats_result,
+            )
+            ages = self._get_ages(self.working_list())
+        # Collect the indices to remove and drop them all at once at the end,
+        # rather than calling list.remove() once per index
+        remove = set()
+        # Group the indices, matching the regular expression only once per index
+        groups = {}
+        for index in self.working_list():
+            key = None
+            if regex:
+                match = regex.match(index)
+                if match is None:
+                    # We do not want to act on these by accident
+                    debug.lv3(
+                        'Removed from actionable list: %s does not match regular '
+                        'expression %s.',
+                        index,
+                        pattern,
                     )
-                    self.filter_closed()
-                self._calculate_ages(
-                    source=source,
-                    timestring=timestring,
-                    field=field,
-                    stats_result=stats_result,
+                    remove.add(index)
+                    continue
+                key = match.group(1)
+            groups.setdefault(key, []).append(index)
+        # Only the top ``count`` of each group matter, so select them with a heap
+        # instead of sorting the whole group. Ties on age are broken by name, the
+        # same as _sort_by_age() does.
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        sortkey = (lambda x: (ages[x], x)) if use_age else None
+        text = 'Removed from' if exclude else 'Remains in'
+        for group in groups.values():
+            top = select(count, group, key=sortkey)
+            for idx, index in enumerate(top, start=1):
+                debug.lv3(
+                    '%s actionable list: %s is %s of specified count of %s.',
+                    text,
+                    index,
+                    idx,
+                    count,
                 )
-                # Using default value of reverse=True in self._sort_by_age()
-                sorted_indices = self._sort_by_age(group, reverse=reverse)
-            else:
-                # Default to sorting by index name
-                sorted_indices = sorted(group, reverse=reverse)
-            idx = 1
-            for index in sorted_indices:
-                msg = f'{index} is {idx} of specified count of {count}.'
-                condition = True if idx <= count else False
-                self.__excludify(condition, exclude, index, msg)
-                idx += 1
+            if exclude:
+                remove.update(top)
+            elif len(top) < len(group):
+                keep = set(top)
+                remove.update(index for index in group if index not in keep)
+        if remove:
+            self.indices[:] = [index for index in self.indices if index not in remove]
 
     @begin_end()
     def filter_by_shards(
@@ -1329,7 +1569,7 @@ class IndexList:
             ``period_type='absolute'``. ``range_from`` and ``range_to`` are required
             with ``period_type='relative'``.
         :param source: Source of index age. Can be ``name``, ``creation_date``,
-            or ``field_stats``
+            ``field_stats``, or ``settings``
         :param range_from: How many ``unit`` (s) in the past/future is the origin?
         :param range_to: How many ``unit`` (s) in the past/future is the end point?
         :param date_from: The simplified date for the start of the range
@@ -1348,12 +1588,14 @@ class IndexList:
         :param field: A timestamp field name.  Only used for ``field_stats`` based
             calculations.
         :param stats_result: Either ``min_value`` or ``max_value``.  Only used in
-            conjunction with ``source='field_stats'`` to choose whether to reference
-            the min or max result value.
-        :param intersect: Only used when ``source='field_stats'``. If ``True``,
-            only indices where both ``min_value`` and ``max_value`` are within the
-            period will be selected. If ``False``, it will use whichever you specified.
-            Default is ``False`` to preserve expected behavior.
+            conjunction with ``source='field_stats'`` or ``source='settings'`` to
+            choose whether to reference the min or max result value.
+        :param intersect: Only used when ``source='field_stats'`` or
+            ``source='settings'``. If ``True``, only indices where both ``min_value``
+            and ``max_value`` are within the period will be selected. If ``False``,
+            it will use whichever you specified. Default is ``False`` to preserve
+            expected behavior. With ``source='settings'``, only time series indices
+            have both values (``index.time_series.start_time`` and ``end_time``).
         :param week_starts_on: Either ``sunday`` or ``monday``. Default is ``sunday``
         :param epoch: An epoch timestamp used to establish a point of reference for
             calculations. If not provided, the current time will be used.
@@ -1398,11 +1640,16 @@ class IndexList:
         self._calculate_ages(
             source=source, timestring=timestring, field=field, stats_result=stats_result
         )
+        bounds = {
+            'field_stats': ('min_value', 'max_value'),
+            'settings': ('start_time', 'end_time'),
+        }
         for index in self.working_list():
             try:
-                if source == 'field_stats' and intersect:
-                    min_age = int(self.index_info[index]['age']['min_value'])
-                    max_age = int(self.index_info[index]['age']['max_value'])
+                if source in ['field_stats', 'settings'] and intersect:
+                    keys = bounds[source]
+                    min_age = int(self.index_info[index]['age'][keys[0]])
+                    max_age = int(self.index_info[index]['age'][keys[1]])
                     msg = (
                         f'Index "{index}", timestamp field "{field}", min_value '
                         f'({min_age}), max_value ({max_age}), period start: '
@@ -1480,7 +1727,11 @@ class IndexList:
             logger.info('No filters in config.  Returning unaltered object.')
             return
         debug.lv3('All filters: %s', filter_dict['filters'])
-        for fil in filter_dict['filters']:
+        filters = filter_dict['filters']
+        pos = 0
+        while pos < len(filters):
+            fil = filters[pos]
+            pos += 1
             debug.lv5('Top of the loop: %s', self.indices)
             debug.lv5('Un-parsed filter args: %s', fil)
             # Make sure we got at least this much in the configuration
@@ -1489,6 +1740,19 @@ class IndexList:
             ).result()
             msg = f'Parsed filter args: {chk}'
             debug.lv5(msg)
+            if fil['filtertype'] == 'pattern':
+                # Adjacent pattern filters are evaluated together in one pass
+                run = [fil]
+                while pos < len(filters) and self.__is_pattern_filter(filters[pos]):
+                    run.append(filters[pos])
+                    pos += 1
+                if len(run) > 1:
+                    for each in run:
+                        del each['filtertype']
+                    debug.lv3('Pre-instance: %s', self.indices)
+                    self.filter_by_regex_chain(run)
+                    debug.lv3('Post-instance: %s', self.indices)
+                    continue
             method = self.__map_method(fil['filtertype'])
             del fil['filtertype']
             # If it's a filtertype with arguments, update the defaults with the
@@ -1,7 +1,11 @@
 """SnapshotList"""
 
+import json
+import os
 import re
 import logging
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from es_client.helpers.schemacheck import SchemaCheck
 from curator.debug import debug, begin_end
 from curator.exceptions import (
@@ -15,46 +19,363 @@ from curator.helpers.date_ops import (
     date_range,
     fix_epoch,
     get_date_regex,
+    get_name_epoch,
     get_point_of_reference,
-    TimestringSearch,
 )
-from curator.helpers.getters import get_snapshot_data
+from curator.helpers.getters import (
+    get_repository,
+    get_repository_uuid,
+    get_snapshot,
+    get_snapshot_data,
+    get_snapshot_names,
+    iter_snapshot_data,
+)
 from curator.helpers.testers import repository_exists, verify_client_object
-from curator.helpers.utils import report_failure
+from curator.helpers.utils import report_failure, to_csv, write_cache_file
 from curator.defaults import settings
 from curator.validators.filter_functions import filterstructure
 
 logger = logging.getLogger(__name__)
 
+#: The most repositories that :py:class:`SnapshotList` reads at the same time
+MAX_CONCURRENT_REPOSITORIES = 16
+
+
+class SnapshotInfo:
+    """
+    Compact record of the snapshot details that :py:class:`SnapshotList` uses,
+    kept in :py:attr:`SnapshotList.snapshot_info` instead of the full API response.
+
+    Fields can be read and written like :py:class:`dict` keys, e.g.
+    ``info['state']``, with the same names as the snapshot API uses. A field that
+    is ``None`` is treated as absent by ``in``.
+
+    :param data: One snapshot from the snapshot API response
+    :param repository: The repository that holds the snapshot
+
+    :type data: dict
+    :type repository: str
+    """
+
+    __slots__ = (
+        'snapshot',
+        'repository',
+        'state',
+        'start_time_in_millis',
+        'end_time_in_millis',
+        'age_by_name',
+        'indices',
+    )
+
+    def __init__(self, data, repository=None):
+        self.snapshot = data['snapshot']
+        self.repository = repository
+        self.state = data.get('state')
+        self.start_time_in_millis = data.get('start_time_in_millis')
+        self.end_time_in_millis = data.get('end_time_in_millis')
+        self.age_by_name = None
+        indices = data.get('indices')
+        self.indices = None if indices is None else tuple(indices)
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__ and getattr(self, key) is not None
+
+    def get(self, key, default=None):
+        """
+        :returns: The value of field ``key``, or ``default`` if it is ``None``
+        """
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+
+    def __repr__(self):
+        return f'SnapshotInfo({self.snapshot!r}, state={self.state!r})'
+
+
+class SnapshotCatalog:
+    """
+    Local cache of the finished snapshots in a repository, kept as a JSON file in
+    ``cache_dir``, named after the repository name and UUID. Finished snapshots
+    never change, so later runs only need to get snapshots that started after
+    the newest cached one, plus a names-only listing to drop deleted snapshots.
+
+    :param client: A client connection object
+    :param repository: The Elasticsearch snapshot repository to use
+    :param cache_dir: The directory where the cache file is kept
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type repository: str
+    :type cache_dir: str
+    """
+
+    #: The keys of each snapshot that are kept in the cache
+    FIELDS = (
+        'snapshot',
+        'state',
+        'start_time_in_millis',
+        'end_time_in_millis',
+        'indices',
+    )
+    #: Snapshots in these states will not change again
+    FINISHED = ('SUCCESS', 'PARTIAL', 'FAILED', 'INCOMPATIBLE')
+
+    def __init__(self, client, repository, cache_dir):
+        self.client = client
+        self.repository = repository
+        self.cache_dir = cache_dir
+        #: The repository UUID. A repository that was deleted and re-created
+        #: with the same name gets a new UUID, and so a new cache file.
+        self.uuid = get_repository_uuid(client, repository)
+        #: The path to the cache file, or ``None`` if the repository UUID is not
+        #: known, in which case nothing is cached.
+        self.path = None
+        if self.uuid:
+            self.path = os.path.join(cache_dir, f'{repository}-{self.uuid}.json')
+
+    def load(self):
+        """
+        :returns: The cache file contents, or ``None`` if there is no usable cache
+        :rtype: dict
+        """
+        if not self.path or not os.path.isfile(self.path):
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as cache_file:
+                data = json.load(cache_file)
+            data['snapshots'] = list(data['snapshots'])
+            int(data['refresh_from'])
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            logger.warning('Ignoring unreadable snapshot cache %s: %s', self.path, err)
+            return None
+        return data
+
+    def save(self, snapshots):
+        """
+        Write the finished snapshots in ``snapshots`` to the cache file. The file
+        also records where the next refresh has to start: the start time of the
+        oldest unfinished snapshot, or else of the newest snapshot.
+
+        :param snapshots: Snapshot data, as returned by the snapshot API
+        :type snapshots: list
+        """
+        if not self.path:
+            return
+        finished = [snap for snap in snapshots if snap.get('state') in self.FINISHED]
+        unfinished = [
+            snap.get('start_time_in_millis', 0)
+            for snap in snapshots
+            if snap.get('state') not in self.FINISHED
+        ]
+        if unfinished:
+            refresh_from = min(unfinished)
+        else:
+            refresh_from = max(
+                (snap.get('start_time_in_millis', 0) for snap in finished), default=0
+            )
+        data = {'refresh_from': refresh_from, 'snapshots': finished}
+        write_cache_file(self.path, data)
+
+    @begin_end()
+    def get_snapshots(self, index_names=True):
+        """
+        Get all snapshots in the repository, using and then refreshing the cache.
+
+        Without a cache, all snapshots are fetched. With a cache, only snapshots
+        that started at or after the cached ``refresh_from`` time are fetched, and
+        cached snapshots missing from a names-only listing are dropped.
+
+        :param index_names: Whether to include the names of the indices in each
+            newly fetched snapshot
+        :type index_names: bool
+
+        :returns: The snapshots in the repository, each with only the keys in
+            :py:attr:`FIELDS`, sorted by start time
+        :rtype: list
+        """
+        cached = self.load()
+        snapshots = {}
+        from_sort_value = None
+        if cached:
+            for snap in cached['snapshots']:
+                snapshots[snap['snapshot']] = snap
+            from_sort_value = cached['refresh_from']
+            debug.lv2('Loaded %s snapshots from cache %s', len(snapshots), self.path)
+        for page in iter_snapshot_data(
+            self.client,
+            repository=self.repository,
+            index_names=index_names,
+            from_sort_value=from_sort_value,
+        ):
+            for snap in page:
+                if 'snapshot' in snap:
+                    snapshots[snap['snapshot']] = {
+                        key: snap[key] for key in self.FIELDS if key in snap
+                    }
+        if cached:
+            current = set(get_snapshot_names(self.client, self.repository))
+            for name in list(snapshots):
+                if name not in current:
+                    debug.lv2('Dropping deleted snapshot %s from cache', name)
+                    del snapshots[name]
+        result = sorted(
+            snapshots.values(), key=lambda snap: snap.get('start_time_in_millis', 0)
+        )
+        self.save(result)
+        return result
+
+
+class SnapshotIndexRecord:
+    """
+    Local record of the last successful snapshot of each index in a repository,
+    with the index UUID and the shard sequence numbers it had at the time, from
+    :py:func:`~.curator.helpers.getters.get_max_seq_nos`. It is kept as a JSON file
+    in ``cache_dir``, next to the :py:class:`SnapshotCatalog` file.
+
+    An index with the same UUID and sequence numbers as recorded has had no writes
+    since, and does not need to be snapshotted again, as long as the recorded
+    snapshot still exists.
+
+    :param client: A client connection object
+    :param repository: The Elasticsearch snapshot repository to use
+    :param cache_dir: The directory where the record file is kept
+
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type repository: str
+    :type cache_dir: str
+    """
+
+    def __init__(self, client, repository, cache_dir):
+        self.client = client
+        self.repository = repository
+        #: The repository UUID, as for :py:class:`SnapshotCatalog`
+        self.uuid = get_repository_uuid(client, repository)
+        #: The path to the record file, or ``None`` if the repository UUID is not
+        #: known, in which case nothing is recorded and every index is changed.
+        self.path = None
+        if self.uuid:
+            self.path = os.path.join(
+                cache_dir, f'{repository}-{self.uuid}-indices.json'
+            )
+        #: ``{index: {'snapshot': name, 'uuid': uuid, 'shards': {...}}}``
+        self.record = self.load()
+
+    def load(self):
+        """
+        :returns: The record file contents, or an empty :py:class:`dict` if there
+            is no usable record
+        :rtype: dict
+        """
+        if not self.path or not os.path.isfile(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as record_file:
+                data = json.load(record_file)
+            if not isinstance(data, dict):
+                raise TypeError('not a JSON object')
+        except (OSError, ValueError, TypeError) as err:
+            logger.warning('Ignoring unreadable index record %s: %s', self.path, err)
+            return {}
+        return data
+
+    def save(self):
+        """Write :py:attr:`record` to the record file"""
+        if self.path:
+            write_cache_file(self.path, self.record)
+
+    @begin_end()
+    def get_unchanged(self, seq_nos):
+        """
+        :param seq_nos: The current values, from
+            :py:func:`~.curator.helpers.getters.get_max_seq_nos`
+        :type seq_nos: dict
+
+        :returns: The indices in ``seq_nos`` that match their record, and whose
+            recorded snapshot still exists in the repository
+        :rtype: list
+        """
+        same = [
+            idx
+            for idx, current in seq_nos.items()
+            if idx in self.record
+            and self.record[idx].get('uuid') == current['uuid']
+            and self.record[idx].get('shards') == current['shards']
+        ]
+        if not same:
+            return []
+        existing = set(get_snapshot_names(self.client, self.repository))
+        return sorted(idx for idx in same if self.record[idx]['snapshot'] in existing)
+
+    def update(self, snapshot, seq_nos):
+        """
+        Record ``snapshot`` as the last successful snapshot of the indices in
+        ``seq_nos``, with their values from before it was taken.
+
+        :param snapshot: The snapshot name
+        :param seq_nos: Values from
+            :py:func:`~.curator.helpers.getters.get_max_seq_nos`
+
+        :type snapshot: str
+        :type seq_nos: dict
+        """
+        for idx, current in seq_nos.items():
+            self.record[idx] = {'snapshot': snapshot, **current}
+
 
 class SnapshotList:
-    """Snapshot list object"""
+    """
+    Snapshot list object
+
+    ``repository`` can name more than one repository, as a :py:class:`list`, a
+    comma-separated :py:class:`str`, or a wildcard pattern. The snapshots of all
+    matching repositories are then fetched concurrently and filtered together,
+    each kept in ``snapshots`` as ``repository/snapshot``.
+    """
 
-    def __init__(self, client, repository=None):
+    def __init__(self, client, repository=None, index_names=True, cache_dir=None):
         verify_client_object(client)
         if not repository:
             raise MissingArgument('No value for "repository" provided')
-        if not repository_exists(client, repository):
-            raise FailedExecution(
-                f'Unable to verify existence of repository {repository}'
-            )
         #: An :py:class:`~.elasticsearch.Elasticsearch` client object passed from
         #: param ``client``
         self.client = client
-        #: The value passed as ``delete_aliases``
-        self.repository = repository
+        #: The names of the repositories matching param ``repository``
+        self.repositories = self.__get_repositories(repository)
+        #: The repository name, if there is only one in :py:attr:`repositories`,
+        #: otherwise ``None``
+        self.repository = None
+        if len(self.repositories) == 1:
+            self.repository = self.repositories[0]
+        #: The value passed as ``index_names``. If ``False``, the names of the
+        #: indices in each snapshot are not fetched with the snapshot list, but
+        #: only on demand by :py:meth:`get_snapshot_indices`
+        self.index_names = index_names
+        #: The value passed as ``cache_dir``. If set, finished snapshots are kept
+        #: in a local :py:class:`SnapshotCatalog` in this directory.
+        self.cache_dir = cache_dir
         #: Information extracted from snapshots, such as age, etc.
         #: Populated by internal method ``__get_snapshots`` at instance creation
-        #: time. **Type:** :py:class:`dict`
+        #: time. **Type:** :py:class:`dict` of :py:class:`SnapshotInfo`
         self.snapshot_info = {}
         #: The running list of snapshots which will be used by an Action class.
         #: Populated by internal methods ``__get_snapshots`` at instance creation
         #: time. **Type:** :py:class:`list`
         self.snapshots = []
-        #: Raw data dump of all snapshots in the repository at instance creation
-        #: time.  **Type:** :py:class:`list` of :py:class:`dict` data.
+        # The raw snapshot data behind all_snapshots, fetched on first use
+        self._all_snapshots = None
         self.__get_snapshots()
         self.age_keyfield = None
+        #: All snapshots with an age, as ``(age, snapshot)`` tuples sorted by age,
+        #: per ``age_keyfield``. Built on first use by :py:meth:`_get_age_index`.
+        self.age_index = {}
 
     def __actionable(self, snap):
         debug.lv2('Snapshot %s is actionable and remains in the list.', snap)
@@ -82,18 +403,143 @@ class SnapshotList:
         if msg:
             debug.lv3('%s: %s', text, msg)
 
+    def __excludify_all(self, matching, exclude, msg=None):
+        """
+        Like ``__excludify``, but for all of ``snapshots`` at once, where
+        ``condition`` is ``True`` for every snapshot in ``matching``. The
+        snapshots that are not actionable are removed in a single pass over
+        ``snapshots``, rather than with one :py:meth:`list.remove` call each.
+
+        :param matching: The snapshots that meet the filter condition
+        :param exclude: Whether to remove (``True``) or keep (``False``)
+            ``matching`` snapshots
+        :param msg: A message logged with the number of snapshots kept and
+            removed
+        """
+        matching = set(matching)
+        keep = []
+        for snap in self.snapshots:
+            if (snap in matching) != bool(exclude):
+                keep.append(snap)
+            else:
+                debug.lv2('Snapshot %s is not actionable, removing from list.', snap)
+        if msg:
+            debug.lv3(
+                '%s: %s remain in and %s were removed from actionable list',
+                msg,
+                len(keep),
+                len(self.snapshots) - len(keep),
+            )
+        self.snapshots[:] = keep
+
+    def __get_repositories(self, repository):
+        """
+        Resolve ``repository`` to a list of repository names. A single name is
+        checked with :py:func:`~.curator.helpers.testers.repository_exists`.
+        Lists, comma-separated names and wildcard patterns are expanded with one
+        :py:func:`~.curator.helpers.getters.get_repository` call.
+
+        :returns: The names of the matching repositories
+        :rtype: list
+        """
+        if isinstance(repository, str) and not re.search(r'[,*]', repository):
+            if not repository_exists(self.client, repository):
+                raise FailedExecution(
+                    f'Unable to verify existence of repository {repository}'
+                )
+            return [repository]
+        try:
+            found = sorted(get_repository(self.client, to_csv(repository)))
+        # pylint: disable=broad-except
+        except Exception as err:
+            logger.error('Unable to find repositories "%s": %s', repository, err)
+            found = []
+        if not found:
+            raise FailedExecution(
+                f'Unable to verify existence of repositories {repository}'
+            )
+        debug.lv2('Repositories: %s', found)
+        return found
+
+    def __get_repository_snapshots(self, repository):
+        """
+        Get the snapshots in ``repository``, one page at a time, or from a
+        :py:class:`SnapshotCatalog` if ``cache_dir`` is set. Called once per
+        repository, concurrently if there is more than one.
+
+        :returns: The snapshots in ``repository``
+        :rtype: list of :py:class:`SnapshotInfo`
+        """
+        if self.cache_dir:
+            catalog = SnapshotCatalog(self.client, repository, self.cache_dir)
+            pages = [catalog.get_snapshots(index_names=self.index_names)]
+        else:
+            pages = iter_snapshot_data(
+                self.client, repository=repository, index_names=self.index_names
+            )
+        return [
+            SnapshotInfo(item, repository=repository)
+            for page in pages
+            for item in page
+            if 'snapshot' in item
+        ]
+
     @begin_end()
     def __get_snapshots(self):
         """
-        Pull all snapshots into `snapshots` and populate ``snapshot_info``
+        Pull all snapshots into `snapshots` and populate ``snapshot_info``. With
+        more than one repository, they are fetched concurrently, and each snapshot
+        is keyed as ``repository/snapshot``, as names are only unique within a
+        repository.
         """
-        self.all_snapshots = get_snapshot_data(self.client, self.repository)
-        for list_item in self.all_snapshots:
-            if 'snapshot' in list_item.keys():
-                self.snapshots.append(list_item['snapshot'])
-                self.snapshot_info[list_item['snapshot']] = list_item
+        if len(self.repositories) == 1:
+            results = [self.__get_repository_snapshots(self.repositories[0])]
+        else:
+            workers = min(len(self.repositories), MAX_CONCURRENT_REPOSITORIES)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(
+                    pool.map(self.__get_repository_snapshots, self.repositories)
+                )
+        for infos in results:
+            for info in infos:
+                if self.repository:
+                    key = info.snapshot
+                else:
+                    key = f'{info.repository}/{info.snapshot}'
+                self.snapshots.append(key)
+                self.snapshot_info[key] = info
         self.empty_list_check()
 
+    @property
+    def all_snapshots(self):
+        """
+        Raw data dump of all snapshots in the repository, fetched on first use and
+        kept for later reads. **Type:** :py:class:`list` of :py:class:`dict` data.
+        """
+        if self._all_snapshots is None:
+            self._all_snapshots = get_snapshot_data(
+                self.client,
+                repository=to_csv(self.repositories),
+                index_names=self.index_names,
+            )
+        return self._all_snapshots
+
+    @begin_end()
+    def get_snapshot_details(self, snapshot):
+        """
+        Fetch the full snapshot API response for ``snapshot``, which is not kept in
+        ``snapshot_info``.
+
+        :param snapshot: A snapshot in ``snapshots``
+        :type snapshot: str
+
+        :returns: The snapshot details, as returned by the snapshot API
+        :rtype: dict
+        """
+        info = self.snapshot_info[snapshot]
+        resp = get_snapshot(self.client, info.repository, info.snapshot)
+        return resp['snapshots'][0]
+
     def __map_method(self, ftype):
         methods = {
             'age': self.filter_by_age,
@@ -131,13 +577,44 @@ class SnapshotList:
         # Check for empty list before proceeding here to prevent non-iterable
         # condition
         self.empty_list_check()
-        tstamp = TimestringSearch(timestring)
         for snapshot in self.working_list():
-            epoch = tstamp.get_epoch(snapshot)
+            epoch = get_name_epoch(timestring, self.snapshot_info[snapshot].snapshot)
             if epoch:
                 self.snapshot_info[snapshot]['age_by_name'] = epoch
             else:
                 self.snapshot_info[snapshot]['age_by_name'] = None
+        # Name-based ages depend on timestring, so they must be sorted again
+        self.age_index.pop('age_by_name', None)
+
+    def _get_age_index(self):
+        """
+        Return ``(age, snapshot)`` tuples for the snapshots in ``snapshots``,
+        sorted by age, where age is the epoch value of ``age_keyfield``.
+
+        Snapshots without an age are removed from ``snapshots``. The sorted order
+        for all snapshots is kept in :py:attr:`age_index` and reused by later
+        filters using the same ``age_keyfield``.
+
+        :returns: A sorted list of ``(age, snapshot)`` tuples
+        :rtype: list
+        """
+        if self.age_keyfield not in self.age_index:
+            ages = []
+            for snap, info in self.snapshot_info.items():
+                if info[self.age_keyfield]:
+                    ages.append((fix_epoch(info[self.age_keyfield]), snap))
+            ages.sort()
+            self.age_index[self.age_keyfield] = ages
+        current = set(self.snapshots)
+        ages = [
+            entry for entry in self.age_index[self.age_keyfield] if entry[1] in current
+        ]
+        if len(ages) < len(current):
+            aged = {snap for _, snap in ages}
+            for snap in current - aged:
+                debug.lv2('Removing snapshot %s for having no age', snap)
+            self.snapshots[:] = [snap for snap in self.snapshots if snap in aged]
+        return ages
 
     @begin_end()
     def _calculate_ages(self, source='creation_date', timestring=None):
@@ -200,6 +677,25 @@ class SnapshotList:
         sorted_tuple = sorted(temp.items(), key=lambda k: k[1], reverse=reverse)
         return [x[0] for x in sorted_tuple]
 
+    @begin_end()
+    def get_snapshot_indices(self, snapshot):
+        """
+        Return the names of the indices in ``snapshot``. If they were not fetched
+        with the snapshot list (``index_names=False``), get them now, and keep them
+        in ``snapshot_info``.
+
+        :param snapshot: The name of a snapshot in ``snapshot_info``
+        :type snapshot: str
+
+        :returns: The names of the indices in ``snapshot``
+        :rtype: list
+        """
+        if 'indices' not in self.snapshot_info[snapshot]:
+            debug.lv3('Getting the index names for snapshot %s', snapshot)
+            details = self.get_snapshot_details(snapshot)
+            self.snapshot_info[snapshot]['indices'] = tuple(details['indices'])
+        return list(self.snapshot_info[snapshot]['indices'])
+
     @begin_end()
     def most_recent(self):
         """
@@ -252,13 +748,12 @@ class SnapshotList:
 
         self.empty_list_check()
         pattern = re.compile(regex)
-        for snapshot in self.working_list():
-            match = pattern.search(snapshot)
-            debug.lv3('Filter by regex: Snapshot: %s', snapshot)
-            if match:
-                self.__excludify(True, exclude, snapshot)
-            else:
-                self.__excludify(False, exclude, snapshot)
+        matching = [
+            snapshot
+            for snapshot in self.snapshots
+            if pattern.search(self.snapshot_info[snapshot].snapshot)
+        ]
+        self.__excludify_all(matching, exclude, f'Filter by regex: {regex}')
 
     @begin_end()
     def filter_by_age(
@@ -297,24 +792,16 @@ class SnapshotList:
         if direction not in ['older', 'younger']:
             raise ValueError(f'Invalid value for "direction": {direction}')
         self._calculate_ages(source=source, timestring=timestring)
-        for snapshot in self.working_list():
-            if not self.snapshot_info[snapshot][self.age_keyfield]:
-                logger.debug('Removing snapshot %s for having no age', snapshot)
-                self.snapshots.remove(snapshot)
-                continue
-            age = fix_epoch(self.snapshot_info[snapshot][self.age_keyfield])
-            msg = (
-                f'Snapshot "{snapshot}" age ({age}), direction: "{direction}", '
-                f'point of reference, ({por})'
-            )
-            # Because time adds to epoch, smaller numbers are actually older
-            # timestamps.
-            snapshot_age = fix_epoch(self.snapshot_info[snapshot][self.age_keyfield])
-            if direction == 'older':
-                agetest = snapshot_age < por
-            else:  # 'younger'
-                agetest = snapshot_age > por
-            self.__excludify(agetest, exclude, snapshot, msg)
+        ages = self._get_age_index()
+        # Because time adds to epoch, smaller numbers are actually older
+        # timestamps. The ages are sorted, so a single cut splits them.
+        keys = [age for age, _ in ages]
+        if direction == 'older':
+            matching = ages[: bisect_left(keys, por)]
+        else:  # 'younger'
+            matching = ages[bisect_right(keys, por) :]
+        msg = f'Snapshot age, direction: "{direction}", point of reference, ({por})'
+        self.__excludify_all([snap for _, snap in matching], exclude, msg)
 
     @begin_end()
     def filter_by_state(self, state=None, exclude=False):
@@ -333,12 +820,12 @@ class SnapshotList:
         if state.upper() not in ['SUCCESS', 'PARTIAL', 'FAILED', 'IN_PROGRESS']:
             raise ValueError(f'{state}: Invalid value for state')
         self.empty_list_check()
-        for snapshot in self.working_list():
-            debug.lv3('Filter by state: Snapshot: %s', snapshot)
-            if self.snapshot_info[snapshot]['state'] == state:
-                self.__excludify(True, exclude, snapshot)
-            else:
-                self.__excludify(False, exclude, snapshot)
+        matching = [
+            snapshot
+            for snapshot in self.snapshots
+            if self.snapshot_info[snapshot]['state'] == state
+        ]
+        self.__excludify_all(matching, exclude, f'Filter by state: {state}')
 
     def filter_none(self):
         """No filter at all"""
@@ -372,6 +859,8 @@ class SnapshotList:
         default, but you can also specify ``source=name``.  The ``name`` ``source``
         requires the timestring argument.
 
+        With more than one repository, ``count`` applies to each repository.
+
         :param count: Filter snapshots beyond ``count``.
         :param reverse: The filtering direction. (default: ``True``).
         :param use_age: Sort snapshots by age.  ``source`` is required in this case.
@@ -385,21 +874,26 @@ class SnapshotList:
         """
         if not count:
             raise MissingArgument('No value for "count" provided')
-        # Create a copy-by-value working list
-        working_list = self.working_list()
         if use_age:
             self._calculate_ages(source=source, timestring=timestring)
-            # Using default value of reverse=True in self._sort_by_age()
-            sorted_snapshots = self._sort_by_age(working_list, reverse=reverse)
+            ages = self._get_age_index()
+            # The youngest are last, so reverse=True counts from the end
+            if reverse:
+                ages = ages[::-1]
+            sorted_snapshots = [snap for _, snap in ages]
         else:
             # Default to sorting by snapshot name
-            sorted_snapshots = sorted(working_list, reverse=reverse)
-        idx = 1
+            sorted_snapshots = sorted(self.snapshots, reverse=reverse)
+        # Count each repository on its own, as if it had its own SnapshotList
+        counts = {}
+        matching = []
         for snap in sorted_snapshots:
-            msg = f'{snap} is {idx} of specified count of {count}.'
-            condition = True if idx <= count else False
-            self.__excludify(condition, exclude, snap, msg)
-            idx += 1
+            repository = self.snapshot_info[snap].repository
+            if counts.get(repository, 0) < count:
+                counts[repository] = counts.get(repository, 0) + 1
+                matching.append(snap)
+        msg = f'Snapshots within specified count of {count}'
+        self.__excludify_all(matching, exclude, msg)
 
     @begin_end()
     def filter_period(
@@ -499,20 +993,14 @@ class SnapshotList:
         except Exception as err:
             report_failure(err)
         self._calculate_ages(source=source, timestring=timestring)
-        for snapshot in self.working_list():
-            if not self.snapshot_info[snapshot][self.age_keyfield]:
-                debug.lv2('Removing snapshot {0} for having no age')
-                self.snapshots.remove(snapshot)
-                continue
-            age = fix_epoch(self.snapshot_info[snapshot][self.age_keyfield])
-            msg = (
-                f'Snapshot "{snapshot}" age ({age}), period start: "{start}", period '
-                f'end, ({end})'
-            )
-            # Because time adds to epoch, smaller numbers are actually older
-            # timestamps.
-            inrange = (age >= start) and (age <= end)
-            self.__excludify(inrange, exclude, snapshot, msg)
+        ages = self._get_age_index()
+        # Because time adds to epoch, smaller numbers are actually older
+        # timestamps. The ages are sorted, so the period is a single slice.
+        keys = [age for age, _ in ages]
+        first = bisect_left(keys, start)
+        last = bisect_right(keys, end)
+        msg = f'Snapshot age, period start: "{start}", period end, ({end})'
+        self.__excludify_all([snap for _, snap in ages[first:last]], exclude, msg)
 
     @begin_end()
     def iterate_filters(self, config):
@@ -31,11 +31,13 @@ def action_specific(action):
             option_defaults.wait_for_completion(action),
             option_defaults.wait_interval(action),
             option_defaults.max_wait(action),
+            option_defaults.max_pending_tasks(),
         ],
         'close': [
             option_defaults.search_pattern(),
             option_defaults.delete_aliases(),
             option_defaults.skip_flush(),
+            option_defaults.max_pending_tasks(),
         ],
         'cluster_routing': [
             option_defaults.routing_type(),
@@ -58,25 +60,35 @@ def action_specific(action):
         ],
         'delete_indices': [
             option_defaults.search_pattern(),
+            option_defaults.max_concurrent_requests(),
+            option_defaults.max_pending_tasks(),
         ],
         'delete_snapshots': [
             option_defaults.repository(),
             option_defaults.retry_interval(),
             option_defaults.retry_count(),
+            option_defaults.batch_size(),
+            option_defaults.snapshot_cache_dir(),
         ],
         'forcemerge': [
             option_defaults.search_pattern(),
             option_defaults.delay(),
             option_defaults.max_num_segments(),
+            option_defaults.max_merges_per_node(),
+            option_defaults.wait_interval(action),
+            option_defaults.only_expunge_deletes(),
+            option_defaults.merge_journal(),
         ],
         'index_settings': [
             option_defaults.search_pattern(),
             option_defaults.index_settings(),
             option_defaults.ignore_unavailable(),
             option_defaults.preserve_existing(),
+            option_defaults.max_pending_tasks(),
         ],
         'open': [
             option_defaults.search_pattern(),
+            option_defaults.max_pending_tasks(),
         ],
         'reindex': [
             option_defaults.request_body(),
@@ -101,6 +113,7 @@ def action_specific(action):
             option_defaults.wait_for_completion(action),
             option_defaults.wait_interval(action),
             option_defaults.max_wait(action),
+            option_defaults.max_pending_tasks(),
         ],
         'rollover': [
             option_defaults.name(action),
@@ -124,6 +137,12 @@ def action_specific(action):
             option_defaults.wait_interval(action),
             option_defaults.max_wait(action),
             option_defaults.skip_repo_fs_check(),
+            option_defaults.snapshot_cache_dir(),
+            option_defaults.max_wave_indices(),
+            option_defaults.max_wave_gb(),
+            option_defaults.timestring(),
+            option_defaults.date_from(),
+            option_defaults.date_to(),
         ],
         'snapshot': [
             option_defaults.search_pattern(),
@@ -136,6 +155,9 @@ def action_specific(action):
             option_defaults.wait_interval(action),
             option_defaults.max_wait(action),
             option_defaults.skip_repo_fs_check(),
+            option_defaults.partitions(),
+            option_defaults.skip_unchanged(),
+            option_defaults.snapshot_cache_dir(),
         ],
         'shrink': [
             option_defaults.search_pattern(),
@@ -45,6 +45,38 @@ class TestActionDeleteIndices(TestCase):
         self.builder4()
         dio = DeleteIndices(self.ilo)
         self.assertIsNone(dio.do_action())
+    def test_do_action_verify_deleted(self):
+        self.builder4()
+        dio = DeleteIndices(self.ilo)
+        self.client.cat.indices.reset_mock()
+        self.client.indices.get_settings.return_value = {}
+        self.assertIsNone(dio.do_action())
+        self.assertEqual(1, self.client.indices.delete.call_count)
+        self.client.cat.indices.assert_not_called()
+    def test_init_raise_bad_max_concurrent_requests(self):
+        self.builder()
+        self.assertRaises(TypeError, DeleteIndices, self.ilo, max_concurrent_requests=0)
+    def test_do_action_concurrent(self):
+        self.builder4()
+        dio = DeleteIndices(self.ilo, max_concurrent_requests=4)
+        # Every index name is about 1K, so there are 3 chunks
+        self.ilo.indices = [f'{"x" * 1024}-{num}' for num in range(8)]
+        self.client.indices.get_settings.return_value = {}
+        self.assertIsNone(dio.do_action())
+        calls = self.client.indices.delete.call_args_list
+        self.assertEqual(3, len(calls))
+        self.assertEqual(
+            sorted(self.ilo.indices),
+            sorted(idx for call in calls for idx in call.kwargs['index'].split(','))
+        )
+    def test_do_action_paced(self):
+        self.builder4()
+        self.client.cluster.health.return_value = {'number_of_pending_tasks': 0}
+        dio = DeleteIndices(self.ilo, max_pending_tasks=100)
+        self.client.indices.get_settings.return_value = {}
+        self.assertIsNone(dio.do_action())
+        self.client.cluster.health.assert_called_once()
+        self.assertEqual(1, self.client.indices.delete.call_count)
     def test_do_action_not_successful(self):
         self.builder4()
         dio = DeleteIndices(self.ilo)
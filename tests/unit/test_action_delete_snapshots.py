@@ -1,6 +1,7 @@
 """test_action_delete_snapshots"""
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from elasticsearch8 import ApiError, NotFoundError
 from curator.actions import DeleteSnapshots
 from curator.exceptions import FailedExecution
 from curator import SnapshotList
@@ -46,6 +47,93 @@ class TestActionDeleteSnapshots(TestCase):
         slo = SnapshotList(client, repository=testvars.repo_name)
         do = DeleteSnapshots(slo)
         self.assertRaises(FailedExecution, do.do_action)
+    def builder(self):
+        self.client = Mock()
+        self.client.snapshot.get.return_value = testvars.snapshots
+        self.client.snapshot.get_repository.return_value = testvars.test_repo
+        self.client.snapshot.delete.return_value = None
+        self.slo = SnapshotList(self.client, repository=testvars.repo_name)
+    def test_do_action_one_batch(self):
+        self.builder()
+        do = DeleteSnapshots(self.slo)
+        do.do_action()
+        self.client.snapshot.delete.assert_called_once_with(
+            repository=testvars.repo_name, snapshot='snap_name,snapshot-2015.03.01'
+        )
+        self.assertEqual({'snap_name': None, 'snapshot-2015.03.01': None}, do.results)
+    def test_do_action_batch_size(self):
+        self.builder()
+        do = DeleteSnapshots(self.slo, batch_size=1)
+        do.do_action()
+        self.assertEqual(2, self.client.snapshot.delete.call_count)
+    def test_do_action_retry_batch(self):
+        self.builder()
+        self.client.snapshot.delete.side_effect = [testvars.four_oh_one, None]
+        do = DeleteSnapshots(self.slo, retry_interval=0, retry_count=1)
+        do.do_action()
+        self.assertEqual(2, self.client.snapshot.delete.call_count)
+        self.assertEqual({'snap_name': None, 'snapshot-2015.03.01': None}, do.results)
+    def test_do_action_failed_batch_split(self):
+        self.builder()
+        self.client.snapshot.delete.side_effect = [
+            testvars.four_oh_one, None, testvars.four_oh_one
+        ]
+        do = DeleteSnapshots(self.slo, retry_interval=0, retry_count=0)
+        self.assertRaises(FailedExecution, do.do_action)
+        self.assertEqual(3, self.client.snapshot.delete.call_count)
+        self.assertIsNone(do.results['snap_name'])
+        self.assertEqual(testvars.four_oh_one, do.results['snapshot-2015.03.01'])
+    def api_error(self, cls, status, error):
+        return cls(error, meta=Mock(status=status), body={})
+    def test_do_action_not_found_no_retry(self):
+        self.builder()
+        missing = self.api_error(NotFoundError, 404, 'snapshot_missing_exception')
+        self.client.snapshot.delete.side_effect = [missing, None, missing]
+        do = DeleteSnapshots(self.slo, retry_count=3)
+        with patch('curator.actions.snapshot.time.sleep') as sleeper:
+            do.do_action()
+        sleeper.assert_not_called()
+        # The batch is split at once, and the missing snapshot counts as deleted
+        self.assertEqual(3, self.client.snapshot.delete.call_count)
+        self.assertEqual({'snap_name': None, 'snapshot-2015.03.01': None}, do.results)
+    def test_do_action_no_retry_bad_request(self):
+        self.builder()
+        bad = self.api_error(ApiError, 400, 'illegal_argument_exception')
+        self.client.snapshot.delete.side_effect = bad
+        do = DeleteSnapshots(self.slo, retry_count=3, batch_size=1)
+        with patch('curator.actions.snapshot.time.sleep') as sleeper:
+            self.assertRaises(FailedExecution, do.do_action)
+        sleeper.assert_not_called()
+        self.assertEqual(2, self.client.snapshot.delete.call_count)
+    def test_do_action_retry_transient(self):
+        self.builder()
+        self.client.snapshot.delete.side_effect = [
+            self.api_error(ApiError, 503, 'concurrent_snapshot_execution_exception'),
+            self.api_error(ApiError, 429, 'es_rejected_execution_exception'),
+            None,
+        ]
+        do = DeleteSnapshots(self.slo, retry_interval=0, retry_count=2)
+        do.do_action()
+        self.assertEqual(3, self.client.snapshot.delete.call_count)
+        self.assertEqual({'snap_name': None, 'snapshot-2015.03.01': None}, do.results)
+    def test_do_action_multiple_repositories(self):
+        self.client = Mock()
+        self.client.snapshot.get.return_value = testvars.snapshots
+        self.client.snapshot.get_repository.return_value = testvars.test_repos
+        self.client.snapshot.delete.return_value = None
+        slo = SnapshotList(self.client, repository='*')
+        slo.filter_by_regex(kind='prefix', value='snap_')
+        do = DeleteSnapshots(slo)
+        do.do_action()
+        self.assertEqual(2, self.client.snapshot.delete.call_count)
+        self.assertEqual(
+            {('TESTING', 'snap_name'), ('repo_name', 'snap_name')},
+            {(call.kwargs['repository'], call.kwargs['snapshot'])
+             for call in self.client.snapshot.delete.call_args_list}
+        )
+        self.assertEqual(
+            {'TESTING/snap_name': None, 'repo_name/snap_name': None}, do.results
+        )
     ### This check is not necessary after ES 7.16 as it is possible to have
     ### up to 1000 concurrent snapshots
     ###
@@ -1,9 +1,13 @@
 """test_action_forcemerge"""
 # pylint: disable=missing-function-docstring, missing-class-docstring, protected-access, attribute-defined-outside-init
+import json
+import os
+import tempfile
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from curator.actions import ForceMerge
-from curator.exceptions import FailedExecution, MissingArgument
+from curator.exceptions import (
+    ConfigurationError, FailedExecution, MissingArgument, NoIndices)
 from curator import IndexList
 # Get test variables and constants from a single source
 from . import testvars
@@ -18,6 +22,7 @@ class TestActionForceMerge(TestCase):
         self.client.indices.stats.return_value = testvars.stats_one
         self.client.indices.exists_alias.return_value = False
         self.client.indices.segments.return_value = testvars.shards
+        self.client.tasks.list.return_value = {'tasks': []}
         self.ilo = IndexList(self.client)
     def test_init_raise_bad_client(self):
         self.assertRaises(
@@ -54,3 +59,124 @@ class TestActionForceMerge(TestCase):
         self.client.indices.optimize.side_effect = testvars.fake_fail
         fmo = ForceMerge(self.ilo, max_num_segments=2)
         self.assertRaises(FailedExecution, fmo.do_action)
+    def merge_builder(self):
+        self.builder()
+        self.ilo.indices = ['index-1', 'index-2', 'index-3']
+        self.client.cat.shards.return_value = [
+            {'index': 'index-1', 'node': 'node-a'},
+            {'index': 'index-2', 'node': 'node-a'},
+            {'index': 'index-3', 'node': 'node-b'},
+        ]
+        self.client.indices.forcemerge.side_effect = [
+            {'task': f'node-a:{num}'} for num in range(3)]
+    def test_merge_by_node(self):
+        self.merge_builder()
+        self.client.tasks.get.side_effect = [
+            {'completed': True}, {'completed': False},
+            {'completed': True}, {'completed': True}]
+        fmo = ForceMerge(self.ilo, max_num_segments=2, max_merges_per_node=1)
+        with patch('curator.actions.forcemerge.sleep'):
+            self.assertIsNone(fmo.merge_by_node())
+        # index-2 waits for index-1 to finish on node-a, but index-3 does not
+        merged = [
+            call.kwargs['index'] for call in self.client.indices.forcemerge.call_args_list]
+        self.assertEqual(['index-1', 'index-3', 'index-2'], merged)
+        self.assertFalse(
+            self.client.indices.forcemerge.call_args.kwargs['wait_for_completion'])
+    def test_merge_by_node_failure(self):
+        self.merge_builder()
+        self.client.tasks.get.side_effect = [
+            {'completed': True, 'error': {'type': 'simulated'}},
+            {'completed': True}, {'completed': True}]
+        fmo = ForceMerge(self.ilo, max_num_segments=2, max_merges_per_node=1)
+        with patch('curator.actions.forcemerge.sleep'):
+            self.assertRaisesRegex(FailedExecution, 'index-1', fmo.merge_by_node)
+        self.assertEqual(3, self.client.indices.forcemerge.call_count)
+    def test_init_raise_expunge_with_segment_count(self):
+        self.builder()
+        self.assertRaises(
+            ConfigurationError, ForceMerge, self.ilo, max_num_segments=2,
+            only_expunge_deletes=True)
+    def test_do_action_only_expunge_deletes(self):
+        self.builder()
+        self.client.indices.forcemerge.return_value = None
+        fmo = ForceMerge(self.ilo, only_expunge_deletes=True)
+        self.assertIsNone(fmo.do_action())
+        # Indices already at one segment per shard are still merged
+        self.client.indices.segments.assert_not_called()
+        self.client.indices.forcemerge.assert_called_once_with(
+            index=self.ilo.indices[0], only_expunge_deletes=True)
+    def test_merge_by_node_in_flight(self):
+        self.merge_builder()
+        self.client.tasks.get.return_value = {'completed': True}
+        fmo = ForceMerge(self.ilo, max_num_segments=2, max_merges_per_node=1)
+        fmo.in_flight = {'index-1': 'node-a:99'}
+        self.ilo.indices = ['index-2', 'index-3']
+        with patch('curator.actions.forcemerge.sleep'):
+            self.assertIsNone(fmo.merge_by_node())
+        # index-2 waits for the running merge of index-1 on node-a
+        merged = [
+            call.kwargs['index'] for call in self.client.indices.forcemerge.call_args_list]
+        self.assertEqual(['index-3', 'index-2'], merged)
+        self.client.tasks.get.assert_any_call(task_id='node-a:99')
+    def test_do_action_skips_in_flight(self):
+        self.builder()
+        self.client.tasks.list.return_value = {'tasks': [{
+            'node': 'node-a', 'id': 1,
+            'description': f'Force-merge indices [{testvars.named_index}], maxSegments[2]'
+        }]}
+        fmo = ForceMerge(self.ilo, max_num_segments=2)
+        self.assertRaises(NoIndices, fmo.do_action)
+        self.client.indices.forcemerge.assert_not_called()
+    def test_do_action_untracked(self):
+        self.builder()
+        self.client.indices.stats.reset_mock()
+        fmo = ForceMerge(self.ilo, max_num_segments=2)
+        self.assertIsNone(fmo.do_action())
+        # Running merges are looked up with one request, but index sizes are not
+        self.client.tasks.list.assert_called_once()
+        self.client.indices.stats.assert_not_called()
+    def test_do_action_tasks_failure(self):
+        self.builder()
+        self.client.tasks.list.side_effect = testvars.fake_fail
+        fmo = ForceMerge(self.ilo, max_num_segments=2)
+        self.assertRaises(FailedExecution, fmo.do_action)
+        self.client.indices.forcemerge.assert_not_called()
+    def journal_builder(self):
+        self.builder()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.journal = os.path.join(self.tmpdir.name, 'journal.json')
+    def test_do_action_journal(self):
+        self.journal_builder()
+        fmo = ForceMerge(self.ilo, max_num_segments=2, merge_journal=self.journal)
+        self.assertIsNone(fmo.do_action())
+        self.assertEqual(1, self.client.indices.forcemerge.call_count)
+        with open(self.journal, 'r', encoding='utf-8') as journal_file:
+            entry = json.load(journal_file)[testvars.named_index]
+        self.assertEqual('max_num_segments=2', entry['goal'])
+        self.assertIn('merged', entry)
+        # A second run skips the index without fetching its segments again
+        self.client.indices.segments.reset_mock()
+        ilo = IndexList(self.client)
+        fmo = ForceMerge(ilo, max_num_segments=2, merge_journal=self.journal)
+        self.assertRaises(NoIndices, fmo.do_action)
+        self.assertEqual(1, self.client.indices.forcemerge.call_count)
+        self.client.indices.segments.assert_not_called()
+        # A different goal merges it again
+        fmo = ForceMerge(
+            IndexList(self.client), max_num_segments=1, merge_journal=self.journal)
+        self.assertIsNone(fmo.do_action())
+        self.assertEqual(2, self.client.indices.forcemerge.call_count)
+    def test_do_action_journal_unfinished_task(self):
+        self.journal_builder()
+        with open(self.journal, 'w', encoding='utf-8') as journal_file:
+            json.dump({testvars.named_index: {
+                'uuid': 'random_uuid_string_here', 'goal': 'max_num_segments=2',
+                'task': 'node-a:7'}}, journal_file)
+        # The merge completed after the last run stopped
+        self.client.tasks.get.return_value = {'completed': True}
+        fmo = ForceMerge(self.ilo, max_num_segments=2, merge_journal=self.journal)
+        self.assertRaises(NoIndices, fmo.do_action)
+        self.client.indices.forcemerge.assert_not_called()
+        self.assertIn('merged', fmo.journal.record[testvars.named_index])
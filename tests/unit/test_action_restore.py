@@ -3,7 +3,7 @@
 from unittest import TestCase
 from unittest.mock import Mock
 from curator.actions import Restore
-from curator.exceptions import CuratorException, FailedExecution, FailedRestore, SnapshotInProgress
+from curator.exceptions import ActionError, CuratorException, FailedExecution, FailedRestore, MissingArgument, NoIndices, SnapshotInProgress
 from curator import SnapshotList
 # Get test variables and constants from a single source
 from . import testvars
@@ -17,6 +17,12 @@ class TestActionRestore(TestCase):
         client.snapshot.get_repository.return_value = testvars.test_repo
         slo = SnapshotList(client, repository=testvars.repo_name)
         self.assertRaises(CuratorException, Restore, slo)
+    def test_init_raise_multiple_repositories(self):
+        client = Mock()
+        client.snapshot.get.return_value = testvars.snapshots
+        client.snapshot.get_repository.return_value = testvars.test_repos
+        slo = SnapshotList(client, repository='*')
+        self.assertRaises(ActionError, Restore, slo)
     def test_snapshot_derived_name(self):
         client = Mock()
         client.snapshot.get.return_value = testvars.snapshots
@@ -121,7 +127,7 @@ class TestActionRestore(TestCase):
         client.info.return_value = {'version': {'number': '5.0.0'} }
         client.snapshot.get.return_value = testvars.snapshots
         client.snapshot.get_repository.return_value = testvars.test_repo
-        client.snapshot.status.return_value = testvars.nosnap_running
+        client.cluster.state.return_value = testvars.nosnap_running
         client.snapshot.verify_repository.return_value = testvars.verified_nodes
         client.cat.indices.return_value = testvars.state_named
         client.indices.get_settings.return_value = testvars.settings_named
@@ -133,7 +139,7 @@ class TestActionRestore(TestCase):
         client = Mock()
         client.snapshot.get.return_value = testvars.snapshots
         client.snapshot.get_repository.return_value = testvars.test_repo
-        client.snapshot.status.return_value = testvars.snap_running
+        client.cluster.state.return_value = testvars.snap_running
         client.snapshot.verify_repository.return_value = testvars.verified_nodes
         client.indices.get_settings.return_value = testvars.settings_named
         slo = SnapshotList(client, repository=testvars.repo_name)
@@ -143,7 +149,7 @@ class TestActionRestore(TestCase):
         client = Mock()
         client.snapshot.get.return_value = testvars.snapshots
         client.snapshot.get_repository.return_value = testvars.test_repo
-        client.snapshot.status.return_value = testvars.nosnap_running
+        client.cluster.state.return_value = testvars.nosnap_running
         client.snapshot.verify_repository.return_value = testvars.verified_nodes
         client.indices.get_settings.return_value = testvars.settings_named
         slo = SnapshotList(client, repository=testvars.repo_name)
@@ -153,10 +159,62 @@ class TestActionRestore(TestCase):
         client = Mock()
         client.snapshot.get.return_value = testvars.snapshots
         client.snapshot.get_repository.return_value = testvars.test_repo
-        client.snapshot.status.return_value = testvars.nosnap_running
+        client.cluster.state.return_value = testvars.nosnap_running
         client.snapshot.verify_repository.return_value = testvars.verified_nodes
         client.indices.get_settings.return_value = testvars.settings_named
         client.snapshot.restore.side_effect = testvars.fake_fail
         slo = SnapshotList(client, repository=testvars.repo_name)
         ro = Restore(slo)
         self.assertRaises(FailedExecution, ro.do_action)
+    def builder_waves(self):
+        self.client = Mock()
+        self.client.snapshot.get.return_value = testvars.snapshots
+        self.client.snapshot.get_repository.return_value = testvars.test_repo
+        self.client.cluster.state.return_value = testvars.nosnap_running
+        self.client.cat.indices.return_value = testvars.state_named
+        self.client.indices.get_settings.return_value = testvars.settings_named
+        self.client.indices.recovery.return_value = testvars.recovery_output
+        self.slo = SnapshotList(self.client, repository=testvars.repo_name)
+    def test_get_waves_no_limits(self):
+        self.builder_waves()
+        ro = Restore(self.slo)
+        self.assertEqual([ro.indices], ro.get_waves())
+    def test_get_waves_by_size(self):
+        self.builder_waves()
+        ro = Restore(self.slo, max_wave_gb=1)
+        self.client.snapshot.get.return_value = {'snapshots': [{'index_details': {
+            'index-2015.01.01': {'size_in_bytes': 2**29},
+            'index-2015.02.01': {'size_in_bytes': 2**30},
+        }}]}
+        self.assertEqual(
+            [['index-2015.01.01'], ['index-2015.02.01']], ro.get_waves())
+    def test_do_action_waves(self):
+        self.builder_waves()
+        ro = Restore(self.slo, max_wave_indices=1, include_global_state=True,
+            wait_interval=0.5, max_wait=1)
+        self.assertIsNone(ro.do_action())
+        calls = self.client.snapshot.restore.call_args_list
+        self.assertEqual(
+            [['index-2015.01.01'], ['index-2015.02.01']],
+            [call.kwargs['indices'] for call in calls]
+        )
+        self.assertEqual(
+            [True, False], [call.kwargs['include_global_state'] for call in calls])
+    def test_time_window(self):
+        self.builder_waves()
+        ro = Restore(self.slo, timestring='%Y.%m.%d', date_from='2015.01.15',
+            date_to='2015.02.01')
+        self.assertEqual(['index-2015.02.01'], ro.indices)
+        self.assertEqual(['index-2015.02.01'], ro.expected_output)
+    def test_time_window_by_month(self):
+        self.builder_waves()
+        ro = Restore(self.slo, indices=['index-*'], timestring='%Y.%m',
+            date_from='2015.01', date_to='2015.01')
+        self.assertEqual(['index-2015.01.01'], ro.indices)
+    def test_time_window_no_indices(self):
+        self.builder_waves()
+        self.assertRaises(NoIndices, Restore, self.slo, timestring='%Y.%m.%d',
+            date_from='2016.01.01', date_to='2016.12.31')
+    def test_time_window_missing_arg(self):
+        self.builder_waves()
+        self.assertRaises(MissingArgument, Restore, self.slo, date_from='2015.01.01')
@@ -1,10 +1,12 @@
 """test_action_snapshot"""
 # pylint: disable=missing-function-docstring, missing-class-docstring, line-too-long, protected-access, attribute-defined-outside-init
+import tempfile
 from unittest import TestCase
 from unittest.mock import Mock
 from curator.actions import Snapshot
 from curator.exceptions import ActionError, CuratorException, FailedExecution, FailedSnapshot, MissingArgument, SnapshotInProgress
 from curator import IndexList
+from curator.snapshotlist import SnapshotIndexRecord
 # Get test variables and constants from a single source
 from . import testvars
 
@@ -61,7 +63,7 @@ class TestActionSnapshot(TestCase):
     def test_do_dry_run(self):
         self.builder()
         self.client.snapshot.create.return_value = None
-        self.client.snapshot.status.return_value = testvars.nosnap_running
+        self.client.cluster.state.return_value = testvars.nosnap_running
         self.client.snapshot.verify_repository.return_value = testvars.verified_nodes
         sso = Snapshot(self.ilo, repository=testvars.repo_name, name=testvars.snap_name)
         self.assertIsNone(sso.do_dry_run())
@@ -69,30 +71,122 @@ class TestActionSnapshot(TestCase):
         self.builder()
         self.client.snapshot.create.return_value = testvars.generic_task
         self.client.tasks.get.return_value = testvars.completed_task
-        self.client.snapshot.status.return_value = testvars.nosnap_running
+        self.client.cluster.state.return_value = testvars.nosnap_running
         self.client.snapshot.verify_repository.return_value = testvars.verified_nodes
         sso = Snapshot(self.ilo, repository=testvars.repo_name, name=testvars.snap_name)
         self.assertIsNone(sso.do_action())
     def test_do_action_raise_snap_in_progress(self):
         self.builder()
         self.client.snapshot.create.return_value = None
-        self.client.snapshot.status.return_value = testvars.snap_running
+        self.client.cluster.state.return_value = testvars.snap_running
         self.client.snapshot.verify_repository.return_value = testvars.verified_nodes
         sso = Snapshot(self.ilo, repository=testvars.repo_name, name=testvars.snap_name)
         self.assertRaises(SnapshotInProgress, sso.do_action)
     def test_do_action_no_wait_for_completion(self):
         self.builder()
         self.client.snapshot.create.return_value = testvars.generic_task
-        self.client.snapshot.status.return_value = testvars.nosnap_running
+        self.client.cluster.state.return_value = testvars.nosnap_running
         self.client.snapshot.verify_repository.return_value = testvars.verified_nodes
         sso = Snapshot(self.ilo, repository=testvars.repo_name,
             name=testvars.snap_name, wait_for_completion=False)
         self.assertIsNone(sso.do_action())
+    def builder_two(self):
+        self.builder()
+        self.client.cat.indices.return_value = testvars.state_two
+        self.client.indices.get_settings.return_value = testvars.settings_two
+        self.client.indices.stats.return_value = testvars.stats_two
+        self.ilo = IndexList(self.client)
+    def test_partitions(self):
+        self.builder_two()
+        sso = Snapshot(self.ilo, repository=testvars.repo_name,
+            name=testvars.snap_name, partitions=2)
+        self.assertEqual(
+            {'snap_name-1': ['index-2016.03.04'], 'snap_name-2': ['index-2016.03.03']},
+            sso.snapshots
+        )
+    def test_do_action_partitions(self):
+        self.builder_two()
+        self.client.cluster.state.return_value = testvars.nosnap_running
+        self.client.snapshot.get.return_value = {'snapshots': [
+            {'snapshot': 'snap_name-1', 'state': 'SUCCESS'},
+            {'snapshot': 'snap_name-2', 'state': 'SUCCESS'},
+        ]}
+        sso = Snapshot(self.ilo, repository=testvars.repo_name,
+            name=testvars.snap_name, partitions=2)
+        sso.do_action()
+        calls = self.client.snapshot.create.call_args_list
+        self.assertEqual(
+            [('snap_name-1', 'index-2016.03.04', True), ('snap_name-2', 'index-2016.03.03', False)],
+            [(c.kwargs['snapshot'], c.kwargs['indices'], c.kwargs['include_global_state']) for c in calls]
+        )
+        # One request per poll for both snapshots
+        self.assertEqual(
+            'snap_name-1,snap_name-2', self.client.snapshot.get.call_args.kwargs['snapshot']
+        )
+        self.assertEqual({'snap_name-1': 'SUCCESS', 'snap_name-2': 'SUCCESS'}, sso.states)
+    def test_report_state_partitions_failed(self):
+        self.builder_two()
+        self.client.snapshot.get.return_value = {'snapshots': [
+            {'snapshot': 'snap_name-1', 'state': 'SUCCESS'},
+            {'snapshot': 'snap_name-2', 'state': 'PARTIAL'},
+        ]}
+        sso = Snapshot(self.ilo, repository=testvars.repo_name,
+            name=testvars.snap_name, partitions=2)
+        self.assertRaises(FailedSnapshot, sso.report_state)
+        self.assertEqual('PARTIAL', sso.state)
+    def builder_unchanged(self):
+        self.builder_two()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.client.cluster.state.return_value = {
+            'metadata': {'repositories': {testvars.repo_name: {'uuid': 'abc123'}}}
+        }
+        self.client.indices.stats.return_value = {'indices': {
+            'index-2016.03.03': {'uuid': 'u3', 'shards': {'0': [{'seq_no': {'max_seq_no': 7}}]}},
+            'index-2016.03.04': {'uuid': 'u4', 'shards': {'0': [{'seq_no': {'max_seq_no': 9}}]}},
+        }}
+    def test_skip_unchanged_requires_cache_dir(self):
+        self.builder()
+        self.assertRaises(MissingArgument, Snapshot, self.ilo,
+            repository=testvars.repo_name, name=testvars.snap_name, skip_unchanged=True)
+    def test_skip_unchanged(self):
+        self.builder_unchanged()
+        record = SnapshotIndexRecord(self.client, testvars.repo_name, self.tmpdir.name)
+        record.update('old_snap', {
+            'index-2016.03.03': {'uuid': 'u3', 'shards': {'0': 7}},
+            'index-2016.03.04': {'uuid': 'u4', 'shards': {'0': 8}},
+        })
+        record.save()
+        self.client.snapshot.get.return_value = {'snapshots': [{'snapshot': 'old_snap'}]}
+        sso = Snapshot(self.ilo, repository=testvars.repo_name, name=testvars.snap_name,
+            skip_unchanged=True, snapshot_cache_dir=self.tmpdir.name)
+        self.assertEqual({testvars.snap_name: ['index-2016.03.04']}, sso.snapshots)
+        # A successful snapshot is recorded for the indices in it
+        sso.states = {testvars.snap_name: 'SUCCESS'}
+        sso.record_snapshots()
+        record = SnapshotIndexRecord(self.client, testvars.repo_name, self.tmpdir.name)
+        self.assertEqual(
+            {'snapshot': testvars.snap_name, 'uuid': 'u4', 'shards': {'0': 9}},
+            record.record['index-2016.03.04']
+        )
+    def test_skip_unchanged_nothing_changed(self):
+        self.builder_unchanged()
+        record = SnapshotIndexRecord(self.client, testvars.repo_name, self.tmpdir.name)
+        record.update('old_snap', {
+            'index-2016.03.03': {'uuid': 'u3', 'shards': {'0': 7}},
+            'index-2016.03.04': {'uuid': 'u4', 'shards': {'0': 9}},
+        })
+        record.save()
+        self.client.snapshot.get.return_value = {'snapshots': [{'snapshot': 'old_snap'}]}
+        sso = Snapshot(self.ilo, repository=testvars.repo_name, name=testvars.snap_name,
+            skip_unchanged=True, snapshot_cache_dir=self.tmpdir.name)
+        self.assertIsNone(sso.do_action())
+        self.client.snapshot.create.assert_not_called()
     def test_do_action_raise_on_failure(self):
         self.builder()
         self.client.snapshot.create.return_value = None
         self.client.snapshot.create.side_effect = testvars.fake_fail
-        self.client.snapshot.status.return_value = testvars.nosnap_running
+        self.client.cluster.state.return_value = testvars.nosnap_running
         self.client.snapshot.verify_repository.return_value = testvars.verified_nodes
         sso = Snapshot(self.ilo, repository=testvars.repo_name, name=testvars.snap_name)
         self.assertRaises(FailedExecution, sso.do_action)
@@ -260,6 +260,79 @@ class TestIndexListRegexFilters(TestCase):
         )
 
 
+class TestIndexListRegexChain(TestCase):
+    def builder(self, key='4'):
+        self.client = Mock()
+        self.client.info.return_value = get_es_ver()
+        self.client.cat.indices.return_value = get_testvals(key, 'state')
+        self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
+        self.client.indices.stats.return_value = get_testvals(key, 'stats')
+        self.client.indices.exists_alias.return_value = False
+        self.ilo = IndexList(self.client)
+
+    def test_chain_matches_sequential(self):
+        patterns = [
+            {'kind': 'regex', 'value': r'^[a-c]-'},
+            {'kind': 'suffix', 'value': '03.03', 'exclude': True},
+            {'kind': 'timestring', 'value': '%Y.%m.%d'},
+        ]
+        self.builder()
+        for pat in patterns:
+            self.ilo.filter_by_regex(**pat)
+        expected = sorted(self.ilo.indices)
+        self.builder()
+        self.ilo.filter_by_regex_chain(patterns)
+        self.assertEqual(expected, sorted(self.ilo.indices))
+        self.assertEqual(['b-2016.03.04', 'c-2016.03.05'], expected)
+
+    def test_chain_bad_kind(self):
+        self.builder()
+        patterns = [{'kind': 'prefix', 'value': 'a'}, {'kind': 'invalid', 'value': 'x'}]
+        self.assertRaises(ValueError, self.ilo.filter_by_regex_chain, patterns)
+        self.assertEqual(4, len(self.ilo.indices))
+
+    def test_chain_unknown_key(self):
+        self.builder()
+        patterns = [{'kind': 'prefix', 'value': 'a'}, {'knd': 'prefix', 'value': 'b'}]
+        self.assertRaises(
+            ConfigurationError, self.ilo.filter_by_regex_chain, patterns)
+        self.assertEqual(4, len(self.ilo.indices))
+
+    def test_chain_empty_before_last(self):
+        self.builder()
+        patterns = [
+            {'kind': 'prefix', 'value': 'z'},
+            {'kind': 'prefix', 'value': 'a'},
+        ]
+        self.assertRaises(NoIndices, self.ilo.filter_by_regex_chain, patterns)
+
+    def test_chain_empty_after_last(self):
+        self.builder()
+        patterns = [
+            {'kind': 'prefix', 'value': 'a'},
+            {'kind': 'prefix', 'value': 'b'},
+        ]
+        self.ilo.filter_by_regex_chain(patterns)
+        self.assertEqual([], self.ilo.indices)
+
+    def test_iterate_filters_fuses_patterns(self):
+        self.builder()
+        config = {
+            'filters': [
+                {
+                    'filtertype': 'pattern',
+                    'kind': 'prefix',
+                    'value': 'a',
+                    'exclude': True,
+                },
+                {'filtertype': 'pattern', 'kind': 'suffix', 'value': '06'},
+                {'filtertype': 'none'},
+            ]
+        }
+        self.ilo.iterate_filters(config)
+        self.assertEqual(['d-2016.03.06'], self.ilo.indices)
+
+
 class TestIndexListFilterByAge(TestCase):
     def builder(self, key='2'):
         self.client = Mock()
@@ -598,6 +671,28 @@ class TestIndexListFilterBySpace(TestCase):
         self.ilo.filter_by_space(disk_space=2.1, use_age=True)
         self.assertEqual(['a-2016.03.03'], self.ilo.indices)
 
+    def test_filter_pattern_single_group(self):
+        self.builder()
+        self.ilo.filter_by_space(disk_space=1.1, pattern=r'^(index)-.*$')
+        self.assertEqual(['index-2016.03.03'], self.ilo.indices)
+
+    def test_filter_pattern_per_group_budget(self):
+        self.builder()
+        # Each index is its own group and fits within its own budget
+        self.ilo.filter_by_space(disk_space=1.1, pattern=r'^index-2016\.03\.(\d+)$')
+        self.assertEqual([], self.ilo.indices)
+
+    def test_filter_pattern_prunes_non_matching(self):
+        self.builder(key='4')
+        self.ilo.filter_by_space(disk_space=0.5, pattern=r'^([ab])-.*$')
+        self.assertEqual(['a-2016.03.03', 'b-2016.03.04'], sorted(self.ilo.indices))
+
+    def test_filter_pattern_no_regex_group(self):
+        self.builder()
+        self.assertRaises(
+            ActionError, self.ilo.filter_by_space, disk_space=1.1, pattern='index'
+        )
+
 
 class TestIndexListFilterKibana(TestCase):
     def builder(self, key='2'):
@@ -973,6 +1068,21 @@ class TestIndexListFilterCount(TestCase):
             timestring='%Y.%m.%d',
         )
 
+    def test_pattern_single_group(self):
+        self.builder(key='4')
+        self.ilo.filter_by_count(count=2, pattern=r'^[a-d]-(\d{4})\..*$')
+        self.assertEqual(['a-2016.03.03', 'b-2016.03.04'], sorted(self.ilo.indices))
+
+    def test_pattern_keep_per_group(self):
+        self.builder(key='4')
+        self.ilo.filter_by_count(count=1, pattern=r'^([ab])-.*$', exclude=False)
+        self.assertEqual(['a-2016.03.03', 'b-2016.03.04'], sorted(self.ilo.indices))
+
+    def test_count_larger_than_group(self):
+        self.builder(key='4')
+        self.ilo.filter_by_count(count=10, exclude=False)
+        self.assertEqual(4, len(self.ilo.indices))
+
 
 class TestIndexListFilterShards(TestCase):
     def builder(self, key='2'):
@@ -1080,6 +1190,89 @@ class TestIndexListFilterShards(TestCase):
         )
 
 
+class TestIndexListSettingsAges(TestCase):
+    def builder(self, settings=None):
+        self.client = Mock()
+        self.client.info.return_value = get_es_ver()
+        self.client.cat.indices.return_value = get_testvals('2', 'state')
+        if settings is None:
+            settings = testvars.settings_two_dates
+        self.client.indices.get_settings.return_value = settings
+        self.client.indices.stats.return_value = get_testvals('2', 'stats')
+        self.client.indices.exists_alias.return_value = False
+        self.ilo = IndexList(self.client)
+        # 2016-03-05T00:00:00Z
+        self.epoch = 1457136000
+
+    def test_settings_dates_collected(self):
+        self.builder()
+        self.ilo.get_index_settings()
+        first = self.ilo.index_info['index-2016.03.03']['age']
+        second = self.ilo.index_info['index-2016.03.04']['age']
+        self.assertEqual(1420070400, first['origination_date'])
+        self.assertNotIn('start_time', first)
+        self.assertEqual(1457049600, second['start_time'])
+        self.assertEqual(1457136000, second['end_time'])
+
+    def test_age_min_value(self):
+        self.builder()
+        self.ilo.filter_by_age(
+            source='settings',
+            direction='older',
+            unit='days',
+            unit_count=1,
+            epoch=self.epoch,
+        )
+        self.assertEqual(['index-2016.03.03'], self.ilo.indices)
+
+    def test_age_max_value(self):
+        self.builder()
+        self.ilo.filter_by_age(
+            source='settings',
+            direction='younger',
+            unit='days',
+            unit_count=1,
+            epoch=self.epoch,
+            stats_result='max_value',
+        )
+        self.assertEqual(['index-2016.03.04'], self.ilo.indices)
+
+    def test_age_bad_stats_result(self):
+        self.builder()
+        self.assertRaises(
+            ValueError,
+            self.ilo.filter_by_age,
+            source='settings',
+            direction='older',
+            unit='days',
+            unit_count=1,
+            stats_result='invalid',
+        )
+
+    def test_no_date_settings(self):
+        self.builder(settings=testvars.settings_two)
+        self.ilo.filter_by_age(
+            source='settings',
+            direction='older',
+            unit='days',
+            unit_count=1,
+            epoch=self.epoch,
+        )
+        self.assertEqual([], self.ilo.indices)
+
+    def test_period_intersect(self):
+        self.builder()
+        self.ilo.filter_period(
+            source='settings',
+            range_from=-1,
+            range_to=0,
+            unit='days',
+            epoch=self.epoch,
+            intersect=True,
+        )
+        self.assertEqual(['index-2016.03.04'], self.ilo.indices)
+
+
 class TestIndexListPeriodFilterName(TestCase):
     def builder(self, key='2'):
         self.client = Mock()
@@ -1206,6 +1399,47 @@ class TestPeriodFilterAbsolute(TestCase):
         )
 
 
+class TestIndexListFilterDeletedDocs(TestCase):
+    def builder(self, key='2'):
+        self.client = Mock()
+        self.client.info.return_value = get_es_ver()
+        self.client.cat.indices.return_value = get_testvals(key, 'state')
+        self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
+        stats = deepcopy(get_testvals(key, 'stats'))
+        # 0.03 and 0.30 of the documents in each index are deleted
+        for index, deleted in [('index-2016.03.03', 0.03), ('index-2016.03.04', 0.3)]:
+            docs = stats['indices'][index]['total']['docs']
+            docs['deleted'] = int(docs['count'] * deleted / (1 - deleted))
+        self.client.indices.stats.return_value = stats
+        self.client.indices.exists_alias.return_value = False
+        self.ilo = IndexList(self.client)
+
+    def test_missing_deleted_ratio(self):
+        self.builder()
+        self.assertRaises(MissingArgument, self.ilo.filter_deleted_docs)
+
+    def test_filter_default_result(self):
+        self.builder()
+        self.ilo.filter_deleted_docs(deleted_ratio=0.2)
+        self.assertEqual(['index-2016.03.04'], self.ilo.indices)
+
+    def test_filter_default_result_and_exclude(self):
+        self.builder()
+        self.ilo.filter_deleted_docs(deleted_ratio=0.2, exclude=True)
+        self.assertEqual(['index-2016.03.03'], self.ilo.indices)
+
+    def test_filter_by_threshold_behavior_less_than(self):
+        self.builder()
+        self.ilo.filter_deleted_docs(deleted_ratio=0.2, threshold_behavior='less_than')
+        self.assertEqual(['index-2016.03.03'], self.ilo.indices)
+
+    def test_iterate_filters(self):
+        self.builder()
+        config = {'filters': [{'filtertype': 'deleted_docs', 'deleted_ratio': 0.2}]}
+        self.ilo.iterate_filters(config)
+        self.assertEqual(['index-2016.03.04'], self.ilo.indices)
+
+
 class TestIndexListFilterBySize(TestCase):
     def builder(self, key='2'):
         self.client = Mock()
@@ -1,9 +1,12 @@
 """test_class_snapshot_list"""
+import os
+import tempfile
 from unittest import TestCase
 from unittest.mock import Mock
 import yaml
 from es_client.exceptions import FailedValidation
 from curator import SnapshotList
+from curator.snapshotlist import SnapshotCatalog, SnapshotIndexRecord
 from curator.exceptions import ConfigurationError, FailedExecution, MissingArgument, NoSnapshots
 # Get test variables and constants from a single source
 from . import testvars
@@ -34,6 +37,45 @@ class TestSnapshotListClientAndInit(TestCase):
             ['snap_name','snapshot-2015.03.01'], sorted(sl.snapshots)
         )
 
+    def test_all_snapshots_fetched_once(self):
+        client = Mock()
+        client.snapshot.get.return_value = testvars.snapshots
+        client.snapshot.get_repository.return_value = testvars.test_repo
+        sl = SnapshotList(client, repository=testvars.repo_name)
+        calls = client.snapshot.get.call_count
+        self.assertEqual(testvars.snapshots['snapshots'], sl.all_snapshots)
+        self.assertEqual(testvars.snapshots['snapshots'], sl.all_snapshots)
+        self.assertEqual(calls + 1, client.snapshot.get.call_count)
+
+    def test_init_without_index_names(self):
+        client = Mock()
+        client.snapshot.get.return_value = {'snapshots': [
+            {'snapshot': testvars.snap_name, 'state': 'SUCCESS'}
+        ]}
+        client.snapshot.get_repository.return_value = testvars.test_repo
+        sl = SnapshotList(client, repository=testvars.repo_name, index_names=False)
+        self.assertFalse(client.snapshot.get.call_args.kwargs['index_names'])
+        client.snapshot.get.return_value = testvars.snapshot
+        self.assertEqual(
+            testvars.named_indices, sl.get_snapshot_indices(testvars.snap_name)
+        )
+        # Fetched once, then kept in snapshot_info
+        sl.get_snapshot_indices(testvars.snap_name)
+        self.assertEqual(2, client.snapshot.get.call_count)
+
+    def test_compact_snapshot_info(self):
+        client = Mock()
+        client.snapshot.get.return_value = testvars.snapshots
+        client.snapshot.get_repository.return_value = testvars.test_repo
+        sl = SnapshotList(client, repository=testvars.repo_name)
+        info = sl.snapshot_info[testvars.snap_name]
+        self.assertEqual('SUCCESS', info['state'])
+        self.assertEqual(1422748800, info['start_time_in_millis'])
+        self.assertEqual(tuple(testvars.named_indices), info['indices'])
+        self.assertNotIn('age_by_name', info)
+        self.assertRaises(KeyError, info.__getitem__, 'failures')
+        self.assertFalse(hasattr(info, '__dict__'))
+
 class TestSnapshotListOtherMethods(TestCase):
     def test_empty_list(self):
         client = Mock()
@@ -253,6 +295,32 @@ class TestSnapshotListFilterByAge(TestCase):
             epoch=1456963200
         )
         self.assertEqual(['snapshot-2015.03.01'], sl.snapshots)
+    def test_filter_by_age__exact_point_of_reference(self):
+        client = Mock()
+        client.snapshot.get.return_value = testvars.snapshots
+        client.snapshot.get_repository.return_value = testvars.test_repo
+        sl = SnapshotList(client, repository=testvars.repo_name)
+        # A snapshot exactly at the point of reference is neither older nor younger
+        sl.filter_by_age(direction='younger', unit='seconds', unit_count=0,
+            epoch=1422748800, exclude=True
+        )
+        self.assertEqual(['snap_name'], sl.snapshots)
+    def test_filter_by_age__reuses_age_index(self):
+        client = Mock()
+        client.snapshot.get.return_value = testvars.snapshots
+        client.snapshot.get_repository.return_value = testvars.test_repo
+        sl = SnapshotList(client, repository=testvars.repo_name)
+        sl.filter_by_age(direction='older', unit='seconds', unit_count=0,
+            epoch=1425168003
+        )
+        self.assertEqual(
+            [(1422748800, 'snap_name'), (1425168002, 'snapshot-2015.03.01')],
+            sl.age_index['start_time_in_millis']
+        )
+        sl.filter_by_age(direction='older', unit='seconds', unit_count=0,
+            epoch=1425168002
+        )
+        self.assertEqual(['snap_name'], sl.snapshots)
     def test_filter_by_age__creation_date_older_than_now(self):
         client = Mock()
         client.snapshot.get.return_value = testvars.snapshots
@@ -405,6 +473,59 @@ class TestSnapshotListFilterCount(TestCase):
         slo._sort_by_age(snaps)
         self.assertEqual(['snapshot-2015.03.01'], slo.snapshots)
 
+class TestSnapshotListMultipleRepositories(TestCase):
+    def builder(self, repository='*'):
+        self.client = Mock()
+        self.client.snapshot.get.return_value = testvars.snapshots
+        self.client.snapshot.get_repository.return_value = testvars.test_repos
+        self.slo = SnapshotList(self.client, repository=repository)
+    def test_init_pattern(self):
+        self.builder()
+        self.assertEqual(['TESTING', 'repo_name'], self.slo.repositories)
+        self.assertIsNone(self.slo.repository)
+        self.client.snapshot.get_repository.assert_called_once_with(name='*')
+        # The same snapshot names in both repositories are kept apart
+        self.assertEqual(
+            ['TESTING/snap_name', 'TESTING/snapshot-2015.03.01',
+             'repo_name/snap_name', 'repo_name/snapshot-2015.03.01'],
+            sorted(self.slo.snapshots)
+        )
+        self.assertEqual('TESTING', self.slo.snapshot_info['TESTING/snap_name'].repository)
+        self.assertEqual(
+            {'TESTING', 'repo_name'},
+            {call.kwargs['repository'] for call in self.client.snapshot.get.call_args_list}
+        )
+    def test_init_list(self):
+        self.builder(repository=['repo_name', 'TESTING'])
+        self.client.snapshot.get_repository.assert_called_once_with(
+            name='TESTING,repo_name'
+        )
+        self.assertEqual(4, len(self.slo.snapshots))
+    def test_init_no_matching_repositories(self):
+        client = Mock()
+        client.snapshot.get_repository.return_value = {}
+        self.assertRaises(FailedExecution, SnapshotList, client, repository='none-*')
+    def test_regex_uses_snapshot_name(self):
+        self.builder()
+        self.slo.filter_by_regex(kind='prefix', value='snap_')
+        self.assertEqual(
+            ['TESTING/snap_name', 'repo_name/snap_name'], sorted(self.slo.snapshots)
+        )
+    def test_count_per_repository(self):
+        self.builder()
+        self.slo.filter_by_count(count=1, use_age=True, source='creation_date')
+        self.assertEqual(
+            ['TESTING/snap_name', 'repo_name/snap_name'], sorted(self.slo.snapshots)
+        )
+    def test_get_snapshot_indices(self):
+        self.builder()
+        self.slo.snapshot_info['TESTING/snap_name']['indices'] = None
+        self.client.snapshot.get.return_value = testvars.snapshot
+        self.slo.get_snapshot_indices('TESTING/snap_name')
+        self.client.snapshot.get.assert_called_with(
+            repository='TESTING', snapshot='snap_name'
+        )
+
 class TestSnapshotListPeriodFilter(TestCase):
     def test_bad_args(self):
         unit = 'days'
@@ -511,3 +632,106 @@ class TestSnapshotListPeriodFilter(TestCase):
             range_from=range_from, range_to=range_to, source='name',
             timestring=timestring, epoch=epoch
         )
+
+
+class TestSnapshotCatalog(TestCase):
+    def builder(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.client = Mock()
+        self.client.cluster.state.return_value = {
+            'metadata': {'repositories': {testvars.repo_name: {'uuid': 'abc123'}}}
+        }
+        self.client.snapshot.get_repository.return_value = testvars.test_repo
+    def test_first_run_writes_cache(self):
+        self.builder()
+        self.client.snapshot.get.return_value = testvars.snapshots
+        sl = SnapshotList(
+            self.client, repository=testvars.repo_name, cache_dir=self.tmpdir.name
+        )
+        self.assertEqual(['snap_name', 'snapshot-2015.03.01'], sl.snapshots)
+        path = os.path.join(self.tmpdir.name, f'{testvars.repo_name}-abc123.json')
+        self.assertTrue(os.path.isfile(path))
+        self.assertNotIn('from_sort_value', self.client.snapshot.get.call_args.kwargs)
+    def test_incremental_refresh(self):
+        self.builder()
+        self.client.snapshot.get.return_value = testvars.snapshots
+        SnapshotCatalog(self.client, testvars.repo_name, self.tmpdir.name).get_snapshots()
+        newer = {
+            'snapshot': 'snapshot-2015.04.01', 'state': 'SUCCESS',
+            'start_time_in_millis': 1427846400000, 'end_time_in_millis': 0,
+        }
+        self.client.snapshot.get.side_effect = [
+            # Snapshots started since the newest cached one
+            {'snapshots': [testvars.snapshots['snapshots'][1], newer]},
+            # The names-only listing shows snap_name was deleted
+            {'snapshots': [{'snapshot': 'snapshot-2015.03.01'},
+                           {'snapshot': 'snapshot-2015.04.01'}]},
+        ]
+        catalog = SnapshotCatalog(self.client, testvars.repo_name, self.tmpdir.name)
+        result = catalog.get_snapshots()
+        self.assertEqual(
+            ['snapshot-2015.03.01', 'snapshot-2015.04.01'],
+            [snap['snapshot'] for snap in result]
+        )
+        first_call = self.client.snapshot.get.call_args_list[-2].kwargs
+        self.assertEqual('1425168002', first_call['from_sort_value'])
+        self.assertEqual(2, len(catalog.load()['snapshots']))
+    def test_in_progress_not_cached(self):
+        self.builder()
+        self.client.snapshot.get.return_value = testvars.inprogress
+        catalog = SnapshotCatalog(self.client, testvars.repo_name, self.tmpdir.name)
+        catalog.get_snapshots()
+        data = catalog.load()
+        self.assertEqual(['snap_name'], [snap['snapshot'] for snap in data['snapshots']])
+        # The next refresh starts from the unfinished snapshot
+        self.assertEqual(1425168002, data['refresh_from'])
+    def test_unknown_uuid_disables_cache(self):
+        self.builder()
+        self.client.cluster.state.return_value = {}
+        self.client.snapshot.get.return_value = testvars.snapshots
+        catalog = SnapshotCatalog(self.client, testvars.repo_name, self.tmpdir.name)
+        self.assertEqual(2, len(catalog.get_snapshots()))
+        self.assertIsNone(catalog.path)
+        self.assertEqual([], os.listdir(self.tmpdir.name))
+
+class TestSnapshotIndexRecord(TestCase):
+    SEQ_NOS = {
+        'index1': {'uuid': 'u1', 'shards': {'0': 10, '1': 12}},
+        'index2': {'uuid': 'u2', 'shards': {'0': 5}},
+    }
+    def builder(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.client = Mock()
+        self.client.cluster.state.return_value = {
+            'metadata': {'repositories': {testvars.repo_name: {'uuid': 'abc123'}}}
+        }
+        self.client.snapshot.get.return_value = {'snapshots': [{'snapshot': 'snap1'}]}
+    def test_empty_record(self):
+        self.builder()
+        record = SnapshotIndexRecord(self.client, testvars.repo_name, self.tmpdir.name)
+        self.assertEqual([], record.get_unchanged(self.SEQ_NOS))
+    def test_unchanged(self):
+        self.builder()
+        record = SnapshotIndexRecord(self.client, testvars.repo_name, self.tmpdir.name)
+        record.update('snap1', self.SEQ_NOS)
+        record.save()
+        record = SnapshotIndexRecord(self.client, testvars.repo_name, self.tmpdir.name)
+        current = {
+            'index1': {'uuid': 'u1', 'shards': {'0': 10, '1': 12}},
+            # A write since the snapshot
+            'index2': {'uuid': 'u2', 'shards': {'0': 6}},
+        }
+        self.assertEqual(['index1'], record.get_unchanged(current))
+    def test_deleted_snapshot(self):
+        self.builder()
+        record = SnapshotIndexRecord(self.client, testvars.repo_name, self.tmpdir.name)
+        record.update('snap0', self.SEQ_NOS)
+        self.assertEqual([], record.get_unchanged(self.SEQ_NOS))
+    def test_recreated_index(self):
+        self.builder()
+        record = SnapshotIndexRecord(self.client, testvars.repo_name, self.tmpdir.name)
+        record.update('snap1', self.SEQ_NOS)
+        current = {'index2': {'uuid': 'new', 'shards': {'0': 5}}}
+        self.assertEqual([], record.get_unchanged(current))
@@ -0,0 +1,74 @@
+"""test_cli_singletons"""
+# pylint: disable=missing-function-docstring, missing-class-docstring, attribute-defined-outside-init
+import inspect
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock, patch
+from click.testing import CliRunner
+from curator.cli_singletons.delete import delete_snapshots
+from curator.cli_singletons.object_class import CLIAction
+from curator.cli_singletons.restore import restore
+from curator.cli_singletons.snapshot import snapshot
+# Get test variables and constants from a single source
+from . import testvars
+
+class TestCLIActionSnapshotCacheDir(TestCase):
+    def builder(self, action, options):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.client = Mock()
+        self.client.snapshot.get.return_value = testvars.snapshots
+        self.client.snapshot.get_repository.return_value = testvars.test_repo
+        self.client.tasks.get.return_value = testvars.no_snap_tasks
+        options['snapshot_cache_dir'] = self.tmpdir.name
+        with patch('curator.cli_singletons.object_class.Builder') as builder:
+            builder.return_value.client = self.client
+            self.cli = CLIAction(
+                action, {}, options, [{'filtertype': 'none'}], False,
+                repository=testvars.repo_name)
+    def check(self):
+        # The cache dir goes to the snapshot list, not to the action
+        self.assertNotIn('snapshot_cache_dir', self.cli.options)
+        self.assertEqual(self.tmpdir.name, self.cli.list_object.cache_dir)
+        inspect.signature(self.cli.action_class).bind(
+            self.cli.list_object, **self.cli.options)
+    def test_delete_snapshots(self):
+        self.builder('delete_snapshots', {'retry_count': 3})
+        self.check()
+        with self.assertRaises(SystemExit) as exc:
+            self.cli.do_singleton_action(dry_run=True)
+        self.assertEqual(0, exc.exception.code)
+    def test_restore(self):
+        self.builder('restore', {'name': None})
+        self.check()
+
+class TestSnapshotCacheDirFlag(TestCase):
+    def invoke(self, module, command):
+        with patch(f'curator.cli_singletons.{module}.CLIAction') as cli_action:
+            result = CliRunner().invoke(
+                command,
+                ['--repository', 'repo', '--snapshot_cache_dir', '/tmp/cache',
+                 '--filter_list', '{"filtertype":"none"}'],
+                obj={'configdict': {}, 'dry_run': True})
+        self.assertEqual(0, result.exit_code, result.output)
+        return cli_action.call_args.args[2]
+    def test_delete_snapshots(self):
+        options = self.invoke('delete', delete_snapshots)
+        self.assertEqual('/tmp/cache', options['snapshot_cache_dir'])
+    def test_restore(self):
+        options = self.invoke('restore', restore)
+        self.assertEqual('/tmp/cache', options['snapshot_cache_dir'])
+
+class TestSnapshotSkipUnchangedFlag(TestCase):
+    def test_snapshot(self):
+        with patch('curator.cli_singletons.snapshot.CLIAction') as cli_action:
+            result = CliRunner().invoke(
+                snapshot,
+                ['--repository', 'repo', '--skip_unchanged',
+                 '--snapshot_cache_dir', '/tmp/cache',
+                 '--filter_list', '{"filtertype":"none"}'],
+                obj={'configdict': {}, 'dry_run': True})
+        self.assertEqual(0, result.exit_code, result.output)
+        options = cli_action.call_args.args[2]
+        self.assertTrue(options['skip_unchanged'])
+        self.assertEqual('/tmp/cache', options['snapshot_cache_dir'])
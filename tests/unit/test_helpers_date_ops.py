@@ -8,7 +8,8 @@ from elastic_transport import ApiResponseMeta
 from curator.exceptions import ConfigurationError
 from curator.helpers.date_ops import (
     absolute_date_range, date_range, datetime_to_epoch, fix_epoch, get_date_regex, get_datemath,
-    get_point_of_reference, isdatemath
+    get_name_epoch, get_point_of_reference, isdatemath, iso2epoch, timestring_unit,
+    NAME_EPOCH_CACHE_SIZE
 )
 
 class TestGetDateRegex(TestCase):
@@ -52,6 +53,82 @@ class TestFixEpoch(TestCase):
         with pytest.raises(ValueError):
             fix_epoch(None)
 
+class TestIso2Epoch(TestCase):
+    """TestIso2Epoch
+
+    Test helpers.date_ops.iso2epoch functionality.
+    """
+    def test_iso2epoch(self):
+        """test_iso2epoch
+
+        Should return epoch seconds for ISO8601 values, with or without a timezone,
+        and for epoch millisecond strings
+        """
+        for value in [
+            '2016-03-04T00:00:00.000Z',
+            '2016-03-04T00:00:00Z',
+            '2016-03-04T01:00:00+01:00',
+            '2016-03-04T00:00:00',
+            '1457049600000',
+                ]:
+            assert 1457049600 == iso2epoch(value)
+    def test_iso2epoch_raise(self):
+        """test_iso2epoch_raise
+
+        Should raise a ``ValueError`` exception when an improper value is passed
+        """
+        with pytest.raises(ValueError):
+            iso2epoch('not a date')
+
+class TestGetNameEpoch(TestCase):
+    """TestGetNameEpoch
+
+    Test helpers.date_ops.get_name_epoch functionality.
+    """
+    def setUp(self):
+        get_name_epoch.cache_clear()
+    def test_get_name_epoch(self):
+        """test_get_name_epoch
+
+        Should return the epoch for a matching name, and None for a non-matching one
+        """
+        assert 1456963200 == get_name_epoch('%Y.%m.%d', 'index-2016.03.03')
+        assert get_name_epoch('%Y.%m.%d', 'index-no-date') is None
+    def test_get_name_epoch_memoized(self):
+        """test_get_name_epoch_memoized
+
+        Should only parse each name once per timestring, including non-matches
+        """
+        for _ in range(3):
+            get_name_epoch('%Y.%m.%d', 'index-2016.03.03')
+            get_name_epoch('%Y.%m.%d', 'index-no-date')
+        info = get_name_epoch.cache_info()
+        assert 2 == info.misses
+        assert 4 == info.hits
+        assert NAME_EPOCH_CACHE_SIZE == info.maxsize
+
+class TestTimestringUnit(TestCase):
+    """TestTimestringUnit
+
+    Test helpers.date_ops.timestring_unit functionality.
+    """
+    def test_smallest_unit(self):
+        """test_smallest_unit
+
+        Should return the smallest unit of time in the timestring
+        """
+        assert 'hours' == timestring_unit('%Y.%m.%d.%H')
+        assert 'days' == timestring_unit('%Y.%m.%d')
+        assert 'weeks' == timestring_unit('%Y.%W')
+        assert 'months' == timestring_unit('%Y-%m')
+    def test_no_date(self):
+        """test_no_date
+
+        Should raise ConfigurationError if the timestring has no date elements
+        """
+        with pytest.raises(ConfigurationError):
+            timestring_unit('no-date')
+
 class TestGetPointOfReference(TestCase):
     """TestGetPointOfReference
 
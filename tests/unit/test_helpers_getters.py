@@ -255,6 +255,437 @@ class TestGetSnapshotData(TestCase):
         with pytest.raises(FailedExecution, match=r'Error: 401'):
             getters.get_snapshot_data(client, repository=REPO_NAME)
 
+    def test_paginated(self):
+        """test_paginated
+
+        Should follow the ``next`` value until the last page, and leave out index
+        names if asked to
+        """
+        client = Mock()
+        client.snapshot.get.side_effect = [
+            {'snapshots': [SINGLE], 'next': 'page2'},
+            {'snapshots': [SNAPSHOTS['snapshots'][1]]},
+        ]
+        result = getters.get_snapshot_data(
+            client, repository=REPO_NAME, index_names=False, page_size=1
+        )
+        assert SNAPSHOTS['snapshots'] == result
+        assert 2 == client.snapshot.get.call_count
+        kwargs = client.snapshot.get.call_args.kwargs
+        assert 'page2' == kwargs['after']
+        assert 1 == kwargs['size']
+        assert kwargs['index_names'] is False
+
+    def test_paginated_from_sort_value(self):
+        """test_paginated_from_sort_value
+
+        Should send ``from_sort_value`` with the first page only, as Elasticsearch
+        rejects a request with both ``from_sort_value`` and ``after``
+        """
+        client = Mock()
+        client.snapshot.get.side_effect = [
+            {'snapshots': [SINGLE], 'next': 'page2'},
+            {'snapshots': [SINGLE], 'next': 'page3'},
+            {'snapshots': [SNAPSHOTS['snapshots'][1]]},
+        ]
+        pages = list(
+            getters.iter_snapshot_data(
+                client, repository=REPO_NAME, page_size=1, from_sort_value=1000
+            )
+        )
+        assert 3 == len(pages)
+        calls = [call.kwargs for call in client.snapshot.get.call_args_list]
+        assert '1000' == calls[0]['from_sort_value']
+        assert 'after' not in calls[0]
+        for kwargs in calls[1:]:
+            assert 'from_sort_value' not in kwargs
+        assert ['page2', 'page3'] == [kwargs['after'] for kwargs in calls[1:]]
+
+
+class TestGetSnapshotNames(TestCase):
+    """TestGetSnapshotNames
+
+    Test helpers.getters.get_snapshot_names functionality.
+    """
+
+    def test_return_data(self):
+        """test_return_data
+
+        Should return only the snapshot names, from a non-verbose request
+        """
+        client = Mock()
+        client.snapshot.get.return_value = SNAPSHOTS
+        assert [SNAP_NAME, 'snapshot-2015.03.01'] == getters.get_snapshot_names(
+            client, repository=REPO_NAME
+        )
+        assert client.snapshot.get.call_args.kwargs['verbose'] is False
+
+    def test_empty_repository(self):
+        """test_empty_repository
+
+        Should return an empty list when filter_path leaves an empty response
+        """
+        client = Mock()
+        client.snapshot.get.return_value = {}
+        assert not getters.get_snapshot_names(client, repository=REPO_NAME)
+
+
+class TestGetSnapshotState(TestCase):
+    """TestGetSnapshotState
+
+    Test helpers.getters.get_snapshot_state functionality.
+    """
+
+    def test_return_data(self):
+        """test_return_data
+
+        Should return only the state, from a request without the index names
+        """
+        client = Mock()
+        client.snapshot.get.return_value = {'snapshots': [{'state': 'IN_PROGRESS'}]}
+        assert 'IN_PROGRESS' == getters.get_snapshot_state(
+            client, repository=REPO_NAME, snapshot=SNAP_NAME
+        )
+        kwargs = client.snapshot.get.call_args.kwargs
+        assert kwargs['index_names'] is False
+        assert kwargs['filter_path'] == 'snapshots.state'
+
+    def test_not_found(self):
+        """test_not_found
+
+        Should return ``None`` when filter_path leaves an empty response
+        """
+        client = Mock()
+        client.snapshot.get.return_value = {}
+        assert getters.get_snapshot_state(client, repository=REPO_NAME) is None
+
+    def test_raises_exception(self):
+        """test_raises_exception
+
+        Should raise a ``FailedExecution`` exception on a TransportError
+        """
+        client = Mock()
+        client.snapshot.get.side_effect = TransportError(401, "simulated error")
+        with pytest.raises(FailedExecution, match=r'Error: 401'):
+            getters.get_snapshot_state(client, repository=REPO_NAME)
+
+
+class TestGetExistingIndices(TestCase):
+    """TestGetExistingIndices
+
+    Test helpers.getters.get_existing_indices functionality.
+    """
+
+    def test_return_data(self):
+        """test_return_data
+
+        Should return only the named indices that exist, without listing the others
+        """
+        client = Mock()
+        client.indices.get_settings.return_value = {
+            'index-2': {'settings': {'index': {'uuid': 'abc'}}}
+        }
+        assert ['index-2'] == getters.get_existing_indices(
+            client, ['index-1', 'index-2']
+        )
+        kwargs = client.indices.get_settings.call_args.kwargs
+        assert kwargs['index'] == 'index-1,index-2'
+        assert kwargs['ignore_unavailable'] is True
+        client.cat.indices.assert_not_called()
+
+    def test_empty_list(self):
+        """test_empty_list
+
+        Should not call the API for an empty list
+        """
+        client = Mock()
+        assert not getters.get_existing_indices(client, [])
+        client.indices.get_settings.assert_not_called()
+
+    def test_exception(self):
+        """test_exception
+
+        Should raise FailedExecution if the API call fails
+        """
+        client = Mock()
+        client.indices.get_settings.side_effect = FAKE_FAIL
+        with pytest.raises(FailedExecution):
+            getters.get_existing_indices(client, ['index-1'])
+
+
+class TestGetShardNodes(TestCase):
+    """TestGetShardNodes
+
+    Test helpers.getters.get_shard_nodes functionality.
+    """
+
+    def test_return_data(self):
+        """test_return_data
+
+        Should map each index to the nodes holding its shards, skipping unassigned
+        shards and counting relocating shards against the source node
+        """
+        client = Mock()
+        client.cat.shards.return_value = [
+            {'index': 'index-1', 'node': 'node-a'},
+            {'index': 'index-1', 'node': 'node-b'},
+            {'index': 'index-1', 'node': None},
+            {'index': 'index-2', 'node': 'node-b -> 10.0.0.3 XyZ node-c'},
+        ]
+        assert getters.get_shard_nodes(client, ['index-1', 'index-2', 'index-3']) == {
+            'index-1': {'node-a', 'node-b'},
+            'index-2': {'node-b'},
+            'index-3': set(),
+        }
+        kwargs = client.cat.shards.call_args.kwargs
+        assert kwargs['index'] == 'index-1,index-2,index-3'
+
+    def test_exception(self):
+        """test_exception
+
+        Should raise FailedExecution if the API call fails
+        """
+        client = Mock()
+        client.cat.shards.side_effect = FAKE_FAIL
+        with pytest.raises(FailedExecution):
+            getters.get_shard_nodes(client, ['index-1'])
+
+
+class TestGetForcemergeTasks(TestCase):
+    """TestGetForcemergeTasks
+
+    Test helpers.getters.get_forcemerge_tasks functionality.
+    """
+
+    def test_return_data(self):
+        """test_return_data
+
+        Should map each index named in a running forceMerge task to its task id
+        """
+        client = Mock()
+        client.tasks.list.return_value = {
+            'tasks': [
+                {
+                    'node': 'node-a',
+                    'id': 12,
+                    'description': (
+                        'Force-merge indices [index-1, index-2], maxSegments[1], '
+                        'onlyExpungeDeletes[false], flush[true]'
+                    ),
+                },
+                {'node': 'node-b', 'id': 3, 'description': ''},
+            ]
+        }
+        assert getters.get_forcemerge_tasks(client) == {
+            'index-1': 'node-a:12',
+            'index-2': 'node-a:12',
+        }
+
+    def test_exception(self):
+        """test_exception
+
+        Should raise FailedExecution if the API call fails
+        """
+        client = Mock()
+        client.tasks.list.side_effect = FAKE_FAIL
+        with pytest.raises(FailedExecution):
+            getters.get_forcemerge_tasks(client)
+
+
+class TestGetIndexUuids(TestCase):
+    """TestGetIndexUuids
+
+    Test helpers.getters.get_index_uuids functionality.
+    """
+
+    def test_return_data(self):
+        """test_return_data
+
+        Should return the UUID of each named index that exists
+        """
+        client = Mock()
+        client.indices.get_settings.return_value = {
+            'index-2': {'settings': {'index': {'uuid': 'abc'}}}
+        }
+        assert {'index-2': 'abc'} == getters.get_index_uuids(
+            client, ['index-1', 'index-2']
+        )
+
+
+class TestGetMaxSeqNos(TestCase):
+    """TestGetMaxSeqNos
+
+    Test helpers.getters.get_max_seq_nos functionality.
+    """
+
+    def test_return_data(self):
+        """test_return_data
+
+        Should return the UUID and the highest max_seq_no of each shard
+        """
+        client = Mock()
+        client.indices.stats.return_value = {
+            'indices': {
+                'index1': {
+                    'uuid': 'u1',
+                    'shards': {
+                        '0': [
+                            {'seq_no': {'max_seq_no': 10}},
+                            {'seq_no': {'max_seq_no': 9}},
+                        ],
+                        '1': [{'seq_no': {'max_seq_no': 4}}],
+                    },
+                }
+            }
+        }
+        assert {
+            'index1': {'uuid': 'u1', 'shards': {'0': 10, '1': 4}}
+        } == getters.get_max_seq_nos(client, ['index1', 'closed'])
+        kwargs = client.indices.stats.call_args.kwargs
+        assert kwargs['level'] == 'shards'
+        assert kwargs['index'] == 'closed,index1'
+
+
+class TestGetSnapshotIndexSizes(TestCase):
+    """TestGetSnapshotIndexSizes
+
+    Test helpers.getters.get_snapshot_index_sizes functionality.
+    """
+
+    def test_return_data(self):
+        """test_return_data
+
+        Should return the size in bytes of each index in the snapshot
+        """
+        client = Mock()
+        client.snapshot.get.return_value = {
+            'snapshots': [
+                {
+                    'index_details': {
+                        'index-1': {'size_in_bytes': 100},
+                        'index-2': {'size_in_bytes': 200},
+                    }
+                }
+            ]
+        }
+        assert {'index-1': 100, 'index-2': 200} == getters.get_snapshot_index_sizes(
+            client, repository=REPO_NAME, snapshot=SNAP_NAME
+        )
+        assert client.snapshot.get.call_args.kwargs['index_details'] is True
+
+    def test_missing_arg(self):
+        """test_missing_arg
+
+        Should raise an exception if repository is missing
+        """
+        client = Mock()
+        with pytest.raises(MissingArgument):
+            getters.get_snapshot_index_sizes(client, repository='', snapshot=SNAP_NAME)
+
+
+class TestGetSnapshotStates(TestCase):
+    """TestGetSnapshotStates
+
+    Test helpers.getters.get_snapshot_states functionality.
+    """
+
+    def test_return_data(self):
+        """test_return_data
+
+        Should return the state of each snapshot, from a single request
+        """
+        client = Mock()
+        client.snapshot.get.return_value = {
+            'snapshots': [
+                {'snapshot': 'snap-1', 'state': 'SUCCESS'},
+                {'snapshot': 'snap-2', 'state': 'IN_PROGRESS'},
+            ]
+        }
+        assert {'snap-1': 'SUCCESS', 'snap-2': 'IN_PROGRESS'} == (
+            getters.get_snapshot_states(
+                client, repository=REPO_NAME, snapshots=['snap-1', 'snap-2']
+            )
+        )
+        kwargs = client.snapshot.get.call_args.kwargs
+        assert kwargs['snapshot'] == 'snap-1,snap-2'
+        assert kwargs['filter_path'] == 'snapshots.snapshot,snapshots.state'
+
+
+class TestGetSnapshotProgress(TestCase):
+    """TestGetSnapshotProgress
+
+    Test helpers.getters.get_snapshot_progress functionality.
+    """
+
+    def test_return_data(self):
+        """test_return_data
+
+        Should return the shard and incremental byte counts
+        """
+        client = Mock()
+        client.snapshot.status.return_value = {
+            'snapshots': [
+                {
+                    'shards_stats': {'done': 3, 'total': 10},
+                    'stats': {
+                        'processed': {'size_in_bytes': 300},
+                        'incremental': {'size_in_bytes': 1000},
+                        'total': {'size_in_bytes': 5000},
+                        'time_in_millis': 6000,
+                    },
+                }
+            ]
+        }
+        assert {
+            'shards_done': 3,
+            'shards_total': 10,
+            'bytes_done': 300,
+            'bytes_total': 1000,
+            'time_in_millis': 6000,
+        } == getters.get_snapshot_progress(
+            client, repository=REPO_NAME, snapshot=SNAP_NAME
+        )
+
+    def test_no_status(self):
+        """test_no_status
+
+        Should return an empty dict when there is no status
+        """
+        client = Mock()
+        client.snapshot.status.return_value = {}
+        assert not getters.get_snapshot_progress(client, repository=REPO_NAME)
+
+
+class TestGetRepositoryUuid(TestCase):
+    """TestGetRepositoryUuid
+
+    Test helpers.getters.get_repository_uuid functionality.
+    """
+
+    def test_return_data(self):
+        """test_return_data
+
+        Output should match expected
+        """
+        client = Mock()
+        client.cluster.state.return_value = {
+            'metadata': {'repositories': {REPO_NAME: {'uuid': 'abc123'}}}
+        }
+        assert 'abc123' == getters.get_repository_uuid(client, repository=REPO_NAME)
+
+    def test_unknown(self):
+        """test_unknown
+
+        Should return None if the UUID is missing or not yet assigned
+        """
+        client = Mock()
+        client.cluster.state.return_value = {}
+        assert getters.get_repository_uuid(client, repository=REPO_NAME) is None
+        client.cluster.state.return_value = {
+            'metadata': {'repositories': {REPO_NAME: {'uuid': '_na_'}}}
+        }
+        assert getters.get_repository_uuid(client, repository=REPO_NAME) is None
+
 
 class TestNodeRoles(TestCase):
     """TestNodeRoles
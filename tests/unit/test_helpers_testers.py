@@ -142,7 +142,9 @@ class TestSnapshotRunning(TestCase):
         Should return ``True`` when a snapshot is in progress/running.
         """
         client = Mock()
-        client.snapshot.status.return_value = {'snapshots': ['running']}
+        client.cluster.state.return_value = {
+            'snapshots': {'snapshots': [{'snapshot': 'running'}]}
+        }
         # self.assertTrue(snapshot_running(client))
         assert snapshot_running(client)
 
@@ -152,9 +154,12 @@ class TestSnapshotRunning(TestCase):
         Should return ``False`` when a snapshot is not in progress/running.
         """
         client = Mock()
-        client.snapshot.status.return_value = {'snapshots': []}
+        client.cluster.state.return_value = {}
         # self.assertFalse(snapshot_running(client))
         assert not snapshot_running(client)
+        client.cluster.state.assert_called_once_with(
+            metric='customs', filter_path='snapshots.snapshots.snapshot'
+        )
 
     def test_raises_exception(self):
         """test_raises_exception
@@ -162,8 +167,8 @@ class TestSnapshotRunning(TestCase):
         Should raise a ``FailedExecution`` exception when an exception happens upstream
         """
         client = Mock()
-        client.snapshot.status.return_value = {'snapshots': []}
-        client.snapshot.status.side_effect = FAKE_FAIL
+        client.cluster.state.return_value = {}
+        client.cluster.state.side_effect = FAKE_FAIL
         # self.assertRaises(FailedExecution, snapshot_running, client)
         with pytest.raises(FailedExecution, match=r'Rerun with loglevel DEBUG'):
             snapshot_running(client)
@@ -8,11 +8,14 @@ from unittest.mock import Mock
 # from curator.exceptions import MissingArgument
 from curator.indexlist import IndexList
 from curator.helpers.utils import (
+    batch_by_size,
     chunk_index_list,
+    partition_by_size,
     show_dry_run,
     to_csv,
     multitarget_fix,
     multitarget_match,
+    compile_multitarget,
 )
 from . import testvars
 
@@ -75,6 +78,57 @@ class TestChunkIndexList(TestCase):
         assert 1 == len(chunk_index_list(['short', 'list', 'of', 'indices']))
 
 
+class TestBatchBySize(TestCase):
+    """TestBatchBySize
+
+    Test helpers.utils.batch_by_size functionality.
+    """
+
+    def test_by_count(self):
+        """test_by_count
+
+        Should split the sorted keys into batches of at most max_count
+        """
+        sizes = {'c': 1, 'a': 1, 'b': 1, 'd': 1, 'e': 1}
+        assert [['a', 'b'], ['c', 'd'], ['e']] == batch_by_size(sizes, max_count=2)
+
+    def test_by_size(self):
+        """test_by_size
+
+        Should end a batch before it exceeds max_size, and put an oversized key in
+        a batch by itself
+        """
+        sizes = {'a': 4, 'b': 5, 'c': 12, 'd': 3, 'e': 3}
+        assert [['a', 'b'], ['c'], ['d', 'e']] == batch_by_size(sizes, max_size=10)
+        assert [['a'], ['b'], ['c'], ['d', 'e']] == batch_by_size(
+            sizes, max_count=2, max_size=8
+        )
+
+
+class TestPartitionBySize(TestCase):
+    """TestPartitionBySize
+
+    Test helpers.utils.partition_by_size functionality.
+    """
+
+    def test_balanced(self):
+        """test_balanced
+
+        Should put the largest item alone, and group the smaller ones
+        """
+        sizes = {'a': 10, 'b': 6, 'c': 4, 'd': 3, 'e': 1}
+        groups = partition_by_size(sizes, 2)
+        assert [['a', 'd'], ['b', 'c', 'e']] == groups
+        assert [13, 11] == [sum(sizes[key] for key in group) for group in groups]
+
+    def test_fewer_items_than_groups(self):
+        """test_fewer_items_than_groups
+
+        Should not return empty groups
+        """
+        assert [['a'], ['b']] == partition_by_size({'a': 1, 'b': 1}, 5)
+
+
 class TestToCSV(TestCase):
     """TestToCSV
 
@@ -196,3 +250,29 @@ class TestMultiTarget(TestCase):
         that contains a wildcard
         """
         assert ['index2', 'not-index2'] == multitarget_match('*2', self.COMPLEX)
+
+    def test_multitarget_match_hidden_and_prefix(self):
+        """test_multitarget_match_hidden_and_prefix
+
+        Should treat ``.`` as a literal, and match elements from the start of the
+        index name only
+        """
+        indices = ['.hidden', 'xhidden', 'index10', 'index1', 'not-index10']
+        assert ['.hidden', 'index1', 'index10'] == multitarget_match(
+            '.hidden,index1', indices
+        )
+        assert ['index1'] == multitarget_match('index*,-index10', indices)
+
+    def test_compile_multitarget_cached(self):
+        """test_compile_multitarget_cached
+
+        Should compile each pattern once, keeping plain names out of the regex,
+        and return the same result on later calls
+        """
+        includes, excludes = compile_multitarget('index1,.hidden,-*2')
+        assert compile_multitarget('index1,.hidden,-*2') is compile_multitarget(
+            'index1,.hidden,-*2'
+        )
+        assert (frozenset(['index1', '.hidden']), (6, 7), None) == includes
+        assert not excludes[0]
+        assert excludes[2].match('not-index2')
@@ -1,7 +1,7 @@
 """Unit tests for utils"""
 
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import pytest
 from curator.exceptions import (
     ActionTimeout,
@@ -10,6 +10,7 @@ from curator.exceptions import (
     MissingArgument,
 )
 from curator.helpers.waiters import (
+    PendingTasksPacer,
     health_check,
     restore_check,
     snapshot_check,
@@ -86,6 +87,98 @@ class TestHealthCheck(TestCase):
             health_check(client, foo='bar')
 
 
+class TestPendingTasksPacer(TestCase):
+    """TestPendingTasksPacer
+
+    Test helpers.waiters.PendingTasksPacer functionality
+    """
+
+    def queue(self, *counts):
+        """Return a client whose pending task queue has each of ``counts`` in turn"""
+        client = Mock()
+        client.cluster.health.side_effect = [
+            {'number_of_pending_tasks': c, 'task_max_waiting_in_queue_millis': 500}
+            for c in counts
+        ]
+        return client
+
+    def test_disabled(self):
+        """test_disabled
+
+        Should not check the pending task queue if ``max_pending_tasks`` is ``0``
+        """
+        client = Mock()
+        with patch('curator.helpers.waiters.sleep') as mock_sleep:
+            PendingTasksPacer(client).wait()
+        client.cluster.health.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    def test_short_queue(self):
+        """test_short_queue
+
+        Should not wait at all while the queue is shorter than ``max_pending_tasks``
+        """
+        pacer = PendingTasksPacer(self.queue(3), max_pending_tasks=10)
+        with patch('curator.helpers.waiters.sleep') as mock_sleep:
+            pacer.wait()
+        mock_sleep.assert_not_called()
+        assert pacer.delay == 0
+
+    def test_back_off(self):
+        """test_back_off
+
+        Should double the delay while the queue is too long, then halve it once the
+        queue drains
+        """
+        pacer = PendingTasksPacer(self.queue(10, 12, 15, 2), max_pending_tasks=10)
+        with patch('curator.helpers.waiters.sleep') as mock_sleep:
+            pacer.wait()
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        assert waits == [1, 2, 4, 2]
+        assert pacer.delay == 2
+
+    def test_speed_up(self):
+        """test_speed_up
+
+        Should halve the delay for each request, down to none at all
+        """
+        pacer = PendingTasksPacer(self.queue(0, 0, 0), max_pending_tasks=10)
+        pacer.delay = 4
+        with patch('curator.helpers.waiters.sleep') as mock_sleep:
+            for _ in range(3):
+                pacer.wait()
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        assert waits == [2, 1]
+        assert pacer.delay == 0
+
+    def test_oldest_task(self):
+        """test_oldest_task
+
+        Should wait at least as long as the oldest pending task has been waiting
+        """
+        client = Mock()
+        client.cluster.health.side_effect = [
+            {'number_of_pending_tasks': 20, 'task_max_waiting_in_queue_millis': 8000},
+            {'number_of_pending_tasks': 0, 'task_max_waiting_in_queue_millis': 0},
+        ]
+        pacer = PendingTasksPacer(client, max_pending_tasks=10)
+        with patch('curator.helpers.waiters.sleep') as mock_sleep:
+            pacer.wait()
+        assert mock_sleep.call_args_list[0].args[0] == 8
+
+    def test_health_failure(self):
+        """test_health_failure
+
+        Should let the request through if the queue cannot be checked
+        """
+        client = Mock()
+        client.cluster.health.side_effect = FAKE_FAIL
+        pacer = PendingTasksPacer(client, max_pending_tasks=10)
+        with patch('curator.helpers.waiters.sleep') as mock_sleep:
+            pacer.wait()
+        mock_sleep.assert_not_called()
+
+
 class TestRestoreCheck(TestCase):
     """TestRestoreCheck
 
@@ -105,7 +198,7 @@ class TestRestoreCheck(TestCase):
         with pytest.raises(
             CuratorException, match=r'Unable to obtain recovery information'
         ):
-            restore_check(client, [])
+            restore_check(client, self.NAMED_INDICES)
 
     def test_incomplete_recovery(self):
         """test_incomplete_recovery
@@ -142,6 +235,43 @@ class TestRestoreCheck(TestCase):
         client.indices.recovery.return_value = {}
         assert not restore_check(client, self.NAMED_INDICES)
 
+    def test_done_indices_not_polled_again(self):
+        """test_done_indices_not_polled_again
+
+        Should only request active recoveries, confirm the others, and leave
+        indices that are done out of later calls with the same state
+        """
+        client = Mock()
+        client.indices.recovery.side_effect = [
+            # Active recoveries
+            {'index-2015.02.01': {'shards': [{'stage': 'INDEX'}]}},
+            # The rest
+            {
+                'index-2015.01.01': {
+                    'shards': [
+                        {'stage': 'DONE', 'index': {'size': {'recovered_in_bytes': 5}}}
+                    ]
+                }
+            },
+            # Second poll, active recoveries
+            {},
+            # Second poll, the rest
+            {'index-2015.02.01': {'shards': [{'stage': 'DONE'}]}},
+        ]
+        state = {}
+        assert not restore_check(client, self.NAMED_INDICES, state=state)
+        assert {'index-2015.01.01'} == state['done']
+        assert 5 == state['done_bytes']
+        first = client.indices.recovery.call_args_list[0].kwargs
+        assert first['active_only'] is True
+        assert first['filter_path'] == (
+            '*.shards.stage,*.shards.index.size.recovered_in_bytes'
+        )
+        assert restore_check(client, self.NAMED_INDICES, state=state)
+        assert ['index-2015.02.01'] == (
+            client.indices.recovery.call_args_list[2].kwargs['index']
+        )
+
 
 class TestSnapshotCheck(TestCase):
     """TestSnapshotCheck
@@ -253,6 +383,78 @@ class TestSnapshotCheck(TestCase):
         client.snapshot.get.return_value = test_val
         assert snapshot_check(client, repository='foo', snapshot=self.SNAP_NAME)
 
+    def test_not_found(self):
+        """test_not_found
+
+        Should raise ``CuratorException`` when the snapshot is not found.
+        """
+        client = Mock()
+        client.snapshot.get.return_value = {}
+        self.assertRaises(
+            CuratorException,
+            snapshot_check,
+            client,
+            repository='foo',
+            snapshot=self.SNAP_NAME,
+        )
+
+    def test_in_progress_with_progress(self):
+        """test_in_progress_with_progress
+
+        Should log the progress of the snapshot when ``progress`` is ``True``.
+        """
+        client = Mock()
+        client.snapshot.get.return_value = {'snapshots': [{'state': 'IN_PROGRESS'}]}
+        client.snapshot.status.return_value = {
+            'snapshots': [
+                {
+                    'shards_stats': {'done': 1, 'total': 4},
+                    'stats': {
+                        'processed': {'size_in_bytes': 1024},
+                        'incremental': {'size_in_bytes': 4096},
+                        'time_in_millis': 10000,
+                    },
+                }
+            ]
+        }
+        with self.assertLogs('curator.helpers.waiters', level='INFO') as logs:
+            assert not snapshot_check(
+                client, repository='foo', snapshot=self.SNAP_NAME, progress=True
+            )
+        assert 'about 30 seconds left' in logs.output[0]
+        # Without progress, the status API is not called
+        snapshot_check(client, repository='foo', snapshot=self.SNAP_NAME)
+        assert client.snapshot.status.call_count == 1
+
+    def test_many_snapshots(self):
+        """test_many_snapshots
+
+        Should check all snapshots with one request, and return ``False`` until
+        all of them are complete.
+        """
+        client = Mock()
+        client.snapshot.get.return_value = {
+            'snapshots': [
+                {'snapshot': 'snap-1', 'state': 'SUCCESS'},
+                {'snapshot': 'snap-2', 'state': 'IN_PROGRESS'},
+            ]
+        }
+        snaps = ['snap-1', 'snap-2']
+        assert not snapshot_check(client, repository='foo', snapshot=snaps)
+        client.snapshot.get.return_value['snapshots'][1]['state'] = 'PARTIAL'
+        assert snapshot_check(client, repository='foo', snapshot=snaps)
+        assert client.snapshot.get.call_args.kwargs['snapshot'] == 'snap-1,snap-2'
+
+    def test_one_snapshot_list(self):
+        """test_one_snapshot_list
+
+        Should accept a list of one snapshot name, as well as a single name.
+        """
+        client = Mock()
+        client.snapshot.get.return_value = {'snapshots': [{'state': 'SUCCESS'}]}
+        assert snapshot_check(client, repository='foo', snapshot=[self.SNAP_NAME])
+        assert client.snapshot.get.call_args.kwargs['snapshot'] == self.SNAP_NAME
+
 
 class TestTaskCheck(TestCase):
     """TestTaskCheck
@@ -64,8 +64,8 @@ repo_name      = 'repo_name'
 test_repo      = {repo_name: {'type': 'fs', 'settings': {'compress': 'true', 'location': '/tmp/repos/repo_name'}}}
 test_repos     = {'TESTING': {'type': 'fs', 'settings': {'compress': 'true', 'location': '/tmp/repos/TESTING'}},
                   repo_name: {'type': 'fs', 'settings': {'compress': 'true', 'location': '/rmp/repos/repo_name'}}}
-snap_running   = { 'snapshots': ['running'] }
-nosnap_running = { 'snapshots': [] }
+snap_running   = { 'snapshots': {'snapshots': [{'snapshot': 'running'}]} }
+nosnap_running = {}
 snapshot       = { 'snapshots': [
                     {
                         'duration_in_millis': 60000, 'start_time': '2015-02-01T00:00:00.000Z',
@@ -257,6 +257,36 @@ settings_two  = {
     }
 }
 
+settings_two_dates = {
+    'index-2016.03.03': {
+        'aliases': ['my_alias'],
+        'mappings': {},
+        'settings': {
+            'index': {
+                'number_of_replicas': '1', 'uuid': 'random_uuid_string_here',
+                'number_of_shards': '5', 'creation_date': '1456963200172',
+                'lifecycle': {'origination_date': '1420070400000'},
+                'version': {'created': '2020099'}, 'refresh_interval': '5s'
+            }
+        }
+    },
+    'index-2016.03.04': {
+        'aliases': ['my_alias'],
+        'mappings': {},
+        'settings': {
+            'index': {
+                'number_of_replicas': '1', 'uuid': 'another_random_uuid_string',
+                'number_of_shards': '5', 'creation_date': '1457049600812',
+                'time_series': {
+                    'start_time': '2016-03-04T00:00:00.000Z',
+                    'end_time': '2016-03-05T00:00:00.000Z',
+                },
+                'version': {'created': '2020099'}, 'refresh_interval': '5s'
+            }
+        }
+    }
+}
+
 settings_2_get_aliases = {
     "index-2016.03.03": { "aliases" : { 'my_alias' : { } } },
     "index-2016.03.04": { "aliases" : { 'my_alias' : { } } },